@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Iterable, Iterator, List, Union
 
 from monitoring_client.core.logger import get_logger, log_phase
 
@@ -11,6 +12,15 @@ logger = get_logger(__name__)
 # Définition du type Metric
 Metric = Dict[str, Any]
 
+# Types acceptés -> chaîne canonique : toutes les métriques normalisées partagent
+# le même objet str, même si le type provient d'une chaîne décodée (JSON, YAML...)
+_METRIC_TYPES: Dict[str, str] = {t: sys.intern(t) for t in ("numeric", "boolean", "string")}
+
+# Chaînes converties en booléen lors de la normalisation (après strip/lower)
+_BOOL_TRUE = frozenset(("true", "1", "yes", "on"))
+_BOOL_FALSE = frozenset(("false", "0", "no", "off"))
+
+
 class BaseCollector(ABC):
     """
     Classe de base pour tous les collecteurs. Elle définit les attributs `name` et `editor`
@@ -19,12 +29,31 @@ class BaseCollector(ABC):
 
     Contrat :
       - collect() : méthode publique, robuste (ne doit jamais lever d'exception)
-      - _collect_metrics() : méthode à implémenter, peut lever des exceptions internes
+      - _collect_metrics() : méthode à implémenter, peut lever des exceptions internes ;
+        renvoie une liste ou un générateur (métriques projetées au fil de l'eau,
+        sans liste intermédiaire de métriques brutes)
     """
 
     # Attributs partagés entre tous les collecteurs
     name: str = "base"  # Identifiant logique du collecteur
     editor: str = "builtin"  # Type de collecteur (ex: "builtin", "custom")
+    trusted: bool = False
+    """
+    À passer à True dans un collecteur dont _collect_metrics() construit déjà des
+    métriques bien typées (name str non vide, type valide, value cohérente avec le
+    type). collect() saute alors _normalize_metric et ne fait que la projection
+    (_project_trusted_metrics) : le résultat doit être identique à celui de la
+    normalisation complète.
+    """
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # name / editor sont recopiés dans chaque métrique : une seule instance
+        # internée par collecteur, y compris pour des noms construits dynamiquement
+        for attr in ("name", "editor"):
+            value = cls.__dict__.get(attr)
+            if type(value) is str:
+                setattr(cls, attr, sys.intern(value))
 
     def collect(self) -> List[Metric]:
         """
@@ -32,26 +61,33 @@ class BaseCollector(ABC):
         à _collect_metrics(), gère les exceptions et garantit un retour de type list[dict].
         """
         phase_name = f"collector.{self.name}"
-        log_phase(logger, phase_name, f"Exécution du collecteur '{self.name}'")
+        log_phase(logger, phase_name, "Exécution du collecteur '%s'", self.name)
 
         try:
             # Appel de la méthode _collect_metrics() qui collecte les métriques spécifiques
             metrics = self._collect_metrics()
-            if not isinstance(metrics, list):
+            streamed = isinstance(metrics, Iterator)
+            if not streamed and not isinstance(metrics, list):
                 logger.error(
-                    "Le collecteur '%s' a renvoyé un type invalide (%s), liste attendue.",
+                    "Le collecteur '%s' a renvoyé un type invalide (%s), liste ou générateur attendu.",
                     self.name,
                     type(metrics),
                 )
                 return []
 
-            # Normalisation des métriques avant de les retourner
-            normalized: List[Metric] = []
-            for metric in metrics:
-                norm = self._normalize_metric(metric)
-                if norm is not None:
-                    normalized.append(norm)
-
+            if self.trusted:
+                normalized = self._project_trusted_metrics(metrics)
+            else:
+                # Normalisation des métriques avant de les retourner
+                normalized = []
+                for metric in metrics:
+                    norm = self._normalize_metric(metric)
+                    if norm is not None:
+                        normalized.append(norm)
+
+            if streamed:
+                # Un générateur ne connaît pas son total : compte fait ici
+                logger.info("Collecteur '%s' : %d métriques collectées.", self.name, len(normalized))
             return normalized
         except Exception as exc:
             logger.error(
@@ -63,15 +99,33 @@ class BaseCollector(ABC):
             return []
 
     @abstractmethod
-    def _collect_metrics(self) -> List[Metric]:
+    def _collect_metrics(self) -> Union[List[Metric], Iterator[Metric]]:
         """
         Méthode à implémenter dans chaque collecteur spécifique. Elle doit retourner une liste de
-        métriques brutes sous forme de dictionnaires.
+        métriques brutes sous forme de dictionnaires, ou un générateur qui les produit.
         """
         raise NotImplementedError
 
     # ---- Helpers de normalisation ----
 
+    def _project_trusted_metrics(self, metrics: Iterable[Metric]) -> List[Metric]:
+        """
+        Chemin rapide pour les collecteurs `trusted` : aucune re-validation,
+        seule la projection vers le format final (mêmes clés que _normalize_metric).
+        """
+        collector_name = self.__class__.__name__
+        editor_name = self.editor
+        return [
+            {
+                "name": metric["name"],
+                "value": metric["value"],
+                "type": metric["type"],
+                "collector_name": collector_name,
+                "editor_name": editor_name,
+            }
+            for metric in metrics
+        ]
+
     def _normalize_metric(self, metric: Dict[str, Any]) -> Union[Metric, None]:
         """
         Normalise une métrique brute en appliquant des règles simples :
@@ -91,7 +145,8 @@ class BaseCollector(ABC):
             logger.warning("Métrique ignorée (name invalide): %r", metric)
             return None
 
-        if m_type not in ("numeric", "boolean", "string"):
+        m_type = _METRIC_TYPES.get(m_type) if isinstance(m_type, str) else None
+        if m_type is None:
             logger.warning("Métrique ignorée (type invalide): %r", metric)
             return None
 
@@ -110,9 +165,9 @@ class BaseCollector(ABC):
             if not isinstance(value, bool):
                 if isinstance(value, str):
                     lower = value.strip().lower()
-                    if lower in ("true", "1", "yes", "on"):
+                    if lower in _BOOL_TRUE:
                         value = True
-                    elif lower in ("false", "0", "no", "off"):
+                    elif lower in _BOOL_FALSE:
                         value = False
                     else:
                         logger.warning("Métrique boolean non convertible, ignorée: %r", metric)
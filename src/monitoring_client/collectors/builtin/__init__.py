@@ -1,14 +1,25 @@
+import importlib
+from typing import Any, List
+
 from monitoring_client.collectors.base_collector import BaseCollector, Metric  # ← Deux points pour remonter d'un niveau
-from monitoring_client.collectors.builtin.databases import DatabasesCollector
-from monitoring_client.collectors.builtin.docker import DockerCollector
-from monitoring_client.collectors.builtin.firewall import FirewallCollector
-from monitoring_client.collectors.builtin.log_anomalies import LogAnomaliesCollector
-from monitoring_client.collectors.builtin.network import NetworkCollector
-from monitoring_client.collectors.builtin.scheduled_tasks import ScheduledTasksCollector
-from monitoring_client.collectors.builtin.security import SecurityCollector
-from monitoring_client.collectors.builtin.services import ServicesCollector
-from monitoring_client.collectors.builtin.system import SystemCollector
-from monitoring_client.collectors.builtin.updates import PackageUpdatesCollector
+
+# Import paresseux (PEP 562) : chaque module de collecteur (et ses dépendances :
+# psutil, subprocess...) n'est importé qu'au premier accès à sa classe.
+# Aucun collecteur ne doit donc compter sur un état pris à l'import (ex : le
+# premier échantillon de psutil.cpu_percent) : SystemCollector mesure le CPU
+# sur un intervalle explicite.
+_LAZY_COLLECTORS = {
+    'SystemCollector': 'monitoring_client.collectors.builtin.system',
+    'NetworkCollector': 'monitoring_client.collectors.builtin.network',
+    'FirewallCollector': 'monitoring_client.collectors.builtin.firewall',
+    'PackageUpdatesCollector': 'monitoring_client.collectors.builtin.updates',
+    'ServicesCollector': 'monitoring_client.collectors.builtin.services',
+    'SecurityCollector': 'monitoring_client.collectors.builtin.security',
+    'ScheduledTasksCollector': 'monitoring_client.collectors.builtin.scheduled_tasks',
+    'LogAnomaliesCollector': 'monitoring_client.collectors.builtin.log_anomalies',
+    'DockerCollector': 'monitoring_client.collectors.builtin.docker',
+    'DatabasesCollector': 'monitoring_client.collectors.builtin.databases',
+}
 
 __all__ = [
     'BaseCollector',
@@ -24,3 +35,16 @@ __all__ = [
     'DockerCollector',
     'DatabasesCollector',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_COLLECTORS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value  # Accès suivants : lookup direct, sans __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
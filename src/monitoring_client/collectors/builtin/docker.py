@@ -1,22 +1,109 @@
+import http.client
+import json
 import logging
 import os
+import shutil
+import socket
 import subprocess
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 from monitoring_client.collectors.base_collector import BaseCollector
+from monitoring_client.core.utils import iter_command_lines, ttl_cached
 
 # Configuration du logger
 logger = logging.getLogger(__name__)
 
+# États listés par "docker ps" (sans -a)
+_UP_STATES = frozenset(("running", "paused", "restarting"))
+
+# Socket de l'API Docker Engine (évite un fork/exec du CLI par requête)
+_DOCKER_SOCKET = "/var/run/docker.sock"
+_DOCKER_API_TIMEOUT = 5.0
+
+# Dernier état connu du démon : évite de re-sonder (ping / docker info) à chaque cycle
+_DAEMON_STATE_TTL = 30.0
+_DAEMON_CACHE: Dict[str, Any] = {"ts": 0.0, "running": False}
+
+# (total conteneurs, conteneurs up, conteneurs en pause, images)
+DockerCounts = Tuple[int, int, int, int]
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """Connexion HTTP/1.1 sur socket UNIX (API Docker Engine)."""
+
+    def __init__(self, socket_path: str, timeout: float) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self._socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+def _api_get(conn: _UnixHTTPConnection, path: str) -> bytes:
+    """GET sur l'API Docker ; lève OSError si le statut HTTP n'est pas 200."""
+    conn.request("GET", path)
+    response = conn.getresponse()
+    body = response.read()
+    if response.status != 200:
+        raise OSError(f"API Docker {path} : HTTP {response.status}")
+    return body
+
+
+@ttl_cached(300)
+def _find_docker_binary() -> Optional[str]:
+    """Chemin exécutable du CLI docker résolu via le PATH (/usr/local/bin, /snap/bin...), sinon None."""
+    return shutil.which("docker")
+
+
+def _cached_daemon_state() -> Optional[bool]:
+    """État du démon mémorisé il y a moins de _DAEMON_STATE_TTL secondes, sinon None."""
+    if time.monotonic() - _DAEMON_CACHE["ts"] < _DAEMON_STATE_TTL:
+        return _DAEMON_CACHE["running"]
+    return None
+
+
+def _remember_daemon_state(running: bool) -> None:
+    _DAEMON_CACHE["ts"] = time.monotonic()
+    _DAEMON_CACHE["running"] = running
+
+
+def _count_states(states: Iterable[str]) -> Tuple[int, int, int]:
+    """Compte (total, up, paused) à partir des états de conteneurs."""
+    total = 0
+    up = 0
+    paused = 0
+    for state in states:
+        total += 1
+        # Comme "docker ps" sans -a : les conteneurs en pause / redémarrage sont "up"
+        if state in _UP_STATES:
+            up += 1
+        if state == "paused":
+            paused += 1
+    return total, up, paused
+
+
 class DockerCollector(BaseCollector):
     """
     Collecte des métriques Docker si disponible :
     - présence du binaire docker
     - démon en cours d'exécution
     - nombre de conteneurs / images
+
+    Interroge directement l'API Docker Engine sur /var/run/docker.sock ;
+    repli sur le CLI docker si le socket est absent ou inaccessible.
     """
 
     name = "docker"  # Nom du collecteur
     editor = "builtin"  # Type de collecteur
+    trusted = True
 
     def _collect_metrics(self):
         """
@@ -26,23 +113,19 @@ class DockerCollector(BaseCollector):
         metrics = []
 
         # Vérification de la présence du binaire Docker
-        docker_bin = "/usr/bin/docker"
-        if not os.path.exists(docker_bin):
+        docker_bin = _find_docker_binary()
+        if not docker_bin:
             return metrics  # Si Docker n'est pas installé, on retourne les métriques vides
 
-        docker_running = False
-        try:
-            # Vérification du statut du démon Docker
-            result = subprocess.run(
-                [docker_bin, "info"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                universal_newlines=True,
-                check=False,
-            )
-            docker_running = result.returncode == 0
-        except Exception as exc:  # Si une erreur se produit
-            logger.warning("Erreur lors de l'exécution de 'docker info' : %s", exc)
+        known_state = _cached_daemon_state()
+        if known_state is False:
+            # Démon arrêté au dernier sondage récent : ni ping ni "docker info"
+            snapshot: Tuple[bool, Optional[DockerCounts]] = (False, None)
+        else:
+            api_snapshot = self._snapshot_via_api(skip_ping=known_state is True)
+            snapshot = api_snapshot if api_snapshot is not None else self._snapshot_via_cli(docker_bin)
+            _remember_daemon_state(snapshot[0])
+        docker_running, counts = snapshot
 
         # Statut du démon Docker
         metrics.append(
@@ -57,95 +140,122 @@ class DockerCollector(BaseCollector):
             }
         )
 
-        if not docker_running:
-            return metrics  # Si le démon Docker n'est pas en cours d'exécution, on retourne les métriques ici
+        if not docker_running or counts is None:
+            return metrics  # Démon arrêté ou comptage en échec : on retourne les métriques ici
+
+        total_containers, running_containers, paused_containers, total_images = counts
+
+        # Ajout des métriques collectées
+        metrics.extend(
+            [
+                {
+                    "name": "docker.containers_total",
+                    "value": int(total_containers),
+                    "type": "numeric",
+                    "description": "Nombre total de conteneurs Docker (y compris stoppés).",
+                    "is_critical": True,
+                    "collector_name": self.name,  # Nom du collecteur
+                    "editor_name": self.editor,  # Nom de l'éditeur
+                },
+                {
+                    "name": "docker.containers_running",
+                    "value": int(running_containers),
+                    "type": "numeric",
+                    "description": "Nombre de conteneurs Docker en cours d'exécution.",
+                    "is_critical": True,
+                    "collector_name": self.name,  # Nom du collecteur
+                    "editor_name": self.editor,  # Nom de l'éditeur
+                },
+                {
+                    "name": "docker.images_total",
+                    "value": int(total_images),
+                    "type": "numeric",
+                    "description": "Nombre total d'images Docker sur le système.",
+                    "is_critical": False,
+                    "collector_name": self.name,  # Nom du collecteur
+                    "editor_name": self.editor,  # Nom de l'éditeur
+                },
+                {
+                    "name": "docker.containers_paused",
+                    "value": int(paused_containers),
+                    "type": "numeric",
+                    "description": "Nombre de conteneurs Docker actuellement en pause.",
+                    "is_critical": False,
+                    "collector_name": self.name,  # Nom du collecteur
+                    "editor_name": self.editor,  # Nom de l'éditeur
+                },
+            ]
+        )
 
-        # Si le démon est en cours d'exécution, collecte des métriques supplémentaires
+        # Retour des métriques collectées
+        logger.info("Collecte terminée: %d métriques collectées.", len(metrics))
+        return metrics
+
+    # ---- Sources de données ----
+
+    @staticmethod
+    def _snapshot_via_api(skip_ping: bool = False) -> Optional[Tuple[bool, Optional[DockerCounts]]]:
+        """
+        Interroge l'API Docker Engine sur le socket UNIX (une seule connexion keep-alive).
+
+        skip_ping : le démon est connu actif (cache récent), on liste directement.
+
+        Retourne (démon actif, compteurs) ou None si le CLI doit prendre le relais
+        (socket absent, permissions, réponse inattendue).
+        """
+        if not os.path.exists(_DOCKER_SOCKET):
+            return None
+
+        conn = _UnixHTTPConnection(_DOCKER_SOCKET, timeout=_DOCKER_API_TIMEOUT)
         try:
-            # Nombre total de conteneurs Docker (y compris stoppés)
-            containers_result = subprocess.run(
-                [docker_bin, "ps", "-a", "--format", "{{.ID}}"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                universal_newlines=True,
-                check=False,
-            )
-            total_containers = len([l for l in containers_result.stdout.strip().split("\n") if l.strip()])
+            try:
+                if skip_ping:
+                    conn.connect()
+                else:
+                    _api_get(conn, "/_ping")
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Socket présent mais personne n'écoute : démon arrêté
+                return False, None
 
-            # Nombre de conteneurs Docker en cours d'exécution
-            running_result = subprocess.run(
-                [docker_bin, "ps", "--format", "{{.ID}}"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                universal_newlines=True,
-                check=False,
-            )
-            running_containers = len([l for l in running_result.stdout.strip().split("\n") if l.strip()])
+            containers = json.loads(_api_get(conn, "/containers/json?all=1"))
+            images = json.loads(_api_get(conn, "/images/json"))
+            total, up, paused = _count_states(c.get("State", "") for c in containers)
+            return True, (total, up, paused, len(images))
+        except Exception as exc:
+            logger.debug("API Docker indisponible (%s), repli sur le CLI : %s", _DOCKER_SOCKET, exc)
+            return None
+        finally:
+            conn.close()
 
-            # Nombre total d'images Docker sur le système
-            images_result = subprocess.run(
-                [docker_bin, "images", "--format", "{{.ID}}"],
-                stdout=subprocess.PIPE,
+    @staticmethod
+    def _snapshot_via_cli(docker_bin: str) -> Tuple[bool, Optional[DockerCounts]]:
+        """Même collecte via le CLI docker (info, ps -a, images)."""
+        docker_running = False
+        try:
+            # Vérification du statut du démon Docker
+            result = subprocess.run(
+                [docker_bin, "info"],
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
-                universal_newlines=True,
+                text=True,
                 check=False,
             )
-            total_images = len([l for l in images_result.stdout.strip().split("\n") if l.strip()])
+            docker_running = result.returncode == 0
+        except Exception as exc:  # Si une erreur se produit
+            logger.warning("Erreur lors de l'exécution de 'docker info' : %s", exc)
 
-            # Nombre de conteneurs Docker actuellement en pause
-            paused_result = subprocess.run(
-                [docker_bin, "ps", "--filter", "status=paused", "--format", "{{.ID}}"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                universal_newlines=True,
-                check=False,
-            )
-            paused_containers = len([l for l in paused_result.stdout.strip().split("\n") if l.strip()])
-
-            # Ajout des métriques collectées
-            metrics.extend(
-                [
-                    {
-                        "name": "docker.containers_total",
-                        "value": int(total_containers),
-                        "type": "numeric",
-                        "description": "Nombre total de conteneurs Docker (y compris stoppés).",
-                        "is_critical": True,
-                        "collector_name": self.name,  # Nom du collecteur
-                        "editor_name": self.editor,  # Nom de l'éditeur
-                    },
-                    {
-                        "name": "docker.containers_running",
-                        "value": int(running_containers),
-                        "type": "numeric",
-                        "description": "Nombre de conteneurs Docker en cours d'exécution.",
-                        "is_critical": True,
-                        "collector_name": self.name,  # Nom du collecteur
-                        "editor_name": self.editor,  # Nom de l'éditeur
-                    },
-                    {
-                        "name": "docker.images_total",
-                        "value": int(total_images),
-                        "type": "numeric",
-                        "description": "Nombre total d'images Docker sur le système.",
-                        "is_critical": False,
-                        "collector_name": self.name,  # Nom du collecteur
-                        "editor_name": self.editor,  # Nom de l'éditeur
-                    },
-                    {
-                        "name": "docker.containers_paused",
-                        "value": int(paused_containers),
-                        "type": "numeric",
-                        "description": "Nombre de conteneurs Docker actuellement en pause.",
-                        "is_critical": False,
-                        "collector_name": self.name,  # Nom du collecteur
-                        "editor_name": self.editor,  # Nom de l'éditeur
-                    },
-                ]
-            )
+        if not docker_running:
+            return False, None
+
+        try:
+            # Un seul passage "ps -a" : l'état de chaque conteneur suffit pour
+            # dériver total / running / paused (au lieu de trois appels séparés)
+            total, up, paused = _count_states(iter_command_lines([docker_bin, "ps", "-a", "--format", "{{.State}}"]))
+
+            # Nombre total d'images Docker sur le système
+            total_images = sum(1 for _ in iter_command_lines([docker_bin, "images", "--format", "{{.ID}}"]))
         except Exception as exc:  # Erreur lors de la collecte des métriques Docker
             logger.warning("Erreur lors de la collecte des métriques Docker : %s", exc)
+            return True, None
 
-        # Retour des métriques collectées
-        logger.info(f"Collecte terminée: {len(metrics)} métriques collectées.")
-        return metrics
+        return True, (total, up, paused, total_images)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from typing import Any, Dict, List
 
 import psutil
@@ -10,6 +11,67 @@ from monitoring_client.collectors.base_collector import BaseCollector, Metric
 # Configuration du logger
 logger = get_logger(__name__)
 
+# Interfaces virtuelles bruyantes ignorées (Docker bridges + veth pairs)
+_IGNORED_IFACE_PREFIXES = ("br-", "veth")
+
+_IS_LINUX = sys.platform.startswith("linux")
+
+# Colonnes de /proc/net/dev (après "iface:") -> champs équivalents de psutil
+_PROC_NET_DEV_FIELDS = (
+    ("bytes_recv", 0),
+    ("packets_recv", 1),
+    ("errin", 2),
+    ("dropin", 3),
+    ("bytes_sent", 8),
+    ("packets_sent", 9),
+    ("errout", 10),
+    ("dropout", 11),
+)
+
+# Compteurs IO exportés par interface (le nom du champ sert aussi de suffixe de métrique)
+_COUNTER_FIELDS = (
+    "bytes_sent",
+    "bytes_recv",
+    "packets_sent",
+    "packets_recv",
+    "errin",
+    "errout",
+    "dropin",
+    "dropout",
+)
+
+
+def _read_proc_net_dev() -> Dict[str, Dict[str, int]]:
+    """
+    Lit /proc/net/dev en une passe, en sautant les interfaces ignorées dès le parsing
+    (pas de namedtuple psutil construit pour des centaines de veth).
+    """
+    counters: Dict[str, Dict[str, int]] = {}
+    with open("/proc/net/dev", "r", encoding="ascii", errors="ignore") as f:
+        lines = f.read().splitlines()[2:]  # 2 lignes d'en-tête
+
+    for line in lines:
+        iface, sep, data = line.partition(":")
+        if not sep:
+            continue
+        iface = iface.strip()
+        if iface.startswith(_IGNORED_IFACE_PREFIXES):
+            continue
+        fields = data.split()
+        counters[iface] = {name: int(fields[idx]) for name, idx in _PROC_NET_DEV_FIELDS}
+    return counters
+
+
+def _io_counters() -> Dict[str, Dict[str, int]]:
+    """Compteurs IO par interface (lecture directe sous Linux, psutil ailleurs)."""
+    if _IS_LINUX:
+        try:
+            return _read_proc_net_dev()
+        except (OSError, ValueError, IndexError) as exc:
+            logger.debug("Lecture /proc/net/dev impossible, repli psutil: %s", exc)
+    return {iface: io._asdict() for iface, io in psutil.net_io_counters(pernic=True).items()}
+
+
 class NetworkCollector(BaseCollector):
     """
     Collecteur builtin pour les métriques réseau.
@@ -29,6 +91,7 @@ class NetworkCollector(BaseCollector):
 
     name = "network"  # Nom du collecteur
     editor = "builtin"  # Type de collecteur
+    trusted = True
 
     def _collect_metrics(self) -> List[Metric]:
         """
@@ -40,114 +103,54 @@ class NetworkCollector(BaseCollector):
         try:
             # Collecte des statistiques des interfaces réseau et des compteurs IO
             stats = psutil.net_if_stats()
-            counters = psutil.net_io_counters(pernic=True)
+            counters = _io_counters()
         except Exception as exc:
             logger.debug("Échec de la collecte réseau globale: %s", exc)
             return metrics
 
+        # Gabarits partagés (clés constantes) : dict.copy() est implémenté en C et
+        # plus rapide qu'un littéral à 5 clés reconstruit pour chaque métrique
+        numeric_template = {"type": "numeric", "collector_name": self.name, "editor_name": self.editor}
+        boolean_template = {"type": "boolean", "collector_name": self.name, "editor_name": self.editor}
+        append = metrics.append
+
         # Traitement de chaque interface
         for iface, stat in stats.items():
 
             # Ignorer les interfaces virtuelles bruyantes (Docker bridges + veth pairs)
-            if iface.startswith("br-") or iface.startswith("veth"):
+            if iface.startswith(_IGNORED_IFACE_PREFIXES):
                 continue
 
             try:
-                up = stat.isup
                 metric_prefix = f"network.{iface}"
 
                 # Statut de l'interface (up/down)
-                metrics.append(
-                    {
-                        "name": f"{metric_prefix}.up",
-                        "value": up,
-                        "type": "boolean",
-                        "collector_name": self.name,  # Nom du collecteur
-                        "editor_name": self.editor,  # Type de collecteur
-                    }
-                )
+                metric = boolean_template.copy()
+                metric["name"] = f"{metric_prefix}.up"
+                metric["value"] = stat.isup
+                append(metric)
 
                 # Vitesse de l'interface (si disponible)
                 if stat.speed is not None and stat.speed >= 0:
-                    metrics.append(
-                        {
-                            "name": f"{metric_prefix}.speed_mbps",
-                            "value": stat.speed,
-                            "type": "numeric",
-                            "collector_name": self.name,  # Nom du collecteur
-                            "editor_name": self.editor,  # Type de collecteur
-                        }
-                    )
+                    metric = numeric_template.copy()
+                    metric["name"] = f"{metric_prefix}.speed_mbps"
+                    metric["value"] = stat.speed
+                    append(metric)
 
                 # Collecte des compteurs IO (envoyés/reçus, erreurs, drops)
                 io = counters.get(iface)
                 if io is None:
                     continue
 
-                metrics.extend(
-                    [
-                        {
-                            "name": f"{metric_prefix}.bytes_sent",
-                            "value": io.bytes_sent,
-                            "type": "numeric",
-                            "collector_name": self.name,  # Nom du collecteur
-                            "editor_name": self.editor,  # Type de collecteur
-                        },
-                        {
-                            "name": f"{metric_prefix}.bytes_recv",
-                            "value": io.bytes_recv,
-                            "type": "numeric",
-                            "collector_name": self.name,  # Nom du collecteur
-                            "editor_name": self.editor,  # Type de collecteur
-                        },
-                        {
-                            "name": f"{metric_prefix}.packets_sent",
-                            "value": io.packets_sent,
-                            "type": "numeric",
-                            "collector_name": self.name,  # Nom du collecteur
-                            "editor_name": self.editor,  # Type de collecteur
-                        },
-                        {
-                            "name": f"{metric_prefix}.packets_recv",
-                            "value": io.packets_recv,
-                            "type": "numeric",
-                            "collector_name": self.name,  # Nom du collecteur
-                            "editor_name": self.editor,  # Type de collecteur
-                        },
-                        {
-                            "name": f"{metric_prefix}.errin",
-                            "value": io.errin,
-                            "type": "numeric",
-                            "collector_name": self.name,  # Nom du collecteur
-                            "editor_name": self.editor,  # Type de collecteur
-                        },
-                        {
-                            "name": f"{metric_prefix}.errout",
-                            "value": io.errout,
-                            "type": "numeric",
-                            "collector_name": self.name,  # Nom du collecteur
-                            "editor_name": self.editor,  # Type de collecteur
-                        },
-                        {
-                            "name": f"{metric_prefix}.dropin",
-                            "value": io.dropin,
-                            "type": "numeric",
-                            "collector_name": self.name,  # Nom du collecteur
-                            "editor_name": self.editor,  # Type de collecteur
-                        },
-                        {
-                            "name": f"{metric_prefix}.dropout",
-                            "value": io.dropout,
-                            "type": "numeric",
-                            "collector_name": self.name,  # Nom du collecteur
-                            "editor_name": self.editor,  # Type de collecteur
-                        },
-                    ]
-                )
+                for attr in _COUNTER_FIELDS:
+                    metric = numeric_template.copy()
+                    metric["name"] = f"{metric_prefix}.{attr}"
+                    metric["value"] = io[attr]
+                    append(metric)
 
             except Exception as exc:
                 logger.debug("Échec de la collecte réseau pour l'interface %s: %s", iface, exc)
 
         # Retour des métriques collectées
-        logger.info(f"Collecte terminée: {len(metrics)} métriques collectées.")
+        logger.info("Collecte terminée: %d métriques collectées.", len(metrics))
         return metrics
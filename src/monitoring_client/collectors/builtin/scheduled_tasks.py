@@ -3,10 +3,18 @@ import os
 import subprocess
 
 from monitoring_client.collectors.base_collector import BaseCollector
+from monitoring_client.core.utils import ttl_cached
 
 # Configuration du logger
 logger = logging.getLogger(__name__)
 
+
+@ttl_cached(60)
+def _path_exists(path: str) -> bool:
+    """Présence d'un chemin système (cron, anacron...) : quasi constante, re-sondée au plus toutes les 60 s."""
+    return os.path.exists(path)
+
+
 class ScheduledTasksCollector(BaseCollector):
     """
     Collecte des informations sur les tâches planifiées :
@@ -26,36 +34,36 @@ class ScheduledTasksCollector(BaseCollector):
         metrics = []
 
         # Vérification de la disponibilité de cron
-        cron_active = os.path.exists("/etc/cron.d") or os.path.exists("/var/spool/cron")
+        cron_active = _path_exists("/etc/cron.d") or _path_exists("/var/spool/cron")
 
         # Nombre de jobs cron (dans /etc/crontab uniquement, comme le prototype)
         cron_jobs = 0
-        if os.path.exists("/etc/crontab"):
+        if _path_exists("/etc/crontab"):
             try:
-                with open("/etc/crontab", "r", encoding="utf-8", errors="ignore") as f:
-                    cron_jobs = len(
-                        [line for line in f.readlines() if line.strip() and not line.lstrip().startswith("#")]
-                    )
+                # Lecture en binaire ligne à ligne : pas de décodage UTF-8 ni de liste
+                # intermédiaire, seuls "#" et les blancs (ASCII) sont examinés
+                with open("/etc/crontab", "rb") as f:
+                    cron_jobs = sum(1 for line in f if line.strip() and not line.lstrip().startswith(b"#"))
             except Exception as exc:
                 logger.warning("Erreur lors de la lecture de /etc/crontab : %s", exc)
 
         # Vérification de la disponibilité d'Anacron
-        anacron_active = os.path.exists("/usr/sbin/anacron")
+        anacron_active = _path_exists("/usr/sbin/anacron")
 
         # Nombre de timers systemd
         timers_count = 0
         try:
             result = subprocess.run(
-                ["systemctl", "list-timers", "--all", "--no-pager"],
+                # --no-legend : ni entête ni pied "N timers listed." => une ligne par timer
+                ["systemctl", "list-timers", "--all", "--no-pager", "--no-legend", "--plain"],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.DEVNULL,
                 universal_newlines=True,
+                # stdio redirigés, fds Python non héritables : close_fds inutile
+                close_fds=False,
                 check=False,
             )
-            lines = result.stdout.strip().splitlines()
-            # On ignore la première ligne d'entête si présente
-            if len(lines) > 1:
-                timers_count = len([l for l in lines[1:] if l.strip()])
+            timers_count = sum(1 for line in result.stdout.splitlines() if line.strip())
         except Exception as exc:
             logger.warning("Erreur lors de la récupération des timers systemd : %s", exc)
 
@@ -102,5 +110,5 @@ class ScheduledTasksCollector(BaseCollector):
         )
 
         # Retour des métriques collectées
-        logger.info(f"Collecte terminée: {len(metrics)} métriques collectées.")
+        logger.info("Collecte terminée: %d métriques collectées.", len(metrics))
         return metrics
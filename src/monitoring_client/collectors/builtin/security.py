@@ -1,13 +1,13 @@
 import logging
+import os
 import re
 import subprocess
 import time
-from pathlib import Path
-from typing import Any, Dict, List
-
-import psutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Set, Tuple
 
 from monitoring_client.collectors.base_collector import BaseCollector
+from monitoring_client.core.utils import ttl_cached
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +18,59 @@ EXCLUDED_PROCESS_PREFIXES = (
     "tracker-store",
 )
 
+# Préfixe commun aux exclusions ("tracker-") : un seul startswith rejette
+# l'immense majorité des processus avant le test sur le tuple complet
+_EXCLUDED_PROCESS_STEM = os.path.commonprefix(EXCLUDED_PROCESS_PREFIXES)
+
+# Mots-clés (minuscules) recherchés dans le nom des processus
+SUSPICIOUS_PROCESS_KEYWORDS = (
+    "crypto",
+    "miner",
+    "bot",
+    "malware",
+)
+
+# Une seule alternation compilée (recherche en C, un passage par nom quel que
+# soit le nombre de mots-clés)
+_SUSPICIOUS_NAME_RE = re.compile("|".join(map(re.escape, SUSPICIOUS_PROCESS_KEYWORDS)))
+
+_SSHD_BIN = "/usr/sbin/sshd"
+_SSHD_CONFIG = "/etc/ssh/sshd_config"
+
+# Version / port sshd : relus au plus toutes les 5 min, ou dès que le binaire
+# (mise à jour du paquet) ou sshd_config change (mtime dans la clé de cache)
+_SSHD_CACHE_TTL = 300
+
+
+def _mtime_ns(path: str) -> int:
+    """mtime (ns) du fichier, 0 si absent ou illisible."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
 
 def _get_sshd_version() -> str:
+    """Version sshd mémorisée (voir _read_sshd_version)."""
+    return _sshd_version_cached(_mtime_ns(_SSHD_BIN))
+
+
+def _get_ssh_port(default: int = 22) -> int:
+    """Port SSH mémorisé (voir _read_ssh_port)."""
+    return _ssh_port_cached(_mtime_ns(_SSHD_BIN), _mtime_ns(_SSHD_CONFIG), int(default))
+
+
+@ttl_cached(_SSHD_CACHE_TTL)
+def _sshd_version_cached(sshd_mtime_ns: int) -> str:
+    return _read_sshd_version()
+
+
+@ttl_cached(_SSHD_CACHE_TTL)
+def _ssh_port_cached(sshd_mtime_ns: int, config_mtime_ns: int, default: int) -> int:
+    return _read_ssh_port(default)
+
+
+def _read_sshd_version() -> str:
     """
     Retourne la version de sshd de façon compatible Debian/CentOS.
 
@@ -32,10 +83,14 @@ def _get_sshd_version() -> str:
     """
     try:
         result = subprocess.run(
-            ["/usr/sbin/sshd", "-V"],
+            [_SSHD_BIN, "-V"],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
+            # Les fds ouverts par Python ne sont pas héritables (PEP 446) : inutile de
+            # les fermer un à un dans l'enfant (boucle O(ulimit -n)), et l'appel peut
+            # passer par posix_spawn().
+            close_fds=False,
             check=False,
         )
 
@@ -51,7 +106,7 @@ def _get_sshd_version() -> str:
         return "unknown"
 
 
-def _get_ssh_port(default: int = 22) -> int:
+def _read_ssh_port(default: int = 22) -> int:
     """
     Détermine le port SSH (sshd) de façon portable Debian/CentOS.
 
@@ -66,7 +121,7 @@ def _get_ssh_port(default: int = 22) -> int:
     :return: port ssh (int)
     """
     # 1) Méthode la plus fiable : sshd -T (config effective)
-    sshd_candidates = ["/usr/sbin/sshd", "sshd"]
+    sshd_candidates = [_SSHD_BIN, "sshd"]
     for sshd_bin in sshd_candidates:
         try:
             result = subprocess.run(
@@ -74,6 +129,7 @@ def _get_ssh_port(default: int = 22) -> int:
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
+                close_fds=False,
                 check=False,
             )
 
@@ -93,28 +149,74 @@ def _get_ssh_port(default: int = 22) -> int:
         except Exception as exc:  # pragma: no cover - log only
             logger.debug("Erreur sshd -T via %s: %s", sshd_bin, exc)
 
-    # 2) Fallback : parse sshd_config
-    config_path = Path("/etc/ssh/sshd_config")
-    if config_path.exists():
-        try:
-            for raw in config_path.read_text(encoding="utf-8", errors="ignore").splitlines():
+    # 2) Fallback : parse sshd_config (lecture binaire en flux, arrêt au premier Port valide)
+    try:
+        with open(_SSHD_CONFIG, "rb") as f:
+            for raw in f:
                 line = raw.strip()
-                if not line or line.startswith("#"):
+                if not line or line.startswith(b"#"):
                     continue
 
                 # Support: "Port 2222" ou "Port\t2222"
-                m = re.match(r"(?i)^port\s+(\d+)\s*$", line)
-                if m:
-                    port = int(m.group(1))
+                parts = line.split(None, 1)
+                if len(parts) == 2 and parts[0].lower() == b"port" and parts[1].isdigit():
+                    port = int(parts[1])
                     if 1 <= port <= 65535:
                         return port
-        except Exception as exc:  # pragma: no cover - log only
-            logger.debug("Erreur parsing %s: %s", str(config_path), exc)
+    except FileNotFoundError:
+        pass
+    except Exception as exc:  # pragma: no cover - log only
+        logger.debug("Erreur parsing %s: %s", _SSHD_CONFIG, exc)
 
     # 3) Dernier recours
     return int(default)
 
 
+def _count_logged_users() -> int:
+    """1) Utilisateurs connectés (who)."""
+    try:
+        result = subprocess.run(
+            ["who"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            close_fds=False,
+            check=False,
+        )
+        return len([l for l in (result.stdout or "").splitlines() if l.strip()])
+    except Exception as exc:  # pragma: no cover - log only
+        logger.warning("Erreur lors de la récupération des utilisateurs connectés : %s", exc)
+        return 0
+
+
+def _scan_inet_connections() -> Tuple[int, int, Set[int]]:
+    """
+    2) Connexions SSH actives + ports en écoute (LISTEN).
+
+    Un seul net_connections() : chaque appel relit /proc/net/tcp*,udp*
+    et reconstruit la table inode -> fd de tous les processus.
+
+    :return: (port SSH, connexions SSH établies, ports en écoute)
+    """
+    import psutil
+
+    ssh_port = _get_ssh_port()
+    ssh_connections = 0
+    open_ports: Set[int] = set()
+    try:
+        for conn in psutil.net_connections(kind="inet"):
+            if not conn.laddr:
+                continue
+            if conn.status == psutil.CONN_LISTEN:
+                open_ports.add(conn.laddr.port)
+            elif conn.status == psutil.CONN_ESTABLISHED and conn.laddr.port == ssh_port:
+                # Connexion établie dont le port local = port SSH
+                ssh_connections += 1
+    except Exception as exc:  # pragma: no cover - log only
+        logger.warning("Erreur lors de la récupération des connexions réseau (SSH / LISTEN) : %s", exc)
+    return ssh_port, ssh_connections, open_ports
+
+
 class SecurityCollector(BaseCollector):
     """
     Collecteur de métriques de sécurité (best effort).
@@ -134,112 +236,89 @@ class SecurityCollector(BaseCollector):
     editor = "builtin"
 
     def _collect_metrics(self) -> List[Dict[str, Any]]:
-        metrics: List[Dict[str, Any]] = []
+        # Import différé : psutil (extensions C, sondage plateforme) n'est chargé
+        # que si le collecteur s'exécute réellement
+        import psutil
 
-        # ---------------------------------------------------------------------
-        # 1) Utilisateurs connectés (who)
-        # ---------------------------------------------------------------------
-        users_count = 0
-        try:
-            result = subprocess.run(
-                ["who"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True,
-                check=False,
-            )
-            users_count = len([l for l in (result.stdout or "").splitlines() if l.strip()])
-        except Exception as exc:  # pragma: no cover - log only
-            logger.warning("Erreur lors de la récupération des utilisateurs connectés : %s", exc)
-
-        # ---------------------------------------------------------------------
-        # 2) Connexions SSH actives sur le port configuré
-        # ---------------------------------------------------------------------
-        ssh_port = _get_ssh_port()
-        ssh_connections = 0
-        try:
-            for conn in psutil.net_connections(kind="inet"):
-                # Connexion établie dont le port local = port SSH
-                if conn.laddr and conn.laddr.port == ssh_port and conn.status == psutil.CONN_ESTABLISHED:
-                    ssh_connections += 1
-        except Exception as exc:  # pragma: no cover - log only
-            logger.warning("Erreur lors de la récupération des connexions SSH : %s", exc)
+        metrics: List[Dict[str, Any]] = []
 
         # ---------------------------------------------------------------------
-        # 3) Processus suspects / high CPU
+        # 1) + 2) + 4) Sondes indépendantes (who, net_connections, sshd -T / -V)
+        #    lancées en parallèle : leurs attentes (fork/exec, /proc/net) se
+        #    recouvrent avec le parcours des processus et son délai de mesure CPU.
         # ---------------------------------------------------------------------
-        suspicious_processes = 0
-        high_cpu_processes = 0
-        suspicious_keywords = ["crypto", "miner", "bot", "malware"]
-
-        try:
-            # Warmup CPU% : sinon cpu_percent est très souvent 0 au premier passage.
-            # On prime sans intervalle, on attend un court instant, puis on mesure.
-            for p in psutil.process_iter(attrs=["pid"]):
-                try:
-                    p.cpu_percent(interval=None)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-
-            time.sleep(0.2)
-
-            # On itère ensuite "proprement" avec une lecture CPU par process.
-            for proc in psutil.process_iter(attrs=["pid", "name", "username"]):
-                try:
-                    info = proc.info or {}
-                    username = (info.get("username") or "").strip()
-                    name_raw = (info.get("name") or "").strip()
-                    name = name_raw.lower()
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="security") as pool:
+            users_future = pool.submit(_count_logged_users)
+            connections_future = pool.submit(_scan_inet_connections)
+            version_future = pool.submit(_get_sshd_version)
+
+            # ---------------------------------------------------------------------
+            # 3) Processus suspects / high CPU
+            # ---------------------------------------------------------------------
+            suspicious_processes = 0
+            high_cpu_processes = 0
+            suspicious_search = _SUSPICIOUS_NAME_RE.search
+
+            try:
+                # Un seul parcours de /proc : filtrage, heuristiques et amorçage CPU%.
+                # cpu_percent() nécessite un warmup (premier appel = 0.0) : on n'amorce
+                # que les processus retenus, puis une seule mesure après un court délai.
+                sampled = []
+                for proc in psutil.process_iter():
+                    try:
+                        # oneshot() : name(), username() et cpu_times() partagent les
+                        # mêmes lectures /proc/<pid>/stat|status, sans dict "info" intermédiaire
+                        with proc.oneshot():
+                            name = (proc.name() or "").strip().lower()
+
+                            # 3.a) Filtrer les threads kernel: nom entre crochets => faux positifs fréquents
+                            # Exemple sur CentOS: "[crypto]" (thread kernel)
+                            if name.startswith("[") and name.endswith("]"):
+                                continue
+
+                            # 3.b) Exclusions connues (ex: GNOME Tracker)
+                            if name.startswith(_EXCLUDED_PROCESS_STEM) and name.startswith(EXCLUDED_PROCESS_PREFIXES):
+                                continue
+
+                            try:
+                                username = (proc.username() or "").strip()
+                            except psutil.AccessDenied:
+                                username = ""
+
+                            # 3.c) Heuristiques "processus suspects"
+                            # - user "nobody"/"nfsnobody" (signal faible, mais utile)
+                            # - nom contenant des keywords (crypto/miner/bot/malware)
+                            if username in ("nobody", "nfsnobody") or suspicious_search(name) is not None:
+                                suspicious_processes += 1
+
+                            # 3.d) Amorçage CPU%
+                            proc.cpu_percent(interval=None)
+                        sampled.append(proc)
 
-                    # 3.a) Filtrer les threads kernel: nom entre crochets => faux positifs fréquents
-                    # Exemple sur CentOS: "[crypto]" (thread kernel)
-                    if name.startswith("[") and name.endswith("]"):
+                    except (psutil.NoSuchProcess, psutil.AccessDenied, TypeError, ValueError):
                         continue
 
-                    # 3.b) Exclusions connues (ex: GNOME Tracker)
-                    if name.startswith(EXCLUDED_PROCESS_PREFIXES):
-                        continue
+                time.sleep(0.2)
 
-                    # 3.c) Mesure CPU réelle après warmup
+                # 3.e) Heuristique "high CPU" (processus > 80%) : mesure réelle après warmup
+                for proc in sampled:
                     try:
                         cpu = float(proc.cpu_percent(interval=None) or 0.0)
                     except (psutil.NoSuchProcess, psutil.AccessDenied, TypeError, ValueError):
-                        cpu = 0.0
-
-                    # 3.d) Heuristiques "processus suspects"
-                    # - user "nobody"/"nfsnobody" (signal faible, mais utile)
-                    # - nom contenant des keywords (crypto/miner/bot/malware)
-                    if username in ("nobody", "nfsnobody") or any(kw in name for kw in suspicious_keywords):
-                        suspicious_processes += 1
-
-                    # 3.e) Heuristique "high CPU" (processus > 80%)
+                        continue
                     if cpu > 80.0:
                         high_cpu_processes += 1
 
-                except (psutil.NoSuchProcess, psutil.AccessDenied, TypeError, ValueError):
-                    continue
-
-        except Exception as exc:  # pragma: no cover - log only
-            logger.warning("Erreur lors de la récupération des processus pour la sécurité : %s", exc)
-
-        # ---------------------------------------------------------------------
-        # 4) Ports en écoute (LISTEN)
-        # ---------------------------------------------------------------------
-        open_ports = set()
-        try:
-            for conn in psutil.net_connections(kind="inet"):
-                if conn.status == psutil.CONN_LISTEN and conn.laddr:
-                    open_ports.add(conn.laddr.port)
-        except Exception as exc:  # pragma: no cover - log only
-            logger.warning("Erreur lors de la récupération des ports ouverts : %s", exc)
+            except Exception as exc:  # pragma: no cover - log only
+                logger.warning("Erreur lors de la récupération des processus pour la sécurité : %s", exc)
 
-        # ---------------------------------------------------------------------
-        # 5) Version sshd
-        # ---------------------------------------------------------------------
-        ssh_version = _get_sshd_version()
+            # Les sondes ne lèvent pas : erreurs loguées, valeurs neutres
+            users_count = users_future.result()
+            ssh_port, ssh_connections, open_ports = connections_future.result()
+            ssh_version = version_future.result()
 
         # ---------------------------------------------------------------------
-        # 6) Build metrics
+        # 4) Build metrics
         # ---------------------------------------------------------------------
         metrics.extend(
             [
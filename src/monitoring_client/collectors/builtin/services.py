@@ -1,15 +1,47 @@
+import json
 import logging
-import re
+import string
 import subprocess
+from typing import Iterator, List, Optional, Tuple
 
-from monitoring_client.collectors.base_collector import BaseCollector
+from monitoring_client.collectors.base_collector import BaseCollector, Metric
 
 # -----------------------------------------------------------------------------
 # Logger
 # -----------------------------------------------------------------------------
+# Niveau hérité de la configuration applicative (cf. core/logger.py), pas forcé ici
 logger = logging.getLogger(__name__)
-# Laisse DEBUG ici si tu veux diagnostiquer (sinon INFO en prod)
-logger.setLevel(logging.DEBUG)
+
+
+_GETTY_TTY_PREFIX = "getty@tty"
+_SERVICE_SUFFIX = ".service"
+_GETTY_TTY1 = "getty@tty1.service"
+
+# (UNIT, LOAD, ACTIVE, SUB)
+UnitRow = Tuple[str, str, str, str]
+
+_METRIC_NAME_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + "._-")
+
+
+class _MetricNameSafeTable(dict):
+    """Table str.translate : ASCII autorisé conservé, tout autre caractère (y compris non ASCII) => "_"."""
+
+    def __missing__(self, codepoint: int) -> str:
+        return "_"
+
+
+_METRIC_NAME_SAFE_TABLE = _MetricNameSafeTable(
+    {i: chr(i) if chr(i) in _METRIC_NAME_SAFE_CHARS else "_" for i in range(128)}
+)
+
+
+def _is_getty_tty(service_name: str) -> bool:
+    """Identifie les getty tty (getty@tty1.service, ..., getty@tty63.service...)."""
+    return (
+        service_name.startswith(_GETTY_TTY_PREFIX)
+        and service_name.endswith(_SERVICE_SUFFIX)
+        and service_name[len(_GETTY_TTY_PREFIX) : -len(_SERVICE_SUFFIX)].isdigit()
+    )
 
 
 class ServicesCollector(BaseCollector):
@@ -33,29 +65,146 @@ class ServicesCollector(BaseCollector):
     name = "services"
     editor = "builtin"
 
-    # Remplace tout caractère non autorisé par "_" pour avoir des noms de métriques stables
-    _metric_name_safe_re = re.compile(r"[^a-zA-Z0-9._-]")
+    def _collect_metrics(self) -> Iterator[Metric]:
+        # Générateur : métriques normalisées par BaseCollector au fil du parcours
 
-    # Extrait le nom d'un service depuis une ligne de `systemctl list-units`.
-    # Exemple de ligne possible (selon distro):
-    #   getty@tty1.service loaded active running Getty on tty1
-    #   ● syslog.service not-found inactive dead syslog.service
-    #
-    # On accepte un éventuel "●" (avec espaces) puis on capture <xxx.service>
-    _service_name_regex = re.compile(r"^(?:●?\s*)(\S+\.service)\s+.*$")
+        # ---------------------------------------------------------------------
+        # 1) Récupération des services : D-Bus (un seul appel, champs typés),
+        #    sinon systemctl list-units (sous-processus + parsing)
+        # ---------------------------------------------------------------------
+        rows = self._list_units_dbus()
+        if rows is None:
+            rows = self._list_units_systemctl()
+        if rows is None:
+            return
 
-    # Identifie les getty tty (tty1, tty2, ..., tty63...)
-    _getty_tty_regex = re.compile(r"^getty@tty\d+\.service$")
+        # ACTIVE des services retenus : compteurs globaux dérivés en fin de parcours
+        retained_states = []
 
-    def _collect_metrics(self):
-        metrics = []
+        # ---------------------------------------------------------------------
+        # 2) Parcours des services et construction des métriques
+        # ---------------------------------------------------------------------
+        # Gabarit partagé par les métriques par service : dict.copy() + 2 affectations
+        # au lieu d'un littéral complet reconstruit pour chaque service
+        service_template = {"type": "boolean", "collector_name": self.name, "editor_name": self.editor}
+        # Niveau évalué une fois : pas d'appel logger.debug() par service quand DEBUG est inactif
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        for service_name, load_state, active_state, sub_state in rows:
+            # active_state : active/inactive/failed/...
+            # sub_state : running/dead/exited/...
+
+            # Fix Debian : ignorer les unités fantômes / paquets absents / alias
+            # (ne surtout PAS renommer en _unknown_service, sinon on crée des doublons)
+            if load_state == "not-found":
+                if debug:
+                    logger.debug("Service not-found ignoré: %s", service_name)
+                continue
+
+            # Filtre des services transitoires "run-*"
+            # Ces unités ont des noms changeants et génèrent du bruit dans la supervision.
+            if service_name.startswith("run-") and service_name.endswith(_SERVICE_SUFFIX):
+                if debug:
+                    logger.debug("Service transitoire ignoré (run-*): %s", service_name)
+                continue
+
+            # Appliquer le filtrage demandé (ne garder que tty1).
+            # "tty1 présent => lui seul, sinon aucun getty" revient à toujours
+            # écarter les autres getty@ttyN : aucune passe de détection préalable.
+            # Préfiltre inline : la quasi-totalité des unités échoue sur startswith,
+            # sans appel de fonction
+            if (
+                service_name.startswith(_GETTY_TTY_PREFIX)
+                and service_name != _GETTY_TTY1
+                and _is_getty_tty(service_name)
+            ):
+                if debug:
+                    logger.debug("Service filtré (TTY != tty1): %s", service_name)
+                continue
+
+            # Déterminer si le service est actif (en échec : cf. compteurs globaux)
+            is_active = (active_state == "active")
+            retained_states.append(active_state)
+
+            # Nettoyage du nom de la métrique
+            # Remplace tout caractère non autorisé par "_" pour avoir des noms de métriques stables
+            safe_service_name = service_name.translate(_METRIC_NAME_SAFE_TABLE)
+
+            if debug:
+                logger.debug(
+                    "Service retenu: %s -> metric=%s (load_state=%s, active_state=%s, sub_state=%s)",
+                    service_name,
+                    safe_service_name,
+                    load_state,
+                    active_state,
+                    sub_state,
+                )
+
+            # Ajout de la métrique par service (booléen)
+            metric = service_template.copy()
+            metric["name"] = safe_service_name
+            metric["value"] = bool(is_active)
+            yield metric
 
         # ---------------------------------------------------------------------
-        # 1) Récupération des services via systemctl
+        # 3) Ajout des métriques globales
         # ---------------------------------------------------------------------
+        yield {
+            "name": "services.active_count",
+            "value": retained_states.count("active"),
+            "type": "numeric",
+            "collector_name": self.name,
+            "editor_name": self.editor,
+        }
+        yield {
+            "name": "services.failed_count",
+            "value": retained_states.count("failed"),
+            "type": "numeric",
+            "collector_name": self.name,
+            "editor_name": self.editor,
+        }
+
+    # ---- Sources de données ----
+
+    @staticmethod
+    def _list_units_dbus() -> Optional[List[UnitRow]]:
+        """
+        Liste les services via org.freedesktop.systemd1.Manager.ListUnits (dbus-python, optionnel).
+
+        ListUnits renvoie toutes les unités chargées en mémoire (équivalent de
+        `list-units --all`) : tuples (name, description, load, active, sub, ...).
+        ListUnitsByPatterns n'existe pas avant systemd 230 (CentOS 7), d'où le
+        filtrage ".service" côté Python.
+
+        Retourne None si dbus-python est absent ou si le bus système est
+        inaccessible : l'appelant bascule alors sur systemctl.
+        """
+        try:
+            import dbus
+        except ImportError:
+            return None
+
+        try:
+            systemd = dbus.SystemBus().get_object("org.freedesktop.systemd1", "/org/freedesktop/systemd1")
+            units = dbus.Interface(systemd, "org.freedesktop.systemd1.Manager").ListUnits()
+        except Exception as exc:
+            logger.debug("ListUnits via D-Bus indisponible, repli sur systemctl : %s", exc)
+            return None
+
+        return [
+            (str(unit[0]), str(unit[2]), str(unit[3]), str(unit[4]))
+            for unit in units
+            if unit[0].endswith(_SERVICE_SUFFIX)
+        ]
+
+    @classmethod
+    def _list_units_systemctl(cls) -> Optional[List[UnitRow]]:
+        """Liste les services via `systemctl list-units` ; None si systemctl est inutilisable."""
         try:
-            # --plain : évite certains glyphes/formatages suivant la distro
-            # (réduit les surprises de parsing, tout en gardant une sortie textuelle simple)
+            # --output=json (systemd >= 246) : champs structurés, parsés en C.
+            # Les systemd plus anciens (CentOS 7...) ignorent l'option et produisent
+            # la sortie texte habituelle, d'où --no-legend / --plain conservés :
+            # --plain évite certains glyphes/formatages suivant la distro
             result = subprocess.run(
                 [
                     "systemctl",
@@ -65,150 +214,80 @@ class ServicesCollector(BaseCollector):
                     "--no-legend",
                     "--no-pager",
                     "--plain",
+                    "--output=json",
                 ],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 universal_newlines=True,
+                # Pas de fd à "nettoyer" côté enfant (fds Python non héritables)
+                close_fds=False,
                 check=False,
             )
         except FileNotFoundError:
             logger.error("systemctl non trouvé, impossible de collecter les services.")
-            return metrics
+            return None
         except Exception as exc:
-            logger.error(f"Erreur lors de l'exécution de systemctl list-units : {exc}")
-            return metrics
-
-        # Nettoyage des lignes
-        lines = [l.strip() for l in result.stdout.splitlines() if l.strip()]
-        active_count = 0
-        failed_count = 0
-
-        # ---------------------------------------------------------------------
-        # 2) Détection préalable : getty@tty1 existe ?
-        #    - Si oui => on garde uniquement getty@tty1.service
-        #    - Si non => on ne remonte aucun getty@ttyX
-        # ---------------------------------------------------------------------
-        tty1_present = False
-        for line in lines:
-            match = self._service_name_regex.match(line)
-            if not match:
+            logger.error("Erreur lors de l'exécution de systemctl list-units : %s", exc)
+            return None
+
+        # Parsing : JSON si disponible, sinon texte
+        rows = cls._parse_units_json(result.stdout)
+        if rows is None:
+            rows = cls._parse_units_text(result.stdout)
+        return rows
+
+    # ---- Parsing de `systemctl list-units` ----
+
+    @staticmethod
+    def _parse_units_json(stdout: str) -> Optional[List[UnitRow]]:
+        """
+        Parse la sortie `--output=json` (liste d'objets unit/load/active/sub).
+
+        Retourne None si la sortie n'est pas du JSON (systemd < 246) :
+        l'appelant bascule alors sur le parsing texte.
+        """
+        if not stdout.lstrip().startswith("["):
+            return None
+        try:
+            units = json.loads(stdout)
+        except ValueError:
+            return None
+
+        rows: List[UnitRow] = []
+        for unit in units:
+            try:
+                rows.append((unit["unit"], unit["load"], unit["active"], unit["sub"]))
+            except (KeyError, TypeError):
+                logger.debug("Unité systemctl JSON incomplète (ignorée): %s", unit)
+        return rows
+
+    @staticmethod
+    def _parse_units_text(stdout: str) -> List[UnitRow]:
+        """
+        Parsing en une passe : un seul split par ligne, champs réutilisés.
+
+        systemctl list-units renvoie des colonnes:
+        UNIT LOAD ACTIVE SUB DESCRIPTION...
+        """
+        rows: List[UnitRow] = []
+        for line in stdout.splitlines():
+            # Un éventuel "●" (unités "problématiques") précède le nom
+            parts = line.lstrip("● \t").split(None, 4)
+            if not parts:
                 continue
-            service_name = match.group(1)
-            if service_name == "getty@tty1.service":
-                tty1_present = True
-                break
-
-        logger.debug(f"Présence de getty@tty1.service: {tty1_present}")
-
-        def keep_service(service_name: str) -> bool:
-            """
-            Politique de filtrage des services.
-
-            - Tout ce qui n'est pas un getty tty => gardé.
-            - Pour les getty tty :
-              - si tty1 est présent => on ne garde que getty@tty1.service
-              - sinon => on ne garde aucun getty@ttyX
-            """
-            if not self._getty_tty_regex.match(service_name):
-                return True
-
-            if tty1_present:
-                return service_name == "getty@tty1.service"
-            return False
 
-        # ---------------------------------------------------------------------
-        # 3) Parcours des services et construction des métriques
-        # ---------------------------------------------------------------------
-        for line in lines:
-            match = self._service_name_regex.match(line)
-            if not match:
+            service_name = parts[0]
+            if not service_name.endswith(_SERVICE_SUFFIX):
                 # On log en debug plutôt qu'en warning si tu veux réduire le bruit,
                 # mais je conserve ton warning d'origine.
-                logger.warning(f"Nom de service invalide dans la ligne: {line}. Ignoré.")
+                logger.warning("Nom de service invalide dans la ligne: %s. Ignoré.", line.strip())
                 continue
 
-            service_name = match.group(1)
-
-            # systemctl list-units renvoie des colonnes:
-            # UNIT LOAD ACTIVE SUB DESCRIPTION...
-            parts = line.split()
             if len(parts) < 4:
-                logger.debug(f"Ligne systemctl trop courte (ignorée): {line}")
+                logger.debug("Ligne systemctl trop courte (ignorée): %s", line.strip())
                 continue
 
             # Très important : LOAD est la 2e colonne (parts[1])
             # C'est ici qu'on trouve "loaded" / "not-found" / etc.
-            load_state = parts[1]
-            active_state = parts[2]  # active/inactive/failed/...
-            sub_state = parts[3]     # running/dead/exited/...
-
-            # Fix Debian : ignorer les unités fantômes / paquets absents / alias
-            # (ne surtout PAS renommer en _unknown_service, sinon on crée des doublons)
-            if load_state == "not-found":
-                logger.debug(f"Service not-found ignoré: {service_name} ({line})")
-                continue
-
-            # Filtre des services transitoires "run-*"
-            # Ces unités ont des noms changeants et génèrent du bruit dans la supervision.
-            if service_name.startswith("run-") and service_name.endswith(".service"):
-                logger.debug(f"Service transitoire ignoré (run-*): {service_name}")
-                continue
-
-            # Appliquer le filtrage demandé (ne garder que tty1)
-            if not keep_service(service_name):
-                logger.debug(f"Service filtré (TTY != tty1): {service_name}")
-                continue
-
-            # Déterminer si le service est actif ou en échec
-            is_active = (active_state == "active")
-            is_failed = (active_state == "failed")
-
-            if is_active:
-                active_count += 1
-            if is_failed:
-                failed_count += 1
-
-            # Nettoyage du nom de la métrique
-            safe_service_name = self._metric_name_safe_re.sub("_", service_name)
-
-            logger.debug(
-                f"Service retenu: {service_name} -> metric={safe_service_name} "
-                f"(load_state={load_state}, active_state={active_state}, sub_state={sub_state}, "
-                f"is_active={is_active}, is_failed={is_failed})"
-            )
-
-            # Ajout de la métrique par service (booléen)
-            metrics.append(
-                {
-                    "name": safe_service_name,
-                    "value": bool(is_active),
-                    "type": "boolean",
-                    "collector_name": self.name,
-                    "editor_name": self.editor,
-                }
-            )
-
-        # ---------------------------------------------------------------------
-        # 4) Ajout des métriques globales
-        # ---------------------------------------------------------------------
-        metrics.append(
-            {
-                "name": "services.active_count",
-                "value": int(active_count),
-                "type": "numeric",
-                "collector_name": self.name,
-                "editor_name": self.editor,
-            }
-        )
-        metrics.append(
-            {
-                "name": "services.failed_count",
-                "value": int(failed_count),
-                "type": "numeric",
-                "collector_name": self.name,
-                "editor_name": self.editor,
-            }
-        )
-
-        logger.info(f"Collecte terminée: {len(metrics)} métriques collectées.")
-        return metrics
+            rows.append((service_name, parts[1], parts[2], parts[3]))
+        return rows
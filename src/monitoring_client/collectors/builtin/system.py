@@ -1,19 +1,182 @@
 from __future__ import annotations
 
+import logging
 import os
 import platform
-import subprocess
+import sys
 import time
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
 
 import psutil
 
 from monitoring_client.core.logger import get_logger
+from monitoring_client.core.utils import ttl_cached
 from monitoring_client.collectors.base_collector import BaseCollector, Metric
 
 # Configuration du logger
 logger = get_logger(__name__)
 
+# Nombre maximal de threads pour les appels disk_usage (statvfs) concurrents
+_DISK_USAGE_MAX_WORKERS = 8
+
+# Fenêtre de mesure de cpu.usage_percent (secondes). Échantillon bloquant explicite :
+# cpu_percent(interval=None) mesure depuis l'appel précédent du même thread
+# (état par thread dans les psutil récents), or le collecteur tourne dans un
+# thread neuf du pool du loader, et psutil n'est plus importé au démarrage
+_CPU_SAMPLE_INTERVAL = 0.2
+
+# Détection de plateforme / capacités, une seule fois au chargement du module
+_IS_LINUX = sys.platform.startswith("linux")
+_HAS_GETLOADAVG = hasattr(os, "getloadavg")
+_HAS_SENSORS = hasattr(psutil, "sensors_temperatures")
+_HAS_STATVFS = hasattr(os, "statvfs")
+
+# Conversion octets -> Go : multiplication par l'inverse précalculé
+_INV_GB = 1.0 / (1024**3)
+
+# (pourcentage utilisé, total en octets, libre en octets)
+DiskUsage = Tuple[float, int, int]
+
+
+# ---- Valeurs semi-statiques (mises en cache, rafraîchies périodiquement) ----
+
+
+@ttl_cached(300)
+def _cpu_count():
+    return psutil.cpu_count(logical=True)
+
+
+@ttl_cached(300)
+def _boot_time() -> float:
+    return psutil.boot_time()
+
+
+def _load_average_linux() -> Optional[Tuple[float, float, float]]:
+    """
+    Load average 1/5/15 min sous Linux.
+
+    Lit /proc/loadavg directement (une seule lecture, parsing trivial) ;
+    fallback sur os.getloadavg() si /proc est inaccessible.
+    """
+    try:
+        with open("/proc/loadavg", "rb") as f:
+            parts = f.read().split(None, 3)
+        return float(parts[0]), float(parts[1]), float(parts[2])
+    except (OSError, IndexError, ValueError):
+        return os.getloadavg()
+
+
+def _load_average_generic() -> Optional[Tuple[float, float, float]]:
+    """Load average hors Linux (None si la plateforme ne le fournit pas)."""
+    if _HAS_GETLOADAVG:
+        return os.getloadavg()
+    return None
+
+
+def _process_count_linux() -> int:
+    """
+    Nombre d'entrées numériques (PID) de /proc, sans liste intermédiaire.
+
+    Le champ "running/total" de /proc/loadavg n'est pas utilisable ici : son
+    total compte les entités ordonnançables (threads), pas les processus.
+    """
+    with os.scandir("/proc") as entries:
+        # Pré-filtre sur le premier caractère : self, sys, cpuinfo... écartés
+        # sans isdigit() sur le nom complet
+        return sum(1 for entry in entries if entry.name[0] in "0123456789" and entry.name.isdigit())
+
+
+def _process_count_generic() -> int:
+    return len(psutil.pids())
+
+
+# Spécialisation à l'import : les branches de plateforme ne sont pas
+# réévaluées à chaque collecte.
+_load_average = _load_average_linux if _IS_LINUX else _load_average_generic
+_process_count = _process_count_linux if _IS_LINUX else _process_count_generic
+
+
+# ---- Sondes des informations statiques (chaînes) ----
+
+
+def _kernel_full_version() -> str:
+    """
+    Version complète du noyau (équivalent de `uname -r`, sans fork/exec).
+
+    Lecture directe de /proc/sys/kernel/osrelease sous Linux ; release de
+    platform.uname() ailleurs ou si /proc est indisponible.
+    """
+    if _IS_LINUX:
+        try:
+            with open("/proc/sys/kernel/osrelease", "rb") as f:
+                return f.read().strip().decode("utf-8", errors="ignore")
+        except OSError:
+            pass
+    return platform.uname().release
+
+
+def _distribution() -> Optional[str]:
+    """PRETTY_NAME de /etc/os-release, ou None si absent."""
+    # Lecture unique en bytes : pas de décodage ligne par ligne
+    with open("/etc/os-release", "rb") as f:
+        data = b"\n" + f.read()
+    _, found, rest = data.partition(b"\nPRETTY_NAME=")
+    if not found:
+        return None
+    return rest.split(b"\n", 1)[0].strip().strip(b'"').decode("utf-8", "ignore")
+
+
+# (nom de métrique, sonde, libellé utilisé dans les logs d'échec)
+_STATIC_STRING_PROBES: Tuple[Tuple[str, Callable[[], Optional[str]], str], ...] = (
+    ("system.hostname", platform.node, "hostname"),
+    ("system.os", platform.system, "OS"),
+    ("system.kernel_version", platform.release, "kernel version"),
+    ("system.kernel_full_version", _kernel_full_version, "kernel full"),
+)
+if _IS_LINUX:
+    # /etc/os-release n'existe que sous Linux
+    _STATIC_STRING_PROBES += (("system.distribution", _distribution, "distribution (/etc/os-release)"),)
+_STATIC_STRING_PROBES += (
+    ("system.architecture", platform.machine, "architecture"),
+    ("system.python_version", platform.python_version, "Python version"),
+)
+
+
+@ttl_cached(3600)
+def _static_string_metrics(collector_name: str, editor_name: str) -> Tuple[Metric, ...]:
+    """
+    Exécute les sondes statiques et construit les métriques correspondantes.
+
+    Valeurs constantes sur la durée de vie du processus (hostname, noyau,
+    distribution...) : recalculées au plus toutes les heures. Une sonde qui
+    échoue ou ne renvoie rien est omise ; l'échec n'est loggué (et formaté)
+    que si le niveau DEBUG est actif.
+    """
+    metrics: List[Metric] = []
+    for metric_name, getter, label in _STATIC_STRING_PROBES:
+        try:
+            value = getter()
+        except Exception as exc:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Échec collecte %s: %s", label, exc)
+            continue
+
+        if value is None:
+            continue
+
+        metrics.append(
+            {
+                "name": metric_name,
+                "value": value,
+                "type": "string",
+                "collector_name": collector_name,
+                "editor_name": editor_name,
+            }
+        )
+    return tuple(metrics)
+
+
 class SystemCollector(BaseCollector):
     """
     Collecteur builtin pour toutes les métriques système.
@@ -48,363 +211,194 @@ class SystemCollector(BaseCollector):
 
     name = "system"  # Nom du collecteur
     editor = "builtin"  # Type de collecteur
+    trusted = True
 
-    def _collect_metrics(self) -> List[Metric]:
-        metrics: List[Dict[str, Any]] = []
+    def _collect_metrics(self) -> Iterator[Metric]:
+        # Générateur : chaque métrique est projetée par BaseCollector dès sa
+        # production, sans liste intermédiaire de métriques brutes
 
         # === INFORMATIONS STATIQUES ===
 
-        # Hostname
-        try:
-            metrics.append(
-                {
-                    "name": "system.hostname",
-                    "value": platform.node(),
-                    "type": "string",
-                    "collector_name": self.name,
-                    "editor_name": self.editor,
-                }
-            )
-        except Exception as exc:
-            logger.debug("Échec collecte hostname: %s", exc)
+        # Calculées une fois puis réutilisées entre les collectes (copies : le
+        # cache ne doit pas être modifié par l'aval)
+        for metric in _static_string_metrics(self.name, self.editor):
+            yield metric.copy()
 
-        # OS
-        try:
-            metrics.append(
-                {
-                    "name": "system.os",
-                    "value": platform.system(),
-                    "type": "string",
-                    "collector_name": self.name,
-                    "editor_name": self.editor,
-                }
-            )
-        except Exception as exc:
-            logger.debug("Échec collecte OS: %s", exc)
-
-        # Kernel version (simple)
-        try:
-            metrics.append(
-                {
-                    "name": "system.kernel_version",
-                    "value": platform.release(),
-                    "type": "string",
-                    "collector_name": self.name,
-                    "editor_name": self.editor,
-                }
-            )
-        except Exception as exc:
-            logger.debug("Échec collecte kernel version: %s", exc)
-
-        # Kernel version (full via uname -r)
-        try:
-            kernel_full = (
-                subprocess.check_output(["uname", "-r"], stderr=subprocess.DEVNULL)
-                .decode("utf-8", errors="ignore")
-                .strip()
-            )
-            metrics.append(
-                {
-                    "name": "system.kernel_full_version",
-                    "value": kernel_full,
-                    "type": "string",
-                    "collector_name": self.name,
-                    "editor_name": self.editor,
-                }
-            )
-        except Exception as exc:
-            logger.debug("Échec collecte kernel full: %s", exc)
-
-        # Distribution Linux
-        try:
-            with open("/etc/os-release", "r", encoding="utf-8", errors="ignore") as f:
-                for line in f:
-                    if line.startswith("PRETTY_NAME="):
-                        distro = line.split("=", 1)[1].strip().strip('"')
-                        metrics.append(
-                            {
-                                "name": "system.distribution",
-                                "value": distro,
-                                "type": "string",
-                                "collector_name": self.name,
-                                "editor_name": self.editor,
-                            }
-                        )
-                        break
-        except (FileNotFoundError, Exception) as exc:
-            logger.debug("Échec lecture /etc/os-release: %s", exc)
-
-        # Architecture
-        try:
-            metrics.append(
-                {
-                    "name": "system.architecture",
-                    "value": platform.machine(),
-                    "type": "string",
-                    "collector_name": self.name,
-                    "editor_name": self.editor,
-                }
-            )
-        except Exception as exc:
-            logger.debug("Échec collecte architecture: %s", exc)
+        # === MÉTRIQUES DYNAMIQUES ===
 
-        # Python version
+        # Gabarit partagé (clés constantes) : chaque métrique numérique est une
+        # copie + name/value, au lieu d'un littéral complet reconstruit
+        numeric_template = {"type": "numeric", "collector_name": self.name, "editor_name": self.editor}
+
+        def numeric(name: str, value: Any) -> Metric:
+            metric = numeric_template.copy()
+            metric["name"] = name
+            metric["value"] = value
+            return metric
+
+        # Sources potentiellement lentes et indépendantes (statvfs NFS/FUSE,
+        # parcours de /proc, /sys/class/hwmon) lancées d'abord dans un pool :
+        # elles avancent pendant les lectures psutil rapides faites ci-dessous.
+        # Chaque résultat est consommé à sa place habituelle (ordre inchangé).
+        pool = ThreadPoolExecutor(max_workers=_DISK_USAGE_MAX_WORKERS + 3, thread_name_prefix="system")
+        # Mesure CPU sur _CPU_SAMPLE_INTERVAL, recouverte par le reste de la collecte
+        cpu_future = pool.submit(psutil.cpu_percent, _CPU_SAMPLE_INTERVAL)
+        process_count_future = pool.submit(_process_count)
+        temps_future = pool.submit(psutil.sensors_temperatures) if _HAS_SENSORS else None
         try:
-            metrics.append(
-                {
-                    "name": "system.python_version",
-                    "value": platform.python_version(),
-                    "type": "string",
-                    "collector_name": self.name,
-                    "editor_name": self.editor,
-                }
-            )
+            # Filtrage des partitions et dédoublonnage (cache 60 s)
+            mountpoints = [partition.mountpoint for partition in self._filter_and_deduplicate_partitions()]
+            usage_futures = [pool.submit(self._safe_disk_usage, mountpoint) for mountpoint in mountpoints]
         except Exception as exc:
-            logger.debug("Échec collecte Python version: %s", exc)
-
-        # === MÉTRIQUES DYNAMIQUES ===
+            logger.debug("Échec collecte disque: %s", exc)
+            mountpoints, usage_futures = [], []
+        # Plus aucune soumission : les tâches en file s'exécutent, les threads
+        # se terminent d'eux-mêmes une fois la file vide
+        pool.shutdown(wait=False)
 
-        # CPU usage (instantané)
+        # CPU usage (moyenne sur _CPU_SAMPLE_INTERVAL)
         try:
-            cpu_percent = psutil.cpu_percent(interval=None)
-            metrics.append(
-                {
-                    "name": "cpu.usage_percent",
-                    "value": float(cpu_percent),
-                    "type": "numeric",
-                    "collector_name": self.name,
-                    "editor_name": self.editor,
-                }
-            )
+            yield numeric("cpu.usage_percent", float(cpu_future.result()))
         except Exception as exc:
             logger.debug("Échec collecte CPU usage: %s", exc)
 
         # CPU count
         try:
-            cpu_count = psutil.cpu_count(logical=True)
+            cpu_count = _cpu_count()
             if cpu_count is not None:
-                metrics.append(
-                    {
-                        "name": "cpu.count",
-                        "value": int(cpu_count),
-                        "type": "numeric",
-                        "collector_name": self.name,
-                        "editor_name": self.editor,
-                    }
-                )
+                yield numeric("cpu.count", int(cpu_count))
         except Exception as exc:
             logger.debug("Échec collecte CPU count: %s", exc)
 
         # Load average (Unix)
         try:
-            if hasattr(os, "getloadavg"):
-                load1, load5, load15 = os.getloadavg()
-                metrics.extend(
-                    [
-                        {
-                            "name": "system.load_1m",
-                            "value": float(load1),
-                            "type": "numeric",
-                            "collector_name": self.name,
-                            "editor_name": self.editor,
-                        },
-                        {
-                            "name": "system.load_5m",
-                            "value": float(load5),
-                            "type": "numeric",
-                            "collector_name": self.name,
-                            "editor_name": self.editor,
-                        },
-                        {
-                            "name": "system.load_15m",
-                            "value": float(load15),
-                            "type": "numeric",
-                            "collector_name": self.name,
-                            "editor_name": self.editor,
-                        },
-                    ]
-                )
+            loadavg = _load_average()
+            if loadavg is not None:
+                load1, load5, load15 = loadavg
+                yield numeric("system.load_1m", float(load1))
+                yield numeric("system.load_5m", float(load5))
+                yield numeric("system.load_15m", float(load15))
         except Exception as exc:
             logger.debug("Échec collecte load average: %s", exc)
 
         # Memory (RAM)
         try:
             vm = psutil.virtual_memory()
-            metrics.extend(
-                [
-                    {
-                        "name": "memory.usage_percent",
-                        "value": float(vm.percent),
-                        "type": "numeric",
-                        "collector_name": self.name,
-                        "editor_name": self.editor,
-                    },
-                    {
-                        "name": "memory.total_bytes",
-                        "value": int(vm.total),
-                        "type": "numeric",
-                        "collector_name": self.name,
-                        "editor_name": self.editor,
-                    },
-                    {
-                        "name": "memory.available_bytes",
-                        "value": int(vm.available),
-                        "type": "numeric",
-                        "collector_name": self.name,
-                        "editor_name": self.editor,
-                    },
-                    {
-                        "name": "system.memory_total_gb",
-                        "value": round(vm.total / (1024**3), 2),
-                        "type": "numeric",
-                        "collector_name": self.name,
-                        "editor_name": self.editor,
-                    },
-                    {
-                        "name": "system.memory_available_gb",
-                        "value": round(vm.available / (1024**3), 2),
-                        "type": "numeric",
-                        "collector_name": self.name,
-                        "editor_name": self.editor,
-                    },
-                ]
-            )
+            yield numeric("memory.usage_percent", float(vm.percent))
+            yield numeric("memory.total_bytes", int(vm.total))
+            yield numeric("memory.available_bytes", int(vm.available))
+            yield numeric("system.memory_total_gb", round(vm.total * _INV_GB, 2))
+            yield numeric("system.memory_available_gb", round(vm.available * _INV_GB, 2))
         except Exception as exc:
             logger.debug("Échec collecte mémoire: %s", exc)
 
         # Swap
         try:
             sm = psutil.swap_memory()
-            metrics.extend(
-                [
-                    {
-                        "name": "swap.usage_percent",
-                        "value": float(sm.percent),
-                        "type": "numeric",
-                        "collector_name": self.name,
-                        "editor_name": self.editor,
-                    },
-                    {
-                        "name": "swap.total_bytes",
-                        "value": int(sm.total),
-                        "type": "numeric",
-                        "collector_name": self.name,
-                        "editor_name": self.editor,
-                    },
-                ]
-            )
+            yield numeric("swap.usage_percent", float(sm.percent))
+            yield numeric("swap.total_bytes", int(sm.total))
         except Exception as exc:
             logger.debug("Échec collecte swap: %s", exc)
 
         # Uptime
         try:
-            boot_ts = psutil.boot_time()
-            uptime_sec = max(0.0, time.time() - boot_ts)
-            metrics.append(
-                {
-                    "name": "system.uptime_seconds",
-                    "value": float(uptime_sec),
-                    "type": "numeric",
-                    "collector_name": self.name,
-                    "editor_name": self.editor,
-                }
-            )
+            uptime_sec = max(0.0, time.time() - _boot_time())
+            yield numeric("system.uptime_seconds", float(uptime_sec))
         except Exception as exc:
             logger.debug("Échec collecte uptime: %s", exc)
 
         # Process count
         try:
-            process_count = len([pid for pid in os.listdir("/proc") if pid.isdigit()])
-            metrics.append(
-                {
-                    "name": "system.process_count",
-                    "value": int(process_count),
-                    "type": "numeric",
-                    "collector_name": self.name,
-                    "editor_name": self.editor,
-                }
-            )
+            yield numeric("system.process_count", int(process_count_future.result()))
         except Exception as exc:
             logger.debug("Échec collecte process count: %s", exc)
 
         # === MÉTRIQUES DISQUE (avec filtrage bind mounts et dédoublonnage) ===
         try:
-            # Filtrage des partitions et dédoublonnage
-            valid_partitions = self._filter_and_deduplicate_partitions()
-
-            # Collecte des métriques pour les partitions uniques
-            for partition in valid_partitions:
-                mountpoint = partition.mountpoint
-                try:
-                    disk_usage = psutil.disk_usage(mountpoint)
-                    metrics.extend(
-                        [
-                            {
-                                "name": f"disk[{mountpoint}].usage_percent",
-                                "value": round(disk_usage.percent, 1),
-                                "type": "numeric",
-                                "unit": "%",
-                                "collector_name": self.name,
-                                "editor_name": self.editor,
-                            },
-                            {
-                                "name": f"disk[{mountpoint}].total_gb",
-                                "value": round(disk_usage.total / (1024**3), 2),
-                                "type": "numeric",
-                                "unit": "GB",
-                                "collector_name": self.name,
-                                "editor_name": self.editor,
-                            },
-                            {
-                                "name": f"disk[{mountpoint}].free_gb",
-                                "value": round(disk_usage.free / (1024**3), 2),
-                                "type": "numeric",
-                                "unit": "GB",
-                                "collector_name": self.name,
-                                "editor_name": self.editor,
-                            },
-                        ]
-                    )
-                except (PermissionError, FileNotFoundError) as exc:
-                    logger.debug("Cannot access disk usage for %s: %s", mountpoint, exc)
+            # Les appels statvfs peuvent bloquer (NFS, FUSE) : lancés en parallèle
+            # (cf. plus haut), la latence totale est celle du montage le plus lent.
+            usages = [future.result() for future in usage_futures]
+
+            # Collecte des métriques pour les partitions uniques (gabarits par unité)
+            percent_template = dict(numeric_template, unit="%")
+            gb_template = dict(numeric_template, unit="GB")
+            for mountpoint, disk_usage in zip(mountpoints, usages):
+                if disk_usage is None:
                     continue
-                except Exception as exc:
-                    logger.debug("Erreur sur la partition %s: %s", mountpoint, exc)
+                percent, total, free = disk_usage
+                prefix = f"disk[{mountpoint}]"
+
+                usage_metric = percent_template.copy()
+                usage_metric["name"] = f"{prefix}.usage_percent"
+                usage_metric["value"] = round(percent, 1)
+
+                total_metric = gb_template.copy()
+                total_metric["name"] = f"{prefix}.total_gb"
+                total_metric["value"] = round(total * _INV_GB, 2)
+
+                free_metric = gb_template.copy()
+                free_metric["name"] = f"{prefix}.free_gb"
+                free_metric["value"] = round(free * _INV_GB, 2)
+
+                yield usage_metric
+                yield total_metric
+                yield free_metric
 
         except Exception as exc:
             logger.debug("Échec collecte disque: %s", exc)
 
         # === MÉTRIQUES TEMPÉRATURE ===
         try:
-            if hasattr(psutil, "sensors_temperatures"):
-                temps = psutil.sensors_temperatures()
+            if temps_future is not None:
+                temps = temps_future.result()
                 if temps:
+                    celsius_template = dict(numeric_template, unit="°C")
                     for label, entries in temps.items():
                         for idx, temp in enumerate(entries):
-                            sensor_name = f"{label}.{idx}"
-                            metrics.append(
-                                {
-                                    "name": f"temperature.{sensor_name}.current",
-                                    "value": float(temp.current),
-                                    "type": "numeric",
-                                    "unit": "°C",
-                                    "collector_name": self.name,
-                                    "editor_name": self.editor,
-                                }
-                            )
+                            metric = celsius_template.copy()
+                            metric["name"] = f"temperature.{label}.{idx}.current"
+                            metric["value"] = float(temp.current)
+                            yield metric
         except Exception as exc:
             logger.debug("Échec collecte températures: %s", exc)
 
-        # Retour des métriques collectées
-        logger.info(f"Collecte terminée: {len(metrics)} métriques collectées.")
-        return metrics
+    @staticmethod
+    def _safe_disk_usage(mountpoint: str) -> Optional[DiskUsage]:
+        """
+        Retourne (pourcentage utilisé, total, libre) en octets pour mountpoint,
+        ou None si le point de montage est inaccessible. Ne lève jamais
+        d'exception (appelé depuis un pool de threads).
+
+        os.statvfs direct sous POSIX (mêmes formules que psutil.disk_usage :
+        pourcentage rapporté à l'espace accessible aux utilisateurs non root),
+        psutil ailleurs.
+        """
+        try:
+            if not _HAS_STATVFS:
+                usage = psutil.disk_usage(mountpoint)
+                return usage.percent, usage.total, usage.free
+
+            st = os.statvfs(mountpoint)
+            total = st.f_blocks * st.f_frsize
+            free = st.f_bavail * st.f_frsize
+            used = total - st.f_bfree * st.f_frsize
+            total_user = used + free
+            percent = used / total_user * 100.0 if total_user else 0.0
+            return percent, total, free
+        except (PermissionError, FileNotFoundError) as exc:
+            logger.debug("Cannot access disk usage for %s: %s", mountpoint, exc)
+        except Exception as exc:
+            logger.debug("Erreur sur la partition %s: %s", mountpoint, exc)
+        return None
 
     @staticmethod
-    def _is_bind_mount(mountpoint: str) -> bool:
+    def _bind_mountpoints() -> FrozenSet[str]:
         """
-        Détecte un bind mount via /proc/self/mountinfo.
-        Fallback safe si non disponible.
+        Points de montage détectés comme bind mounts via /proc/self/mountinfo
+        (root != "/" ou option "bind"), en une seule lecture du fichier.
+        Fallback safe (ensemble vide) si non disponible.
         """
+        bind_mountpoints = set()
         try:
             with open("/proc/self/mountinfo", "r", encoding="utf-8", errors="ignore") as f:
                 for line in f:
@@ -412,32 +406,30 @@ class SystemCollector(BaseCollector):
                     if len(parts) < 10:
                         continue
 
-                    current_mount_point = parts[4]
-                    root_source = parts[3]
-
-                    if current_mount_point == mountpoint:
-                        # bind mount si root != /
-                        if root_source != "/":
-                            return True
-
-                        # ou option bind
-                        options = " ".join(parts[5:]).lower()
-                        if "bind" in options:
-                            return True
+                    # bind mount si root != / ou option bind
+                    if parts[3] != "/" or "bind" in " ".join(parts[5:]).lower():
+                        bind_mountpoints.add(parts[4])
 
         except (FileNotFoundError, PermissionError):
             # Non Linux ou permissions
-            return False
+            return frozenset()
         except Exception:
-            return False
+            return frozenset()
 
-        return False
+        return frozenset(bind_mountpoints)
 
-    def _filter_and_deduplicate_partitions(self):
+    @staticmethod
+    @ttl_cached(60)
+    def _filter_and_deduplicate_partitions():
         """
         Filtrer les partitions valides et supprimer les doublons.
         Cette méthode combine les étapes de filtrage des bind mounts,
         et de dédoublonnage des partitions.
+
+        La topologie des montages change rarement : le résultat complet
+        (énumération, mountinfo, stat) est mis en cache 60 s ; seuls les
+        statvfs par point de montage sont refaits à chaque collecte.
+        Une exception n'est pas mise en cache.
         """
         skip_fs_types = {
             'squashfs', 'tmpfs', 'devtmpfs', 'overlay', 
@@ -447,6 +439,8 @@ class SystemCollector(BaseCollector):
         skip_prefixes = ('/sys', '/proc', '/dev', '/run')
         
         valid_partitions = []
+        # mountinfo lu une fois pour toutes les partitions (lookup O(1) ensuite)
+        bind_mountpoints = SystemCollector._bind_mountpoints()
         
         for partition in psutil.disk_partitions(all=False):
             mountpoint = partition.mountpoint
@@ -466,43 +460,40 @@ class SystemCollector(BaseCollector):
                 continue
             
             # Détection des bind mounts via /proc/self/mountinfo
-            if self._is_bind_mount(mountpoint):
+            if mountpoint in bind_mountpoints:
                 logger.debug("Ignoring bind mount (via /proc): %s", mountpoint)
                 continue
             
             valid_partitions.append(partition)
         
-        # Déduplique les partitions
-        seen_devices = {}
-        unique_partitions = []
+        # Déduplique les partitions par st_dev (même FS monté plusieurs fois, quel que
+        # soit le nom du périphérique source) ; un point de montage dont le stat()
+        # échoue est écarté. Dict st_dev -> partition : remplacement en O(1) ; le
+        # point de montage retenu (le plus court) passe en fin d'ordre, comme avant.
+        seen_devices: Dict[int, Any] = {}
 
         for partition in valid_partitions:
             try:
-                stat_info = os.stat(partition.mountpoint)
-                device_id = stat_info.st_dev
-                
-                if device_id in seen_devices:
-                    existing = seen_devices[device_id]
-                    if len(partition.mountpoint) < len(existing.mountpoint):
-                        # Remplacer le plus long par le plus court
-                        unique_partitions.remove(existing)
-                        seen_devices[device_id] = partition
-                        unique_partitions.append(partition)
-                        logger.debug(
-                            "Replacing %s with shorter %s (same device %s)",
-                            existing.mountpoint, partition.mountpoint, device_id
-                        )
-                    else:
-                        logger.debug(
-                            "Skipping duplicate mountpoint %s (device %s already seen as %s)",
-                            partition.mountpoint, device_id, existing.mountpoint
-                        )
-                else:
-                    seen_devices[device_id] = partition
-                    unique_partitions.append(partition)
-            
+                device_id = os.stat(partition.mountpoint).st_dev
             except (OSError, PermissionError) as exc:
                 logger.debug("Cannot stat %s: %s", partition.mountpoint, exc)
                 continue
 
-        return unique_partitions
+            existing = seen_devices.get(device_id)
+            if existing is None:
+                seen_devices[device_id] = partition
+            elif len(partition.mountpoint) < len(existing.mountpoint):
+                # Remplacer le plus long par le plus court
+                del seen_devices[device_id]
+                seen_devices[device_id] = partition
+                logger.debug(
+                    "Replacing %s with shorter %s (same device %s)",
+                    existing.mountpoint, partition.mountpoint, device_id
+                )
+            else:
+                logger.debug(
+                    "Skipping duplicate mountpoint %s (device %s already seen as %s)",
+                    partition.mountpoint, device_id, existing.mountpoint
+                )
+
+        return tuple(seen_devices.values())
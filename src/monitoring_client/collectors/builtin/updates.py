@@ -1,12 +1,68 @@
 import logging
 import os
+import shutil
 import subprocess
+from typing import Optional
 
 from monitoring_client.collectors.base_collector import BaseCollector
+from monitoring_client.core.utils import iter_command_lines, ttl_cached
 
 # Configuration du logger
 logger = logging.getLogger(__name__)
 
+# Gestionnaires de paquets par ordre de préférence (dnf avant yum : yum est
+# souvent un alias de dnf sur les distributions récentes)
+_PACKAGE_MANAGERS = ("apt", "dnf", "yum")
+
+# Version du gestionnaire de paquets : relue au plus toutes les heures, ou dès
+# que le binaire change (mise à jour du paquet)
+_VERSION_CACHE_TTL = 3600
+
+
+@ttl_cached(300)
+def _find_binary(cmd: str) -> Optional[str]:
+    """Chemin exécutable résolu via le PATH (/usr/bin, /bin, /usr/local/bin...), sinon None."""
+    return shutil.which(cmd)
+
+
+def _detect_package_manager() -> Optional[str]:
+    """Premier gestionnaire de paquets disponible parmi _PACKAGE_MANAGERS, sinon None."""
+    for cmd in _PACKAGE_MANAGERS:
+        if _find_binary(cmd):
+            return cmd
+    return None
+
+
+def _mtime_ns(path: str) -> int:
+    """mtime (ns) du fichier, 0 si absent ou illisible."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _get_package_manager_version(cmd: str) -> str:
+    """Version de apt / dnf / yum mémorisée (voir _read_package_manager_version)."""
+    return _package_manager_version_cached(cmd, _mtime_ns(_find_binary(cmd) or ""))
+
+
+@ttl_cached(_VERSION_CACHE_TTL)
+def _package_manager_version_cached(cmd: str, binary_mtime_ns: int) -> str:
+    return _read_package_manager_version(cmd)
+
+
+def _read_package_manager_version(cmd: str) -> str:
+    """Première ligne de `<cmd> --version`, "unknown" si la commande échoue."""
+    version_result = subprocess.run(
+        [cmd, "--version"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        check=False,
+    )
+    return version_result.stdout.strip().split("\n")[0] if version_result.returncode == 0 else "unknown"
+
+
 class PackageUpdatesCollector(BaseCollector):
     """
     Vérifie les mises à jour disponibles selon le gestionnaire de paquets :
@@ -20,11 +76,12 @@ class PackageUpdatesCollector(BaseCollector):
     def _collect_metrics(self):
         metrics = []
 
-        # Vérifier le gestionnaire de paquets et collecter les mises à jour disponibles
-        if os.path.exists("/usr/bin/apt"):
+        # Vérifier le gestionnaire de paquets (détection mise en cache) et
+        # collecter les mises à jour disponibles
+        cmd = _detect_package_manager()
+        if cmd == "apt":
             self._collect_apt(metrics)
-        elif os.path.exists("/usr/bin/yum") or os.path.exists("/usr/bin/dnf"):
-            cmd = "dnf" if os.path.exists("/usr/bin/dnf") else "yum"
+        elif cmd is not None:
             self._collect_yum_dnf(cmd, metrics)
 
         # Retour des métriques collectées
@@ -33,19 +90,16 @@ class PackageUpdatesCollector(BaseCollector):
 
     def _collect_apt(self, metrics):
         try:
-            # Mises à jour disponibles
-            update_check = subprocess.run(
-                ["apt", "list", "--upgradeable"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                universal_newlines=True,
-                check=False,
-            )
-            lines = [l for l in update_check.stdout.strip().split("\n") if l.strip() and "/" in l]
-            updates_available = len(lines)
-
-            # Mises à jour de sécurité (approx : recherche "security" dans la ligne)
-            security_updates = len([l for l in update_check.stdout.split("\n") if "security" in l.lower()])
+            # Mises à jour disponibles : sortie lue au fil de l'eau, un seul
+            # parcours, deux compteurs (ni sortie complète ni listes en mémoire)
+            updates_available = 0
+            security_updates = 0
+            for line in iter_command_lines(["apt", "list", "--upgradeable"]):
+                if "/" in line:
+                    updates_available += 1
+                # Mises à jour de sécurité (approx : recherche "security" dans la ligne)
+                if "security" in line.lower():
+                    security_updates += 1
 
             metrics.extend(
                 [
@@ -70,15 +124,8 @@ class PackageUpdatesCollector(BaseCollector):
                 ]
             )
 
-            # Version APT
-            version_result = subprocess.run(
-                ["apt", "--version"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                universal_newlines=True,
-                check=False,
-            )
-            apt_version = version_result.stdout.strip().split("\n")[0] if version_result.returncode == 0 else "unknown"
+            # Version APT (mise en cache, pas de fork à chaque collecte)
+            apt_version = _get_package_manager_version("apt")
             metrics.append(
                 {
                     "name": "apt.version",
@@ -95,15 +142,11 @@ class PackageUpdatesCollector(BaseCollector):
 
     def _collect_yum_dnf(self, cmd: str, metrics):
         try:
-            result = subprocess.run(
-                [cmd, "check-update", "--quiet"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                universal_newlines=True,
-                check=False,
-            )
             # Heuristique simple : lignes non vides et ne commençant pas par "Last"
-            updates = len([l for l in result.stdout.split("\n") if l.strip() and not l.startswith("Last")])
+            # (sortie lue au fil de l'eau)
+            updates = sum(
+                1 for line in iter_command_lines([cmd, "check-update", "--quiet"]) if not line.startswith("Last")
+            )
             metrics.append(
                 {
                     "name": f"{cmd}.updates_available",
@@ -116,14 +159,7 @@ class PackageUpdatesCollector(BaseCollector):
                 }
             )
 
-            version_result = subprocess.run(
-                [cmd, "--version"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                universal_newlines=True,
-                check=False,
-            )
-            pkg_version = version_result.stdout.strip().split("\n")[0] if version_result.returncode == 0 else "unknown"
+            pkg_version = _get_package_manager_version(cmd)
             metrics.append(
                 {
                     "name": f"{cmd}.version",
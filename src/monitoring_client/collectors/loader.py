@@ -6,24 +6,40 @@ Loader des collecteurs builtin.
 
 """
 
-from typing import List
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Tuple
 
 from monitoring_client.core.logger import get_logger, log_phase
 
 from monitoring_client.collectors.base_collector import BaseCollector, Metric
-from monitoring_client.collectors.builtin.databases import DatabasesCollector
-from monitoring_client.collectors.builtin.docker import DockerCollector
-from monitoring_client.collectors.builtin.firewall import FirewallCollector
-from monitoring_client.collectors.builtin.log_anomalies import LogAnomaliesCollector
-from monitoring_client.collectors.builtin.network import NetworkCollector
-from monitoring_client.collectors.builtin.scheduled_tasks import ScheduledTasksCollector
-from monitoring_client.collectors.builtin.security import SecurityCollector
-from monitoring_client.collectors.builtin.services import ServicesCollector
-from monitoring_client.collectors.builtin.system import SystemCollector
-from monitoring_client.collectors.builtin.updates import PackageUpdatesCollector
+from monitoring_client.collectors import builtin
 
 logger = get_logger(__name__)
 
+# Plafond du nombre de threads de collecte (hôtes contraints) ; défaut : un par collecteur
+MAX_WORKERS_ENV_VAR = "MONITORING_COLLECTORS_MAX_WORKERS"
+
+# Ordre d'exécution / de production des métriques builtin
+_BUILTIN_COLLECTOR_CLASSES = (
+    # Contexte système (hostname, os, uptime, load, etc.)
+    "SystemCollector",
+    # Réseau / firewall
+    "NetworkCollector",
+    "FirewallCollector",
+    # Packages & updates
+    "PackageUpdatesCollector",
+    # Services / sécurité / tâches
+    "ServicesCollector",
+    "SecurityCollector",
+    "ScheduledTasksCollector",
+    "LogAnomaliesCollector",
+    # Runtime / DB
+    "DockerCollector",
+    "DatabasesCollector",
+)
+
 
 def get_builtin_collectors() -> List[BaseCollector]:
     """
@@ -34,42 +50,76 @@ def get_builtin_collectors() -> List[BaseCollector]:
     """
     # Si plus tard tu veux activer / désactiver certains collectors via config,
     # tu pourras filtrer ici.
-    return [
-        # Contexte système (hostname, os, uptime, load, etc.)
-        SystemCollector(),
-        # Réseau / firewall
-        NetworkCollector(),
-        FirewallCollector(),
-        # Packages & updates
-        PackageUpdatesCollector(),
-        # Services / sécurité / tâches
-        ServicesCollector(),
-        SecurityCollector(),
-        ScheduledTasksCollector(),
-        LogAnomaliesCollector(),
-        # Runtime / DB
-        DockerCollector(),
-        DatabasesCollector(),
-    ]
-
-
-def run_builtin_collectors() -> List[Metric]:
+    # Copie de la liste : les instances (sans état) sont partagées, la liste non.
+    return list(_builtin_collector_instances())
+
+
+@functools.lru_cache(maxsize=1)
+def _builtin_collector_instances() -> Tuple[BaseCollector, ...]:
+    """
+    Instancie une seule fois les collecteurs builtin, réutilisés d'une collecte à l'autre.
+
+    Les collecteurs ne portent aucun état d'instance (les caches sont au niveau
+    module) : une instance peut servir à plusieurs collectes successives.
+    Les modules sont importés à la demande (cf. collectors/builtin/__init__.py).
+    """
+    return tuple(getattr(builtin, class_name)() for class_name in _BUILTIN_COLLECTOR_CLASSES)
+
+
+def _resolve_max_workers(max_workers: Optional[int], collector_count: int) -> int:
+    """
+    Nombre de threads de collecte : argument explicite, sinon MONITORING_COLLECTORS_MAX_WORKERS,
+    sinon un thread par collecteur. Toujours borné à [1, collector_count].
+    """
+    if max_workers is None:
+        raw = os.environ.get(MAX_WORKERS_ENV_VAR)
+        if raw is not None:
+            try:
+                max_workers = int(raw)
+            except ValueError:
+                logger.warning("Variable d'environnement %s invalide (int attendu), ignorée.", MAX_WORKERS_ENV_VAR)
+    if max_workers is None:
+        return collector_count
+    return max(1, min(max_workers, collector_count))
+
+
+def iter_builtin_metrics(max_workers: Optional[int] = None) -> Iterator[Metric]:
+    """
+    Exécute les collecteurs builtin en parallèle et produit leurs métriques au fil de l'eau.
+
+    Les collecteurs sont dominés par des attentes I/O (subprocess, /proc, psutil)
+    qui relâchent le GIL : un thread par collecteur ramène la durée totale à celle
+    du plus lent. L'ordre des collecteurs est conservé dans le flux produit
+    (collect() ne lève jamais d'exception, cf. BaseCollector).
+
+    max_workers : plafond de threads (cf. _resolve_max_workers).
+    """
+    collectors = get_builtin_collectors()
+    workers = _resolve_max_workers(max_workers, len(collectors))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="collector") as executor:
+        for collector, metrics in zip(collectors, executor.map(_run_collector, collectors)):
+            if not metrics:
+                logger.debug("Aucune métrique retournée par le collecteur '%s'", collector.name)
+            yield from metrics
+
+
+def _run_collector(collector: BaseCollector) -> List[Metric]:
+    return collector.collect()
+
+
+def run_builtin_collectors(max_workers: Optional[int] = None) -> List[Metric]:
     """
     Exécute tous les collecteurs builtin et concatène leurs métriques.
 
+    max_workers : plafond de threads de collecte (défaut : un par collecteur,
+    ou MONITORING_COLLECTORS_MAX_WORKERS si défini).
+
     Retour :
       - Liste de métriques (dicts) prêtes à être intégrées dans le payload.
     """
     log_phase(logger, "collectors.builtin.run", "Exécution de tous les collecteurs builtin")
 
-    all_metrics: List[Metric] = []
-    collectors = get_builtin_collectors()
-
-    for collector in collectors:
-        metrics = collector.collect()
-        if not metrics:
-            logger.debug("Aucune métrique retournée par le collecteur '%s'", collector.name)
-        all_metrics.extend(metrics)
+    all_metrics: List[Metric] = list(iter_builtin_metrics(max_workers))
 
     logger.info("Nombre total de métriques builtin collectées: %d", len(all_metrics))
     return all_metrics
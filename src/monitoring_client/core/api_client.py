@@ -1,14 +1,46 @@
+import hashlib
 import json
+import logging
+import random
 import time
 from dataclasses import dataclass
 from typing import Any, Dict, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from monitoring_client.core.logger import get_logger, log_phase
 
 logger = get_logger(__name__)
 
+# Un seul hôte cible, un envoi à la fois : petit pool keep-alive réutilisé
+# entre les tentatives (pas de nouvelle poignée de main TCP/TLS par retry)
+_POOL_CONNECTIONS = 1
+_POOL_MAXSIZE = 4
+
+# Taille maximale du corps de réponse repris dans les messages d'erreur
+_ERROR_BODY_MAX_CHARS = 512
+
+
+try:  # sérialiseur natif optionnel : bytes UTF-8 produits directement, sans str intermédiaire
+    import orjson
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    orjson = None
+
+
+def _dumps_payload(payload: Dict[str, Any]) -> bytes:
+    """
+    Sérialise le payload en JSON UTF-8 (orjson si disponible, sinon json stdlib).
+
+    Repli sur json si orjson refuse une valeur (clé non str, entier > 64 bits...).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload)
+        except TypeError:
+            pass
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
 
 @dataclass
 class APIClientConfig:
@@ -25,6 +57,8 @@ class APIClientConfig:
     timeout_seconds: float = 5.0
     max_retries: int = 3
     verify_ssl: Union[bool, str] = True
+    # Plafond du délai entre deux tentatives (avant jitter)
+    max_backoff_seconds: float = 30.0
 
 
 class APIClientError(Exception):
@@ -46,7 +80,6 @@ class APIClient:
 
     def __init__(self, config: APIClientConfig, session: Optional[requests.Session] = None) -> None:
         self._config = config
-        self._session = session or requests.Session()
 
         # Préparation des en-têtes de base
         self._base_headers = {
@@ -54,7 +87,21 @@ class APIClient:
             "Accept": "application/json",
             config.api_key_header: config.api_key,
         }
-        
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            # Session propre au client : en-têtes posés une fois, hérités par chaque requête
+            session.headers.update(self._base_headers)
+            self._post_kwargs: Dict[str, Any] = {}
+        else:
+            # Session fournie par l'appelant : elle n'est pas modifiée (la clé API ne doit
+            # pas fuiter vers ses autres requêtes), en-têtes passés à chaque envoi
+            self._post_kwargs = {"headers": self._base_headers}
+        self._session = session
+
         # Log SSL configuration
         if isinstance(config.verify_ssl, str):
             logger.info("SSL: Utilisation du certificat CA custom : %s", config.verify_ssl)
@@ -83,8 +130,15 @@ class APIClient:
         """
         log_phase(logger, "api.request", "Envoi du payload de métriques au serveur")
 
-        body = json.dumps(payload, ensure_ascii=False)
-        logger.debug("Payload JSON prêt à l'envoi: %s", body)
+        body = _dumps_payload(payload)
+        if logger.isEnabledFor(logging.DEBUG):
+            # Taille + empreinte courte (corrélation avec les logs serveur) : le
+            # contenu, potentiellement volumineux, n'est ni décodé ni loggué
+            logger.debug(
+                "Payload JSON prêt à l'envoi (%d octets, blake2b=%s)",
+                len(body),
+                hashlib.blake2b(body, digest_size=8).hexdigest(),
+            )
 
         attempt = 0
         last_exc: Optional[Exception] = None
@@ -101,17 +155,17 @@ class APIClient:
 
                 response = self._session.post(
                     self.metrics_url,
-                    headers=self._base_headers,
-                    data=body.encode("utf-8"),
+                    data=body,
                     timeout=self._config.timeout_seconds,
                     verify=self._config.verify_ssl,
+                    **self._post_kwargs,
                 )
 
-                # Logging de base
+                # Logging de base (longueur annoncée : le corps n'est pas lu pour ce log)
                 logger.debug(
                     "Réponse HTTP reçue (status=%s, length=%s)",
                     response.status_code,
-                    len(response.content or b""),
+                    response.headers.get("Content-Length", "?"),
                 )
 
                 # Statuts 2xx : succès
@@ -125,14 +179,18 @@ class APIClient:
                         "Erreur client HTTP %s lors de l'envoi des métriques, pas de retry.",
                         response.status_code,
                     )
-                    raise APIClientError(f"Erreur client HTTP {response.status_code}: {response.text}")
+                    raise APIClientError(
+                        f"Erreur client HTTP {response.status_code}: {response.text[:_ERROR_BODY_MAX_CHARS]}"
+                    )
 
                 # Statuts 5xx : retry possible
                 logger.warning(
                     "Erreur serveur HTTP %s, tentative de retry...",
                     response.status_code,
                 )
-                last_exc = APIClientError(f"Erreur serveur HTTP {response.status_code}: {response.text}")
+                last_exc = APIClientError(
+                    f"Erreur serveur HTTP {response.status_code}: {response.text[:_ERROR_BODY_MAX_CHARS]}"
+                )
 
             except requests.exceptions.SSLError as exc:
                 logger.error(
@@ -156,7 +214,7 @@ class APIClient:
 
             # Si on arrive ici, on va éventuellement retenter
             if attempt < self._config.max_retries:
-                sleep_seconds = self._compute_backoff(attempt)
+                sleep_seconds = self._compute_backoff(attempt, self._config.max_backoff_seconds)
                 logger.info("Attente de %.1f s avant la prochaine tentative.", sleep_seconds)
                 time.sleep(sleep_seconds)
 
@@ -166,16 +224,20 @@ class APIClient:
         raise APIClientError(msg) from last_exc
 
     @staticmethod
-    def _compute_backoff(attempt: int) -> float:
+    def _compute_backoff(attempt: int, max_backoff: float = 30.0) -> float:
         """
-        Calcule le délai de retry exponentiel.
+        Calcule le délai de retry exponentiel, plafonné à max_backoff, avec jitter.
 
         attempt commence à 1 pour la première tentative.
-        Exemple: tentative 1 -> 1s, 2 -> 2s, 3 -> 4s, etc.
+        Exemple (avant jitter): tentative 1 -> 1s, 2 -> 2s, 3 -> 4s, etc.
+        Le délai effectif est tiré dans [délai/2, délai] : des clients démarrés
+        ensemble (timer systemd) ne retentent pas tous au même instant.
         """
         base = 1.0
-        # (attempt - 1) pour que la première fois ce soit 1 seconde
-        return base * (2 ** (attempt - 1))
+        # (attempt - 1) pour que la première fois ce soit 1 seconde ; exposant
+        # borné pour ne pas calculer d'entiers démesurés avec max_retries élevé
+        delay = min(max_backoff, base * (2 ** min(attempt - 1, 32)))
+        return delay * (0.5 + random.random() * 0.5)
 
 
 # Helpers d'intégration (optionnels) si on veut créer un client depuis Config (Tâche 1)
@@ -1,19 +1,31 @@
+import copy
+import functools
 import json
-import jsonschema
 import os
-import yaml
+import sys
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 
 from monitoring_client.core.logger import get_logger, log_phase
+from monitoring_client.core.utils import compile_schema_validator
 
 logger = get_logger(__name__)
 
+# Désactive la validation JSON Schema (ex: démarrages répétés en CI)
+SKIP_VALIDATION_ENV_VAR = "MONITORING_SKIP_VALIDATION"
+# Active le cache JSON pré-parsé à côté des fichiers YAML (opt-in : installs en lecture seule)
+JSON_CACHE_ENV_VAR = "MONITORING_CONFIG_JSON_CACHE"
 
-@dataclass
+# Objets de config immuables ; __slots__ générés quand Python le permet (>= 3.10)
+_CONFIG_DATACLASS_OPTIONS: Dict[str, Any] = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _CONFIG_DATACLASS_OPTIONS["slots"] = True
+
+
+@dataclass(**_CONFIG_DATACLASS_OPTIONS)
 class ApiConfig:
     base_url: str
     ssl_verify: bool
@@ -26,7 +38,7 @@ class ApiConfig:
     api_key_env_var: Optional[str]
 
 
-@dataclass
+@dataclass(**_CONFIG_DATACLASS_OPTIONS)
 class PathsConfig:
     builtin_collectors_dir: str
     vendors_dir: str
@@ -34,14 +46,14 @@ class PathsConfig:
     logs_dir: Optional[str]
 
 
-@dataclass
+@dataclass(**_CONFIG_DATACLASS_OPTIONS)
 class MachineConfig:
     hostname_source: str
     hostname_override: Optional[str]
     os_override: Optional[str]
 
 
-@dataclass
+@dataclass(**_CONFIG_DATACLASS_OPTIONS)
 class FingerprintConfig:
     method: str
     salt: Optional[str]
@@ -49,7 +61,7 @@ class FingerprintConfig:
     cache_file: Optional[str]
 
 
-@dataclass
+@dataclass(**_CONFIG_DATACLASS_OPTIONS)
 class LoggingConfig:
     level: str
     format: str
@@ -58,14 +70,14 @@ class LoggingConfig:
     file_name: Optional[str]
 
 
-@dataclass
+@dataclass(**_CONFIG_DATACLASS_OPTIONS)
 class ClientConfig:
     name: str
     version: str
     schema_version: str
 
 
-@dataclass
+@dataclass(**_CONFIG_DATACLASS_OPTIONS)
 class Config:
     client: ClientConfig
     api: ApiConfig
@@ -78,6 +90,65 @@ class Config:
     # Chemin de base pour résolution des chemins relatifs
     base_dir: Path
 
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any], base_dir: Path, resolved_api_key: str) -> "Config":
+        """
+        Construit la configuration typée à partir du dict fusionné et validé.
+
+        Toutes les sections sont dépaquetées ici, en un seul appel.
+        """
+        client = raw["client"]
+        api = raw["api"]
+        paths = raw["paths"]
+        machine = raw["machine"]
+        fingerprint = raw["fingerprint"]
+        logging_raw = raw["logging"]
+
+        return cls(
+            client=ClientConfig(
+                name=client["name"],
+                version=client["version"],
+                schema_version=client["schema_version"],
+            ),
+            api=ApiConfig(
+                base_url=api["base_url"].rstrip("/"),
+                ssl_verify=bool(api.get("ssl_verify", True)),
+                ssl_cert_path=api.get("ssl_cert_path"),
+                metrics_endpoint=api["metrics_endpoint"],
+                timeout_seconds=float(api["timeout_seconds"]),
+                max_retries=int(api["max_retries"]),
+                api_key_header=api["api_key_header"],
+                api_key_file=api["api_key_file"],
+                api_key_env_var=api.get("api_key_env_var"),
+            ),
+            paths=PathsConfig(
+                builtin_collectors_dir=paths["builtin_collectors_dir"],
+                vendors_dir=paths["vendors_dir"],
+                data_dir=paths["data_dir"],
+                logs_dir=paths.get("logs_dir"),
+            ),
+            machine=MachineConfig(
+                hostname_source=machine["hostname_source"],
+                hostname_override=machine.get("hostname_override"),
+                os_override=machine.get("os_override"),
+            ),
+            fingerprint=FingerprintConfig(
+                method=fingerprint["method"],
+                salt=fingerprint.get("salt"),
+                force_recompute=bool(fingerprint.get("force_recompute", False)),
+                cache_file=fingerprint.get("cache_file"),
+            ),
+            logging=LoggingConfig(
+                level=logging_raw["level"],
+                format=logging_raw["format"],
+                console_enabled=bool(logging_raw["console_enabled"]),
+                file_enabled=bool(logging_raw["file_enabled"]),
+                file_name=logging_raw.get("file_name"),
+            ),
+            resolved_api_key=resolved_api_key,
+            base_dir=base_dir,
+        )
+
 
 class ConfigError(Exception):
     """Erreur de configuration invalide ou introuvable."""
@@ -123,29 +194,13 @@ class ConfigLoader:
         defaults = self._read_config_file(self.defaults_path)
         overrides = self._read_config_file(self.config_path)
         self._validate_override_keys(defaults, overrides)
-        schema = self._read_schema_file(self.schema_path)
         raw_config = self._deep_merge(defaults, overrides)
         raw_config = self._apply_env_overrides(raw_config)
-        self._validate_against_schema(raw_config, schema)
-        client_cfg = self._build_client_config(raw_config["client"])
-        api_cfg = self._build_api_config(raw_config["api"])
-        paths_cfg = self._build_paths_config(raw_config["paths"])
-        machine_cfg = self._build_machine_config(raw_config["machine"])
-        fingerprint_cfg = self._build_fingerprint_config(raw_config["fingerprint"])
-        logging_cfg = self._build_logging_config(raw_config["logging"])
-
-        resolved_api_key = self._resolve_api_key(api_cfg, self.base_dir)
-
-        return Config(
-            client=client_cfg,
-            api=api_cfg,
-            paths=paths_cfg,
-            machine=machine_cfg,
-            fingerprint=fingerprint_cfg,
-            logging=logging_cfg,
-            resolved_api_key=resolved_api_key,
-            base_dir=self.base_dir,
-        )
+        self._validate_against_schema(raw_config)
+
+        resolved_api_key = self._resolve_api_key(raw_config["api"], self.base_dir)
+
+        return Config.from_raw(raw_config, base_dir=self.base_dir, resolved_api_key=resolved_api_key)
 
     # ---- Lectures brutes ----
 
@@ -154,17 +209,19 @@ class ConfigLoader:
             raise ConfigError(f"Fichier de configuration introuvable : {path}")
 
         try:
-            with path.open("r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+            st = path.stat()
+            data = _load_yaml(str(path.resolve()), st.st_mtime_ns, st.st_size)
         except Exception as exc:
             raise ConfigError(f"Impossible de lire le fichier de configuration : {exc}") from exc
 
         if not isinstance(data, dict):
             raise ConfigError("Le fichier de configuration doit contenir un objet YAML racine.")
 
-        return data
+        # Copie profonde : les overrides env modifient le dict, le cache doit rester intact
+        return copy.deepcopy(data)
 
-    def _read_schema_file(self, path: Path) -> Dict[str, Any]:
+    @staticmethod
+    def _read_schema_file(path: Path) -> Dict[str, Any]:
         if not path.is_file():
             raise ConfigError(f"Schéma de configuration introuvable : {path}")
 
@@ -181,11 +238,18 @@ class ConfigLoader:
 
     # ---- Validation schéma ----
 
-    def _validate_against_schema(self, config: Dict[str, Any], schema: Dict[str, Any]) -> None:
+    def _validate_against_schema(self, config: Dict[str, Any]) -> None:
+        if os.getenv(SKIP_VALIDATION_ENV_VAR) == "1":
+            logger.debug("Validation du schéma désactivée (%s=1)", SKIP_VALIDATION_ENV_VAR)
+            return
+
         try:
-            jsonschema.validate(instance=config, schema=schema)
-        except jsonschema.ValidationError as exc:
-            raise ConfigError(f"Configuration invalide : {exc.message}") from exc
+            mtime_ns = self.schema_path.stat().st_mtime_ns
+        except OSError as exc:
+            raise ConfigError(f"Schéma de configuration introuvable : {self.schema_path}") from exc
+
+        validate = _get_validator(str(self.schema_path), mtime_ns)
+        validate(config)
 
     # ---- Overrides env ----
 
@@ -206,116 +270,58 @@ class ConfigLoader:
         api = config.get("api", {})
         paths = config.get("paths", {})
 
-        env_overrides: Tuple[Tuple[str, str, Dict[str, Any]], ...] = (
-            ("MONITORING_API_BASE_URL", "base_url", api),
-            ("MONITORING_API_TIMEOUT", "timeout_seconds", api),
-            ("MONITORING_API_MAX_RETRIES", "max_retries", api),
-            ("MONITORING_VENDORS_DIR", "vendors_dir", paths),
-            ("MONITORING_BUILTIN_DIR", "builtin_collectors_dir", paths),
-            ("MONITORING_DATA_DIR", "data_dir", paths),
+        env_overrides: Tuple[Tuple[str, str, Dict[str, Any], Callable[[str], Any]], ...] = (
+            ("MONITORING_API_BASE_URL", "base_url", api, str),
+            ("MONITORING_API_TIMEOUT", "timeout_seconds", api, float),
+            ("MONITORING_API_MAX_RETRIES", "max_retries", api, int),
+            ("MONITORING_VENDORS_DIR", "vendors_dir", paths, str),
+            ("MONITORING_BUILTIN_DIR", "builtin_collectors_dir", paths, str),
+            ("MONITORING_DATA_DIR", "data_dir", paths, str),
         )
 
-        for env_var, key, target in env_overrides:
-            val = os.getenv(env_var)
+        environ = os.environ
+        for env_var, key, target, convert in env_overrides:
+            val = environ.get(env_var)
             if val is None:
                 continue
 
-            if key in ("timeout_seconds",):
-                try:
-                    target[key] = float(val)
-                except ValueError:
-                    logger.warning("Variable d'environnement %s invalide (float attendu), ignorée.", env_var)
-            elif key in ("max_retries",):
-                try:
-                    target[key] = int(val)
-                except ValueError:
-                    logger.warning("Variable d'environnement %s invalide (int attendu), ignorée.", env_var)
-            else:
-                target[key] = val
+            try:
+                target[key] = convert(val)
+            except ValueError:
+                logger.warning(
+                    "Variable d'environnement %s invalide (%s attendu), ignorée.", env_var, convert.__name__
+                )
 
         config["api"] = api
         config["paths"] = paths
         return config
 
-    # ---- Builders ----
-
-    def _build_client_config(self, raw: Dict[str, Any]) -> ClientConfig:
-        return ClientConfig(
-            name=raw["name"],
-            version=raw["version"],
-            schema_version=raw["schema_version"],
-        )
-
-    def _build_api_config(self, raw: Dict[str, Any]) -> ApiConfig:
-        return ApiConfig(
-            base_url=raw["base_url"].rstrip("/"),
-            ssl_verify=bool(raw.get("ssl_verify", True)),
-            ssl_cert_path=raw.get("ssl_cert_path"),
-            metrics_endpoint=raw["metrics_endpoint"],
-            timeout_seconds=float(raw["timeout_seconds"]),
-            max_retries=int(raw["max_retries"]),
-            api_key_header=raw["api_key_header"],
-            api_key_file=raw["api_key_file"],
-            api_key_env_var=raw.get("api_key_env_var"),
-        )
-
-    def _build_paths_config(self, raw: Dict[str, Any]) -> PathsConfig:
-        return PathsConfig(
-            builtin_collectors_dir=raw["builtin_collectors_dir"],
-            vendors_dir=raw["vendors_dir"],
-            data_dir=raw["data_dir"],
-            logs_dir=raw.get("logs_dir"),
-        )
-
-    def _build_machine_config(self, raw: Dict[str, Any]) -> MachineConfig:
-        return MachineConfig(
-            hostname_source=raw["hostname_source"],
-            hostname_override=raw.get("hostname_override"),
-            os_override=raw.get("os_override"),
-        )
-
-    def _build_fingerprint_config(self, raw: Dict[str, Any]) -> FingerprintConfig:
-        return FingerprintConfig(
-            method=raw["method"],
-            salt=raw.get("salt"),
-            force_recompute=bool(raw.get("force_recompute", False)),
-            cache_file=raw.get("cache_file"),
-        )
-
-    def _build_logging_config(self, raw: Dict[str, Any]) -> LoggingConfig:
-        return LoggingConfig(
-            level=raw["level"],
-            format=raw["format"],
-            console_enabled=bool(raw["console_enabled"]),
-            file_enabled=bool(raw["file_enabled"]),
-            file_name=raw.get("file_name"),
-        )
-
     # ---- Résolution clé API ----
 
-    def _resolve_api_key(self, api_cfg: ApiConfig, base_dir: Path) -> str:
+    def _resolve_api_key(self, raw_api: Dict[str, Any], base_dir: Path) -> str:
         """
-        Résout la clé API à utiliser.
+        Résout la clé API à utiliser (depuis la section "api" brute, déjà validée).
 
         Priorité :
-          1. Variable d'environnement nommée api_cfg.api_key_env_var (si définie et non vide).
-          2. Contenu du fichier api_cfg.api_key_file.
+          1. Variable d'environnement nommée api.api_key_env_var (si définie et non vide).
+          2. Contenu du fichier api.api_key_file.
         """
         log_phase(logger, "config.api_key", "Résolution de la clé API")
 
-        if api_cfg.api_key_env_var:
-            env_val = os.getenv(api_cfg.api_key_env_var)
+        api_key_env_var = raw_api.get("api_key_env_var")
+        if api_key_env_var:
+            env_val = os.getenv(api_key_env_var)
             if env_val:
                 return env_val.strip()
 
-        api_key_path = self._resolve_path(api_cfg.api_key_file, base_dir)
-        if not api_key_path.is_file():
+        api_key_path = self._resolve_path(raw_api["api_key_file"], base_dir)
+        # Lecture directe (pas de is_file() préalable) : l'absence est détectée par l'exception
+        try:
+            content = api_key_path.read_bytes().decode("utf-8")
+        except (FileNotFoundError, IsADirectoryError) as exc:
             raise ConfigError(
                 f"Fichier de clé API introuvable : {api_key_path} " "(ou variable d'environnement non définie)"
-            )
-
-        try:
-            content = api_key_path.read_text(encoding="utf-8")
+            ) from exc
         except Exception as exc:
             raise ConfigError(f"Impossible de lire la clé API : {exc}") from exc
 
@@ -328,10 +334,7 @@ class ConfigLoader:
     @staticmethod
     def _resolve_path(path_str: str, base_dir: Path) -> Path:
         """Résout un chemin relatif par rapport à base_dir."""
-        path = Path(path_str)
-        if not path.is_absolute():
-            path = base_dir / path
-        return path
+        return _resolve_path_cached(path_str, str(base_dir))
 
     @staticmethod
     def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
@@ -359,4 +362,98 @@ class ConfigLoader:
             if isinstance(overrides[key], dict) and isinstance(defaults.get(key), dict):
                 self._validate_override_keys(
                     defaults[key], overrides[key], path=f"{path}{key}."
-                )
\ No newline at end of file
+                )
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_path_cached(path_str: str, base_dir: str) -> Path:
+    """Version mémoïsée de ConfigLoader._resolve_path (clés str : hashables et compactes)."""
+    path = Path(path_str)
+    return path if path.is_absolute() else Path(base_dir) / path
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml(path_str: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse un fichier YAML, mis en cache par (chemin résolu, mtime_ns, taille).
+
+    Le résultat est partagé entre appels : ne jamais le modifier directement
+    (voir ConfigLoader._read_config_file qui en retourne une copie).
+    """
+    use_json_cache = os.getenv(JSON_CACHE_ENV_VAR) == "1"
+    cache_path = path_str + ".cache.json"
+
+    if use_json_cache:
+        cached = _read_json_cache(cache_path, mtime_ns, size)
+        if cached is not None:
+            return cached
+
+    import yaml
+
+    with open(path_str, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_yaml_safe_loader()) or {}
+
+    if use_json_cache:
+        _write_json_cache(cache_path, mtime_ns, size, data)
+    return data
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_safe_loader() -> Any:
+    """Retourne le loader YAML sûr le plus rapide disponible (libyaml recommandé)."""
+    try:
+        from yaml import CSafeLoader
+
+        return CSafeLoader
+    except ImportError:  # pragma: no cover - PyYAML compilé sans libyaml
+        from yaml import SafeLoader
+
+        return SafeLoader
+
+
+def _read_json_cache(cache_path: str, mtime_ns: int, size: int) -> Optional[Any]:
+    """Retourne les données du cache JSON si son tampon correspond au YAML (mtime + taille)."""
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(payload, dict)
+        or payload.get("source_mtime_ns") != mtime_ns
+        or payload.get("source_size") != size
+    ):
+        return None
+    return payload.get("data")
+
+
+def _write_json_cache(cache_path: str, mtime_ns: int, size: int, data: Any) -> None:
+    """Écrit le cache JSON de façon atomique (fichier temporaire + os.replace)."""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"source_mtime_ns": mtime_ns, "source_size": size, "data": data}, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as exc:
+        # Répertoire en lecture seule ou valeur YAML non sérialisable en JSON
+        logger.debug("Cache JSON de configuration non écrit (%s): %s", cache_path, exc)
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=8)
+def _get_validator(schema_path: str, mtime_ns: int) -> Callable[[Dict[str, Any]], None]:
+    """
+    Construit (une seule fois par couple chemin/mtime) la fonction de validation.
+
+    La fonction retournée lève ConfigError si la configuration est invalide.
+    Une modification du fichier (mtime différent) invalide naturellement le cache.
+    """
+    schema = ConfigLoader._read_schema_file(Path(schema_path))
+    try:
+        return compile_schema_validator(schema, lambda message: ConfigError(f"Configuration invalide : {message}"))
+    except ValueError as exc:
+        raise ConfigError(f"Schéma de configuration invalide : {exc}") from exc
@@ -1,8 +1,8 @@
-import hashlib
+import functools
 import logging
 import os
+import re
 import socket
-import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -10,6 +10,8 @@ from monitoring_client.core.logger import get_logger, log_phase
 
 logger = get_logger(__name__)
 
+_HEX12 = re.compile(r"[0-9a-fA-F]{12}").fullmatch
+
 
 class FingerprintError(Exception):
     """Erreur lors de la génération du fingerprint."""
@@ -29,6 +31,8 @@ def _run_command(cmd: List[str], timeout: float = 2.0) -> str:
     Exécute une commande système de manière sûre pour la collecte d'infos
     (dmidecode, lscpu, etc.). En cas d'erreur, retourne une chaîne vide.
     """
+    import subprocess
+
     try:
         result = subprocess.run(
             cmd,
@@ -51,21 +55,13 @@ def _normalize_mac(address: str) -> Optional[str]:
 
     Retourne None si l'adresse ne semble pas valide.
     """
-    addr = address.strip().lower()
-    if not addr or addr == "00:00:00:00:00:00":
-        return None
-
     # Certains systèmes peuvent retourner des MAC sans les ":" (ex: 4c1fccaabbcc)
-    addr = addr.replace("-", "").replace(":", "")
-    if len(addr) != 12:
-        return None
-
-    try:
-        int(addr, 16)
-    except ValueError:
+    addr = address.strip().replace("-", "").replace(":", "")
+    if len(addr) != 12 or not _HEX12(addr) or addr == "000000000000":
         return None
 
-    return ":".join(addr[i : i + 2] for i in range(0, 12, 2)).upper()
+    a = addr.upper()
+    return f"{a[0:2]}:{a[2:4]}:{a[4:6]}:{a[6:8]}:{a[8:10]}:{a[10:12]}"
 
 
 def _collect_mac_addresses() -> List[str]:
@@ -77,14 +73,28 @@ def _collect_mac_addresses() -> List[str]:
     """
     macs: List[str] = []
 
-    sys_class_net = Path("/sys/class/net")
-    if sys_class_net.is_dir():
-        for iface in sys_class_net.iterdir():
-            addr_file = iface / "address"
-            raw = _read_file_safely(addr_file)
-            normalized = _normalize_mac(raw) if raw else None
-            if normalized:
-                macs.append(normalized)
+    try:
+        with os.scandir("/sys/class/net") as entries:
+            address_files = [f"{entry.path}/address" for entry in entries]
+    except OSError:
+        logger.debug("Répertoire /sys/class/net indisponible pour le fingerprint")
+        address_files = []
+
+    # Lecture brute par fd (open/read/close) : pas de stat ni de TextIOWrapper par interface
+    for address_file in address_files:
+        try:
+            fd = os.open(address_file, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            raw = os.read(fd, 64).decode("ascii", "ignore")
+        except OSError:
+            continue
+        finally:
+            os.close(fd)
+        normalized = _normalize_mac(raw) if raw else None
+        if normalized:
+            macs.append(normalized)
 
     # Fallback de sécurité : au moins une MAC issue de uuid.getnode()
     if not macs:
@@ -105,11 +115,12 @@ def _collect_cpu_id() -> str:
     """
     Tente d'extraire un identifiant CPU stable.
 
-    Sous Linux :
-      - lecture de /proc/cpuinfo
-      - éventuellement utilisation de lscpu
+    Sous Linux : lecture de /proc/cpuinfo (champ "Serial" si présent).
     Si rien de spécifique n'est trouvable, on hash le contenu brut de /proc/cpuinfo.
+    Pas de fallback lscpu : il lit lui-même /proc/cpuinfo, inutile de forker.
     """
+    import hashlib
+
     cpuinfo_path = Path("/proc/cpuinfo")
     cpuinfo = _read_file_safely(cpuinfo_path)
 
@@ -125,20 +136,25 @@ def _collect_cpu_id() -> str:
         # À défaut, on utilise un hash du contenu de /proc/cpuinfo
         return hashlib.sha256(cpuinfo.encode("utf-8", errors="ignore")).hexdigest()
 
-    # Fallback : lscpu
-    lscpu = _run_command(["lscpu"])
-    if lscpu:
-        return hashlib.sha256(lscpu.encode("utf-8", errors="ignore")).hexdigest()
-
     return ""
 
 
 def _collect_dmidecode_uuid() -> str:
     """
-    Tente de récupérer l'uuid système via dmidecode.
+    Récupère l'uuid système (SMBIOS).
 
-    Requiert généralement les privilèges root. En cas d'échec, retourne une chaîne vide.
+    Lecture directe de /sys/class/dmi/id/product_uuid (même valeur que dmidecode,
+    sans fork). Fallback dmidecode uniquement en root, si sysfs n'a rien donné.
+    En cas d'échec, retourne une chaîne vide.
     """
+    sysfs_uuid = _read_file_safely(Path("/sys/class/dmi/id/product_uuid")).strip()
+    if sysfs_uuid:
+        # dmidecode affiche l'uuid en majuscules : on conserve ce format
+        return sysfs_uuid.upper()
+
+    if not hasattr(os, "geteuid") or os.geteuid() != 0:
+        return ""
+
     dmidecode_output = _run_command(["dmidecode", "-s", "system-uuid"])
     if dmidecode_output:
         return dmidecode_output.strip()
@@ -154,7 +170,15 @@ def collect_fingerprint_components() -> Dict[str, str]:
       - macs (liste jointe par ",")
       - cpu_id
       - dmidecode_uuid
+
+    Les composants ne changent pas pendant la vie du processus : la collecte
+    (/sys, /proc, dmidecode) n'est faite qu'une fois, chaque appel reçoit une copie.
     """
+    return dict(_collect_fingerprint_components_cached())
+
+
+@functools.lru_cache(maxsize=1)
+def _collect_fingerprint_components_cached() -> Dict[str, str]:
     hostname = socket.gethostname() or ""
 
     macs = _collect_mac_addresses()
@@ -174,22 +198,29 @@ def collect_fingerprint_components() -> Dict[str, str]:
     return components
 
 
-def _compute_fingerprint_string(components: Dict[str, str], salt: Optional[str] = None) -> str:
+def _hash_components(components: Dict[str, str], salt: Optional[str] = None) -> str:
     """
-    Construit la chaîne source du fingerprint à partir des composants + salt.
+    Hash SHA256 (hex) des composants + salt, alimenté champ par champ.
 
-    Format déterministe et stable (ajouter des champs à la fin si besoin).
+    Octets hashés identiques à l'ancienne chaîne source
+    "hostname=...|macs=...|cpu_id=...|dmidecode_uuid=...[|salt=...]" :
+    le fingerprint reste stable. Format déterministe (ajouter des champs à la fin si besoin).
     """
-    parts = [
-        f"hostname={components.get('hostname', '')}",
-        f"macs={components.get('macs', '')}",
-        f"cpu_id={components.get('cpu_id', '')}",
-        f"dmidecode_uuid={components.get('dmidecode_uuid', '')}",
-    ]
+    import hashlib
+
+    h = hashlib.sha256()
+    h.update(b"hostname=")
+    h.update(components.get("hostname", "").encode("utf-8", "ignore"))
+    h.update(b"|macs=")
+    h.update(components.get("macs", "").encode("utf-8", "ignore"))
+    h.update(b"|cpu_id=")
+    h.update(components.get("cpu_id", "").encode("utf-8", "ignore"))
+    h.update(b"|dmidecode_uuid=")
+    h.update(components.get("dmidecode_uuid", "").encode("utf-8", "ignore"))
     if salt:
-        parts.append(f"salt={salt}")
-
-    return "|".join(parts)
+        h.update(b"|salt=")
+        h.update(salt.encode("utf-8", "ignore"))
+    return h.hexdigest()
 
 
 def _load_cached_fingerprint(cache_path: Path) -> Optional[str]:
@@ -226,12 +257,28 @@ def generate_fingerprint(
       - cache_path : si fourni, permet de mettre en cache / relire le fingerprint.
       - force_recompute : ignore le cache et recalcule si True.
 
+    Le résultat est mémoïsé pour le processus (clé : paramètres) ; force_recompute
+    vide cette mémoïsation ainsi que celle des composants.
+
     Retour :
       - Chaîne hexadécimale SHA256.
 
     Exceptions :
       - FingerprintError si un problème critique survient.
     """
+    if force_recompute:
+        _generate_fingerprint_cached.cache_clear()
+        _collect_fingerprint_components_cached.cache_clear()
+
+    return _generate_fingerprint_cached(method, salt, str(cache_path) if cache_path else None, force_recompute)
+
+
+@functools.lru_cache(maxsize=8)
+def _generate_fingerprint_cached(
+    method: str, salt: Optional[str], cache_path_str: Optional[str], force_recompute: bool
+) -> str:
+    cache_path = Path(cache_path_str) if cache_path_str else None
+
     log_phase(logger, "fingerprint.compute", "Calcul du fingerprint serveur")
 
     if method != "default":
@@ -245,8 +292,7 @@ def generate_fingerprint(
 
     try:
         components = collect_fingerprint_components()
-        source = _compute_fingerprint_string(components, salt=salt)
-        digest = hashlib.sha256(source.encode("utf-8", errors="ignore")).hexdigest()
+        digest = _hash_components(components, salt=salt)
         logger.info("Fingerprint généré (SHA256).")
 
         if cache_path:
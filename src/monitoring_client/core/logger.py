@@ -2,26 +2,55 @@ import json
 import logging
 import os
 import sys
-from typing import Optional
+import threading
+from typing import Any, Dict, Optional
 
 _LOGGER_CONFIGURED = False
+_LOGGER_CONFIG_LOCK = threading.Lock()
+
+try:
+    # orjson (optionnel) : sérialisation nettement plus rapide, sortie toujours UTF-8.
+    # Sous PyPy, le json stdlib JIT-compilé reste préférable.
+    if sys.implementation.name == "pypy":
+        raise ImportError("orjson non utilisé sous PyPy")
+    import orjson
+
+    def _dumps(obj: Dict[str, Any]) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+except ImportError:
+
+    def _dumps(obj: Dict[str, Any]) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+
+_LOG_LEVELS = {
+    "CRITICAL": logging.CRITICAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+}
 
 
 def _get_log_level_from_string(level_str: str) -> int:
     """Convertit une chaîne de niveau en constante logging."""
-    normalized = level_str.strip().upper()
-    return {
-        "CRITICAL": logging.CRITICAL,
-        "ERROR": logging.ERROR,
-        "WARNING": logging.WARNING,
-        "INFO": logging.INFO,
-        "DEBUG": logging.DEBUG,
-    }.get(normalized, logging.INFO)
+    return _LOG_LEVELS.get(level_str.strip().upper(), logging.INFO)
+
+
+# Formatter "plain" partagé (cas courant), construit une seule fois
+_PLAIN_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
+    datefmt="%Y-%m-%dT%H:%M:%S",
+)
 
 
 class JsonLogFormatter(logging.Formatter):
     """Formatter JSON simple pour logs structurés."""
 
+    # Champs personnalisés si on veut logguer les phases d'exécution
+    EXTRA_FIELDS = ("phase", "component", "step")
+
     def format(self, record: logging.LogRecord) -> str:
         log_record = {
             "level": record.levelname,
@@ -33,12 +62,12 @@ class JsonLogFormatter(logging.Formatter):
         if record.exc_info:
             log_record["exception"] = self.formatException(record.exc_info)
 
-        # Champs personnalisés si on veut logguer les phases d'exécution
-        for key in ("phase", "component", "step"):
-            if hasattr(record, key):
-                log_record[key] = getattr(record, key)
+        record_dict = record.__dict__
+        for key in self.EXTRA_FIELDS:
+            if key in record_dict:
+                log_record[key] = record_dict[key]
 
-        return json.dumps(log_record, ensure_ascii=False)
+        return _dumps(log_record)
 
 
 def configure_logging(
@@ -58,44 +87,46 @@ def configure_logging(
     """
     global _LOGGER_CONFIGURED
 
+    # Chemin rapide : simple lecture d'un booléen une fois configuré
     if _LOGGER_CONFIGURED:
         return
 
-    env_level = os.getenv("MONITORING_LOG_LEVEL")
-    env_format = os.getenv("MONITORING_LOG_FORMAT")
+    with _LOGGER_CONFIG_LOCK:
+        if _LOGGER_CONFIGURED:
+            return
 
-    if env_level:
-        level = env_level
-    if env_format:
-        fmt = env_format
+        env_level = os.getenv("MONITORING_LOG_LEVEL")
+        env_format = os.getenv("MONITORING_LOG_FORMAT")
 
-    log_level = _get_log_level_from_string(level)
+        if env_level:
+            level = env_level
+        if env_format:
+            fmt = env_format
 
-    root_logger = logging.getLogger()
-    root_logger.setLevel(log_level)
-    root_logger.handlers.clear()
+        log_level = _get_log_level_from_string(level)
 
-    if fmt == "json":
-        formatter: logging.Formatter = JsonLogFormatter()
-    else:
-        formatter = logging.Formatter(
-            fmt="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
-            datefmt="%Y-%m-%dT%H:%M:%S",
-        )
+        root_logger = logging.getLogger()
+        root_logger.setLevel(log_level)
+        root_logger.handlers.clear()
 
-    if console_enabled:
-        console_handler = logging.StreamHandler(stream=sys.stdout)
-        console_handler.setLevel(log_level)
-        console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        if fmt == "json":
+            formatter: logging.Formatter = JsonLogFormatter()
+        else:
+            formatter = _PLAIN_FORMATTER
 
-    if file_enabled and file_path:
-        file_handler = logging.FileHandler(file_path)
-        file_handler.setLevel(log_level)
-        file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        if console_enabled:
+            console_handler = logging.StreamHandler(stream=sys.stdout)
+            console_handler.setLevel(log_level)
+            console_handler.setFormatter(formatter)
+            root_logger.addHandler(console_handler)
 
-    _LOGGER_CONFIGURED = True
+        if file_enabled and file_path:
+            file_handler = logging.FileHandler(file_path)
+            file_handler.setLevel(log_level)
+            file_handler.setFormatter(formatter)
+            root_logger.addHandler(file_handler)
+
+        _LOGGER_CONFIGURED = True
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -109,12 +140,15 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
-def log_phase(logger: logging.Logger, phase: str, message: str) -> None:
+def log_phase(logger: logging.Logger, phase: str, message: str, *args: Any) -> None:
     """
     Helper pour logguer une phase d'exécution importante en temps réel.
 
+    Les arguments optionnels sont formatés en style % par le module logging,
+    uniquement si l'enregistrement est effectivement émis.
+
     Exemple d'usage dans le pipeline :
         log_phase(logger, "config.load", "Lecture du fichier de configuration")
-        log_phase(logger, "fingerprint.compute", "Calcul du fingerprint")
+        log_phase(logger, "collector.system", "Exécution du collecteur '%s'", "system")
     """
-    logger.info(message, extra={"phase": phase})
+    logger.info(message, *args, extra={"phase": phase})
@@ -0,0 +1,107 @@
+import functools
+import subprocess
+import time
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+
+def ttl_cached(ttl_seconds: float) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Décorateur de mise en cache avec durée de vie (horloge monotone).
+
+    Destiné aux valeurs "semi-statiques" (nombre de CPU, boot time, partitions...)
+    qui ne changent quasiment jamais mais sont relues à chaque collecte.
+    Le cache est indexé sur les arguments positionnels (qui doivent être hashables).
+
+    Exemple :
+        @ttl_cached(300)
+        def _cpu_count() -> int:
+            return psutil.cpu_count(logical=True)
+
+    La fonction décorée expose `cache_clear()` pour invalider le cache.
+    """
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any) -> Any:
+            now = time.monotonic()
+            entry = cache.get(args)
+            if entry is not None and now - entry[0] < ttl_seconds:
+                return entry[1]
+            value = fn(*args)
+            cache[args] = (now, value)
+            return value
+
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+def iter_command_lines(args: List[str]) -> Iterator[str]:
+    """
+    Produit les lignes non vides (strip) de stdout d'une commande au fil de la lecture.
+
+    Pas de sortie complète en mémoire : le comptage reste O(1) même avec des
+    milliers de lignes, et le parsing avance pendant que la commande écrit.
+    stderr est ignoré ; lève OSError si la commande est introuvable.
+    """
+    proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    try:
+        for line in proc.stdout:
+            line = line.strip()
+            if line:
+                yield line
+    finally:
+        proc.stdout.close()
+        proc.wait()
+
+
+def compile_schema_validator(
+    schema: Dict[str, Any], error_factory: Callable[[str], Exception]
+) -> Callable[[Dict[str, Any]], None]:
+    """
+    Construit la fonction de validation d'un schéma JSON.
+
+    - fastjsonschema disponible : le schéma est compilé en code Python.
+    - Sinon : repli sur jsonschema, méta-schéma vérifié une seule fois.
+
+    Un schéma invalide lève ValueError ; la fonction retournée lève
+    `error_factory(message)` si le document ne respecte pas le schéma.
+    """
+    try:  # validateur généré (optionnel, nettement plus rapide que jsonschema)
+        import fastjsonschema
+    except ImportError:  # pragma: no cover - dépend de l'environnement
+        fastjsonschema = None
+
+    if fastjsonschema is not None:
+        try:
+            compiled = fastjsonschema.compile(schema)
+        except fastjsonschema.JsonSchemaException as exc:
+            raise ValueError(exc.message) from exc
+
+        def validate(document: Dict[str, Any]) -> None:
+            try:
+                compiled(document)
+            except fastjsonschema.JsonSchemaException as exc:
+                raise error_factory(exc.message) from exc
+
+        return validate
+
+    import jsonschema
+
+    validator_cls = jsonschema.validators.validator_for(schema)
+    try:
+        validator_cls.check_schema(schema)
+    except jsonschema.SchemaError as exc:
+        raise ValueError(exc.message) from exc
+    validator = validator_cls(schema)
+
+    def validate(document: Dict[str, Any]) -> None:
+        try:
+            validator.validate(document)
+        except jsonschema.ValidationError as exc:
+            raise error_factory(exc.message) from exc
+
+    return validate
@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import argparse
+import json
+import platform
+import socket
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
 from monitoring_client import __version__
@@ -22,6 +25,10 @@ from monitoring_client.vendors.parser import VendorParser
 
 logger = get_logger(__name__)
 
+# Exécutions vendor en parallèle (I/O-bound : un subprocess par métrique)
+VENDOR_MAX_WORKERS = 32
+VENDOR_TIMEOUT_SECONDS = 5.0
+
 
 # Exit codes
 EXIT_OK = 0
@@ -128,8 +135,10 @@ def main() -> int:
     executor = CommandExecutor()
     vendor_metrics = []
 
-    for vm in vendor_docs:
-        value = executor.execute_metric(vm, timeout=5.0)
+    # Exécutions en parallèle, résultats dans l'ordre des définitions vendor
+    values = executor.execute_many(vendor_docs, timeout=VENDOR_TIMEOUT_SECONDS, max_workers=VENDOR_MAX_WORKERS)
+
+    for vm, value in zip(vendor_docs, values):
         if value is not None:
             vendor_metrics.append(
                 {
@@ -166,7 +175,7 @@ def main() -> int:
         )
     )
 
-    timestamp_iso = datetime.utcnow().isoformat() + "Z"
+    timestamp_iso = datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
 
     payload = transformer.build_payload(
         metrics=all_metrics,
@@ -197,8 +206,6 @@ def main() -> int:
     # ------------------------
     if args.dry_run:
         log_phase(logger, "dryrun", "✓ Mode dry-run, aucun envoi effectué")
-        import json
-
         print(json.dumps(payload, indent=2))
         return EXIT_OK
 
@@ -226,8 +233,6 @@ def _resolve_hostname(config) -> str:
     """
     Détermine le hostname selon les règles de configuration.
     """
-    import socket
-
     src = config.machine.hostname_source
     if src == "system":
         return socket.gethostname()
@@ -246,8 +251,6 @@ def _resolve_os(config) -> str:
     if config.machine.os_override:
         return config.machine.os_override
 
-    import platform
-
     name = platform.system().lower()
     return "linux" if "linux" in name else name
 
@@ -18,7 +18,7 @@ class MetricsAggregator:
       - Les métriques vendor sont ajoutées ensuite.
       - En cas de doublon sur le champ 'name' :
           * la métrique vendor ÉCRASE la builtin
-          * un warning est loggué
+          * un warning récapitulatif est loggué (noms écrasés)
       - Les métriques sans champ 'name' ou 'type' ou 'value' sont ignorées.
 
     Format attendu :
@@ -45,33 +45,43 @@ class MetricsAggregator:
         )
 
         merged: Dict[str, MetricDict] = {}
+        # Liaisons locales : pas de résolution d'attribut par métrique
+        normalize = self._normalize_metric_dict
+        insert = merged.setdefault
 
         # 1. Ajout des métriques builtin
+        # setdefault : une seule opération de hachage pour un nom nouveau (cas
+        # courant) ; l'affectation explicite n'a lieu qu'en cas de doublon
         for metric in builtin_metrics:
-            m = self._normalize_metric_dict(metric, source="builtin")
+            m = normalize(metric, source="builtin")
             if not m:
                 continue
             name = m["name"]
-            if name in merged:
+            if insert(name, m) is not m:
                 logger.warning(
                     "Doublon inattendu dans les métriques builtin pour name='%s', "
                     "la dernière valeur sera conservée.",
                     name,
                 )
-            merged[name] = m
+                merged[name] = m
 
-        # 2. Ajout des métriques vendor (écrasent les builtin en cas de doublon)
+        # 2. Ajout des métriques vendor (écrasent les builtin en cas de doublon) :
+        # dict vendor construit à part, recouvrement calculé en une opération
+        # d'ensembles, puis insertion en bloc (dict.update)
+        vendor: Dict[str, MetricDict] = {}
         for metric in vendor_metrics:
-            m = self._normalize_metric_dict(metric, source="vendor")
-            if not m:
-                continue
-            name = m["name"]
-            if name in merged:
-                logger.warning(
-                    "La métrique vendor '%s' écrase une métrique builtin existante.",
-                    name,
-                )
-            merged[name] = m
+            m = normalize(metric, source="vendor")
+            if m:
+                vendor[m["name"]] = m
+
+        overridden = merged.keys() & vendor.keys()
+        if overridden:
+            logger.warning(
+                "%d métrique(s) vendor écrasent des métriques builtin existantes : %s",
+                len(overridden),
+                ", ".join(sorted(overridden)),
+            )
+        merged.update(vendor)
 
         final_metrics = list(merged.values())
         logger.info(
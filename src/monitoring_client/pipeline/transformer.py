@@ -71,6 +71,13 @@ class PayloadTransformer:
 
     def __init__(self, config: PayloadTransformerConfig) -> None:
         self._config = config
+        # Partie invariante du bloc 'metadata', calculée une fois par config
+        self._meta_template: Dict[str, Any] = {
+            "generator": config.generator,
+            "version": config.version,
+            "schema_version": config.schema_version,
+        }
+        self._timestamp_field = config.timestamp_field
 
     def build_payload(
         self,
@@ -95,12 +102,14 @@ class PayloadTransformer:
         """
         log_phase(logger, "pipeline.transform", "Construction du payload API final")
 
-        metadata = self._build_metadata(timestamp_iso)
-        machine = self._build_machine(hostname, os_name, fingerprint)
-
         payload = {
-            "metadata": metadata,
-            "machine": machine,
+            # Gabarit invariant + champ timestamp configurable (timestamp, collection_time, etc.)
+            "metadata": {**self._meta_template, self._timestamp_field: timestamp_iso},
+            "machine": {
+                "hostname": hostname,
+                "os": os_name,
+                "fingerprint": fingerprint,
+            },
             "metrics": metrics,
         }
 
@@ -112,37 +121,3 @@ class PayloadTransformer:
         )
 
         return payload
-
-    # ---------------------------------------------------------------------
-    # Helpers internes
-    # ---------------------------------------------------------------------
-
-    def _build_metadata(self, timestamp_iso: str) -> Dict[str, Any]:
-        """
-        Construit le bloc 'metadata' selon la config actuelle.
-        """
-        meta = {
-            "generator": self._config.generator,
-            "version": self._config.version,
-            "schema_version": self._config.schema_version,
-        }
-
-        # Champ timestamp configurable (timestamp, collection_time, etc.)
-        meta[self._config.timestamp_field] = timestamp_iso
-
-        return meta
-
-    @staticmethod
-    def _build_machine(
-        hostname: str,
-        os_name: str,
-        fingerprint: str,
-    ) -> Dict[str, Any]:
-        """
-        Construit le bloc 'machine' du payload.
-        """
-        return {
-            "hostname": hostname,
-            "os": os_name,
-            "fingerprint": fingerprint,
-        }
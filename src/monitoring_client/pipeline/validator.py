@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, NamedTuple, Tuple
 
 from monitoring_client.core.logger import get_logger, log_phase
 
@@ -11,15 +10,24 @@ logger = get_logger(__name__)
 MetricDict = Dict[str, Any]
 PayloadDict = Dict[str, Any]
 
-# Noms de métriques autorisés : alphanumérique + . - _
-_METRIC_NAME_REGEX = re.compile(r"^[a-zA-Z0-9._\-\[\]/]+$")
+# Noms de métriques autorisés : alphanumérique + . - _ [ ] /
+# \Z (et non $) : un "\n" final n'est pas accepté ; ASCII uniquement
+_METRIC_NAME_CHARS = r"[a-zA-Z0-9._\-\[\]/]"
+_METRIC_NAME_REGEX = re.compile(_METRIC_NAME_CHARS + r"+\Z", re.ASCII)
+_MATCH_METRIC_NAME = _METRIC_NAME_REGEX.match
+
+# Noms joints par "\x00" (hors charset) : un seul match pour tout un lot de noms
+_NAMES_SEPARATOR = "\x00"
+_MATCH_JOINED_NAMES = re.compile(
+    rf"(?:{_METRIC_NAME_CHARS}+\x00)*{_METRIC_NAME_CHARS}+\Z",
+    re.ASCII,
+).match
 
 # Types logiques supportés dans le payload final
 _ALLOWED_TYPES = {"numeric", "boolean", "string"}
 
 
-@dataclass
-class ValidationError:
+class ValidationError(NamedTuple):
     """
     Représente une erreur de validation dans le payload.
 
@@ -35,6 +43,60 @@ class ValidationError:
         return {"path": self.path, "message": self.message}
 
 
+def _error(path: str, message: str) -> Dict[str, str]:
+    """Erreur sous sa forme retournée par validate_payload (sans objet intermédiaire)."""
+    return {"path": path, "message": message}
+
+
+def _names_all_valid(names: List[Any]) -> bool:
+    """True si tous les noms sont des chaînes valides (un seul match sur les noms joints)."""
+    if not all(isinstance(n, str) for n in names):
+        return False
+    joined = _NAMES_SEPARATOR.join(names)
+    # Un séparateur contenu dans un nom fausserait le découpage
+    if joined.count(_NAMES_SEPARATOR) != len(names) - 1:
+        return False
+    return _MATCH_JOINED_NAMES(joined) is not None
+
+
+def _all_metrics_valid(metrics: List[Any]) -> bool:
+    """
+    Chemin nominal de validate_payload : contrôle colonne par colonne.
+
+    Les champs sont extraits en une passe (name, type, value), puis chaque
+    colonne est vérifiée par une boucle dédiée. Retourne False à la première
+    anomalie (y compris type non canonique, ex: " Numeric ") : la passe
+    détaillée, métrique par métrique, produit alors les erreurs.
+    """
+    try:
+        columns = [(m["name"], m["type"], m["value"]) for m in metrics if isinstance(m, dict)]
+    except KeyError:
+        return False
+    if len(columns) != len(metrics):
+        return False
+    if not columns:
+        return True
+
+    names, types, values = zip(*columns)
+
+    if not _names_all_valid(names):
+        return False
+
+    # Types puis valeurs (bool exclu de numeric)
+    if not all(isinstance(t, str) and t in _ALLOWED_TYPES for t in types):
+        return False
+    for m_type, value in zip(types, values):
+        if m_type == "numeric":
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return False
+        elif m_type == "boolean":
+            if not isinstance(value, bool):
+                return False
+        elif not isinstance(value, str):
+            return False
+    return True
+
+
 class PayloadValidator:
     """
     Validation de cohérence et de conformité du payload final.
@@ -64,11 +126,21 @@ class PayloadValidator:
 
         Retourne True si valide, False sinon.
         """
-        if not isinstance(name, str):
+        if not isinstance(name, str) or not name:
             return False
-        if not name:
-            return False
-        return bool(_METRIC_NAME_REGEX.match(name))
+        # match() ancre déjà en début de chaîne : pas de "^" dans le motif
+        return _MATCH_METRIC_NAME(name) is not None
+
+    def validate_names_batch(self, names: List[Any]) -> List[bool]:
+        """
+        Valide un lot de noms ; même résultat que validate_metric_name nom par nom.
+
+        Cas nominal (tous valides) : un seul match regex sur les noms joints.
+        Sinon, repli nom par nom pour situer les noms invalides.
+        """
+        if names and _names_all_valid(names):
+            return [True] * len(names)
+        return [self.validate_metric_name(n) for n in names]
 
     def validate_metric_type(self, value: Any, expected_type: Any) -> bool:
         """
@@ -84,7 +156,8 @@ class PayloadValidator:
         if not isinstance(expected_type, str):
             return False
 
-        etype = expected_type.strip().lower()
+        # Type déjà canonique (cas courant) : pas de copies strip()/lower()
+        etype = expected_type if expected_type in _ALLOWED_TYPES else expected_type.strip().lower()
         if etype not in _ALLOWED_TYPES:
             return False
 
@@ -123,23 +196,24 @@ class PayloadValidator:
         """
         log_phase(logger, "pipeline.validate", "Validation du payload avant envoi")
 
-        errors: List[ValidationError] = []
+        # Erreurs construites directement sous forme de dict (format de retour)
+        errors: List[Dict[str, str]] = []
 
         # --- Vérification racine ---
         if not isinstance(payload, dict):
             errors.append(
-                ValidationError(
+                _error(
                     path="$",
                     message=("Payload racine invalide, dict attendu, " f"trouvé {type(payload)}."),
                 )
             )
-            return False, [e.to_dict() for e in errors]
+            return False, errors
 
         # Blocs de base
         for key in ("metadata", "machine", "metrics"):
             if key not in payload:
                 errors.append(
-                    ValidationError(
+                    _error(
                         path="$",
                         message=f"Champ obligatoire manquant au niveau racine: '{key}'.",
                     )
@@ -148,7 +222,7 @@ class PayloadValidator:
         metrics = payload.get("metrics")
         if not isinstance(metrics, list):
             errors.append(
-                ValidationError(
+                _error(
                     path="$.metrics",
                     message=("Le champ 'metrics' doit être une liste, " f"trouvé {type(metrics)}."),
                 )
@@ -157,12 +231,16 @@ class PayloadValidator:
             metrics = []
 
         # --- Validation métriques ---
+        # Payload conforme (cas nominal) : passe vectorisée, sans la boucle détaillée
+        if _all_metrics_valid(metrics):
+            metrics = []
+
         for idx, metric in enumerate(metrics):
             path_prefix = f"$.metrics[{idx}]"
 
             if not isinstance(metric, dict):
                 errors.append(
-                    ValidationError(
+                    _error(
                         path=path_prefix,
                         message=("Métrique invalide, dict attendu, " f"trouvé {type(metric)}."),
                     )
@@ -173,14 +251,14 @@ class PayloadValidator:
             name = metric.get("name")
             if name is None:
                 errors.append(
-                    ValidationError(
+                    _error(
                         path=f"{path_prefix}.name",
                         message="Champ 'name' manquant pour une métrique.",
                     )
                 )
             elif not self.validate_metric_name(name):
                 errors.append(
-                    ValidationError(
+                    _error(
                         path=f"{path_prefix}.name",
                         message=(f"Nom de métrique invalide: {name!r} " "(autorisé: alphanumérique + . + - + _)."),
                     )
@@ -190,7 +268,7 @@ class PayloadValidator:
             m_type = metric.get("type")
             if m_type is None:
                 errors.append(
-                    ValidationError(
+                    _error(
                         path=f"{path_prefix}.type",
                         message="Champ 'type' manquant pour une métrique.",
                     )
@@ -200,17 +278,17 @@ class PayloadValidator:
 
             if not isinstance(m_type, str):
                 errors.append(
-                    ValidationError(
+                    _error(
                         path=f"{path_prefix}.type",
                         message=("Champ 'type' doit être une chaîne, " f"trouvé {type(m_type)}."),
                     )
                 )
                 continue
 
-            m_type_norm = m_type.strip().lower()
+            m_type_norm = m_type if m_type in _ALLOWED_TYPES else m_type.strip().lower()
             if m_type_norm not in _ALLOWED_TYPES:
                 errors.append(
-                    ValidationError(
+                    _error(
                         path=f"{path_prefix}.type",
                         message=(
                             f"Type de métrique non supporté: {m_type!r}. " f"Types autorisés: {sorted(_ALLOWED_TYPES)}."
@@ -222,7 +300,7 @@ class PayloadValidator:
             # Valeur
             if "value" not in metric:
                 errors.append(
-                    ValidationError(
+                    _error(
                         path=f"{path_prefix}.value",
                         message="Champ 'value' manquant pour une métrique.",
                     )
@@ -232,7 +310,7 @@ class PayloadValidator:
             value = metric.get("value")
             if not self.validate_metric_type(value, m_type):
                 errors.append(
-                    ValidationError(
+                    _error(
                         path=f"{path_prefix}.value",
                         message=(f"Valeur '{value!r}' incohérente avec " f"le type déclaré '{m_type}'."),
                     )
@@ -248,6 +326,6 @@ class PayloadValidator:
                 len(errors),
             )
             for err in errors:
-                logger.debug("Validation error: path=%s message=%s", err.path, err.message)
+                logger.debug("Validation error: path=%s message=%s", err["path"], err["message"])
 
-        return is_valid, [e.to_dict() for e in errors]
+        return is_valid, errors
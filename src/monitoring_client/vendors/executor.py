@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import functools
+import logging
+import os
+import re
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from monitoring_client.core.logger import get_logger, log_phase
 from monitoring_client.vendors.parser import VendorMetric
@@ -23,6 +28,66 @@ SUPPORTED_LANGUAGES = [
     "batch",
 ]
 
+# Binaires candidats par langage, par ordre de préférence.
+# Linux / Unix centrée, mais on prépare batch/powershell pour Windows
+_LANGUAGE_CANDIDATES: Dict[str, Tuple[str, ...]] = {
+    "python": ("python3", "python"),
+    "bash": ("bash", "sh"),
+    "python2": ("python2",),
+    "java": ("java",),
+    "node": ("node", "nodejs"),
+    "ruby": ("ruby",),
+    "perl": ("perl",),
+    "powershell": ("pwsh", "powershell"),
+    "batch": ("cmd",),  # Windows uniquement
+}
+
+# Option "code en ligne" de l'interpréteur, par langage script (java : cas à part)
+_INLINE_CODE_FLAGS: Dict[str, str] = {
+    "python": "-c",
+    "python2": "-c",
+    "bash": "-c",
+    "node": "-e",
+    "ruby": "-e",
+    "perl": "-e",
+    # Linux: pwsh, Windows: powershell
+    "powershell": "-Command",
+    # Windows uniquement, mais on laisse la possibilité
+    "batch": "/c",
+}
+
+
+# Types de sortie sous leur forme canonique
+_OUTPUT_TYPES = frozenset(("numeric", "boolean", "string"))
+
+# Sorties numériques usuelles (ASCII) : entier, puis décimal / notation scientifique
+_MATCH_INT = re.compile(r"[+-]?\d+\Z", re.ASCII).match
+_MATCH_FLOAT = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\Z", re.ASCII).match
+
+# Jetons acceptés pour une sortie boolean (après strip/lower)
+_BOOL_TRUE = frozenset(("true", "1", "yes", "y", "on"))
+_BOOL_FALSE = frozenset(("false", "0", "no", "n", "off"))
+
+
+@functools.lru_cache(maxsize=8)
+def _detect_language_binaries(path_env: Optional[str]) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """
+    Résout (langage, binaire ou None) pour chaque langage de _LANGUAGE_CANDIDATES.
+
+    Mis en cache par valeur de PATH : les instances suivantes de CommandExecutor
+    ne refont aucun parcours du PATH, et un PATH modifié relance la détection.
+    """
+    detected = []
+    for lang, bins in _LANGUAGE_CANDIDATES.items():
+        path = None
+        for b in bins:
+            p = shutil.which(b, path=path_env)
+            if p:
+                path = p
+                break
+        detected.append((lang, path))
+    return tuple(detected)
+
 
 @dataclass
 class CommandExecutionResult:
@@ -94,27 +159,7 @@ class CommandExecutor:
         """
         log_phase(logger, "vendors.executor.init", "Détection des langages disponibles")
 
-        # Linux / Unix centrée, mais on prépare batch/powershell pour Windows
-        candidates = {
-            "python": ["python3", "python"],
-            "bash": ["bash", "sh"],
-            "python2": ["python2"],
-            "java": ["java"],
-            "node": ["node", "nodejs"],
-            "ruby": ["ruby"],
-            "perl": ["perl"],
-            "powershell": ["pwsh", "powershell"],
-            "batch": ["cmd"],  # Windows uniquement
-        }
-
-        for lang, bins in candidates.items():
-            path = None
-            for b in bins:
-                p = shutil.which(b)
-                if p:
-                    path = p
-                    break
-            self._language_binaries[lang] = path
+        self._language_binaries.update(_detect_language_binaries(os.environ.get("PATH")))
 
         logger.debug("Langages détectés: %s", self._language_binaries)
 
@@ -129,8 +174,11 @@ class CommandExecutor:
         Exemple :
           executor.check_language_available("bash") -> True/False
         """
-        normalized = lang.lower().strip()
-        return normalized in self._language_binaries and self._language_binaries[normalized] is not None
+        binaries = self._language_binaries
+        # Nom déjà canonique (cas d'execute) : une seule recherche, sans normalisation
+        if lang in binaries:
+            return binaries[lang] is not None
+        return binaries.get(lang.lower().strip()) is not None
 
     def execute(
         self,
@@ -178,11 +226,17 @@ class CommandExecutor:
         )
         logger.debug("Arguments du processus: %r", proc_args)
 
+        # stderr n'est exploité que par les logs (warning en cas d'échec, debug sinon) :
+        # inutile d'ouvrir un pipe s'ils sont tous filtrés
+        stderr_target = subprocess.PIPE if logger.isEnabledFor(logging.WARNING) else subprocess.DEVNULL
+
         try:
             result = subprocess.run(
                 proc_args,
+                # Pas d'entrée : une commande vendor qui lit stdin ne bloque pas jusqu'au timeout
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stderr=stderr_target,
                 text=True,
                 timeout=timeout,
                 check=False,
@@ -257,15 +311,39 @@ class CommandExecutor:
             expected_type=metric.type,
         )
 
+    def execute_many(
+        self,
+        metrics: Sequence[VendorMetric],
+        timeout: float,
+        max_workers: int = 32,
+    ) -> List[Optional[Any]]:
+        """
+        Exécute plusieurs VendorMetric en parallèle (un thread par commande en cours).
+
+        Les commandes sont des subprocess : les threads attendent leur fin sans
+        tenir le GIL. L'exécuteur est en lecture seule après __init__, donc
+        partageable entre threads.
+
+        Retour :
+          - une valeur (ou None) par métrique, dans l'ordre de `metrics`.
+        """
+        if not metrics:
+            return []
+
+        workers = max(1, min(max_workers, len(metrics)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vendor") as pool:
+            return list(pool.map(lambda metric: self.execute_metric(metric, timeout=timeout), metrics))
+
     # -------------------------------------------------------------------------
     # Helpers internes
     # -------------------------------------------------------------------------
 
-    def _build_process_args(self, language: str, command: str) -> list[str]:
+    def _build_process_args(self, lang_normalized: str, command: str) -> list[str]:
         """
         Construit la ligne de commande (liste d'arguments) pour subprocess.
 
         On évite d'utiliser shell=True. On passe l'interpréteur explicitement.
+        `lang_normalized` est déjà en minuscules et sans espaces (fait par execute).
 
         Convention :
           - python   : python -c "<code python>"
@@ -280,30 +358,15 @@ class CommandExecutor:
                        on exécute la commande telle quelle via 'bash -c' si dispo,
                        ou on lève une erreur.
         """
-        lang = language.lower().strip()
+        lang = lang_normalized
         interpreter = self._language_binaries.get(lang)
         if not interpreter:
             raise ValueError(f"Aucun interpréteur trouvé pour le langage '{lang}'")
 
-        # Langages script traditionnels
-        if lang == "python":
-            return [interpreter, "-c", command]
-        if lang == "python2":
-            return [interpreter, "-c", command]
-        if lang == "bash":
-            return [interpreter, "-c", command]
-        if lang in ("node",):
-            return [interpreter, "-e", command]
-        if lang == "ruby":
-            return [interpreter, "-e", command]
-        if lang == "perl":
-            return [interpreter, "-e", command]
-        if lang == "powershell":
-            # Linux: pwsh, Windows: powershell
-            return [interpreter, "-Command", command]
-        if lang == "batch":
-            # Windows uniquement, mais on laisse la possibilité
-            return [interpreter, "/c", command]
+        # Langages script traditionnels : une recherche dans la table d'options
+        flag = _INLINE_CODE_FLAGS.get(lang)
+        if flag is not None:
+            return [interpreter, flag, command]
 
         if lang == "java":
             # Cas 1 : l'intégrateur fournit directement 'java ...'
@@ -330,13 +393,19 @@ class CommandExecutor:
 
         expected_type ∈ {"numeric", "boolean", "string"}
         """
-        etype = expected_type.lower().strip()
+        # Type déjà canonique (cas courant) : pas de copies lower()/strip()
+        etype = expected_type if expected_type in _OUTPUT_TYPES else expected_type.lower().strip()
 
         if etype == "string":
             return stdout
 
         if etype == "numeric":
-            # On essaie int puis float
+            # Formes usuelles classées par regex : pas d'exception levée/attrapée
+            if _MATCH_INT(stdout):
+                return int(stdout)
+            if _MATCH_FLOAT(stdout):
+                return float(stdout)
+            # Formes rares (inf, nan, 1_000, chiffres non ASCII...) ou sortie invalide
             try:
                 if "." not in stdout and "e" not in stdout.lower():
                     return int(stdout)
@@ -349,9 +418,9 @@ class CommandExecutor:
 
         if etype == "boolean":
             val = stdout.strip().lower()
-            if val in ("true", "1", "yes", "y", "on"):
+            if val in _BOOL_TRUE:
                 return True
-            if val in ("false", "0", "no", "n", "off"):
+            if val in _BOOL_FALSE:
                 return False
             return None
 
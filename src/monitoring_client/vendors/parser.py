@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import json
+import logging
+import os
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import yaml
 
@@ -10,10 +14,38 @@ from monitoring_client.core.logger import get_logger, log_phase
 
 from monitoring_client.vendors.validator import VendorDocument, VendorSchemaError, validate_vendor_document
 
+# Loader YAML sûr le plus rapide disponible (libyaml recommandé)
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # pragma: no cover - PyYAML compilé sans libyaml
+    from yaml import SafeLoader as _YamlSafeLoader
+
+try:  # décodeur JSON natif optionnel, pour les fichiers vendor au format JSON
+    import orjson
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    orjson = None
+
+# Fichier commençant par "{" (catalogues générés) : décodé en JSON, bien plus rapide que YAML
+_json_loads = orjson.loads if orjson is not None else json.loads
+_JSON_SNIFF_BYTES = 64
+
+# Taille maximale d'un fichier vendor : un dump volumineux déposé par erreur
+# est écarté avant parsing (temps et mémoire bornés)
+MAX_VENDOR_FILE_BYTES = 5 * 1024 * 1024
+
 logger = get_logger(__name__)
 
+# Fichiers vendor reconnus, et suffixes désactivant un fichier
+_VENDOR_SUFFIXES = (".yaml", ".yml")
+_SKIPPED_SUFFIXES = (".disabled", ".example")
+
+# Une instance par métrique vendor : __slots__ générés quand Python le permet (>= 3.10)
+_METRIC_DATACLASS_OPTIONS: Dict[str, Any] = {}
+if sys.version_info >= (3, 10):
+    _METRIC_DATACLASS_OPTIONS["slots"] = True
 
-@dataclass
+
+@dataclass(**_METRIC_DATACLASS_OPTIONS)
 class VendorMetric:
     """
     Représentation interne d'une métrique vendor normalisée.
@@ -28,7 +60,8 @@ class VendorMetric:
       - description  : description fonctionnelle fournie par le vendor
       - is_critical  : criticité suggérée par le vendor
       - source_file  : fichier vendor d'origine (Path)
-      - raw_metric   : dict brut de la métrique (pour debug / logs)
+      - raw_metric   : dict brut de la métrique (pour debug / logs) ; renseigné
+                       uniquement si le logger du parser est en DEBUG
     """
 
     vendor: str
@@ -40,7 +73,18 @@ class VendorMetric:
     description: str
     is_critical: bool
     source_file: Path
-    raw_metric: Dict[str, Any]
+    raw_metric: Optional[Dict[str, Any]] = None
+
+
+def _load_json_shaped(content: bytes) -> Any:
+    """
+    Décode un fichier vendor d'allure JSON ; repli sur le loader YAML si ce
+    n'est pas du JSON strict (commentaires, clés non quotées... : YAML en flow style).
+    """
+    try:
+        return _json_loads(content)
+    except ValueError:  # json.JSONDecodeError / orjson.JSONDecodeError
+        return yaml.load(content, Loader=_YamlSafeLoader)
 
 
 class VendorParser:
@@ -55,8 +99,12 @@ class VendorParser:
       - Gérer les erreurs fichier par fichier (warning, on continue)
     """
 
-    def __init__(self, vendors_dir: Path) -> None:
+    def __init__(self, vendors_dir: Path, max_file_bytes: int = MAX_VENDOR_FILE_BYTES) -> None:
         self.vendors_dir = vendors_dir
+        self.max_file_bytes = max_file_bytes
+        # Fichier -> (mtime_ns, taille, métriques) : un fichier inchangé n'est
+        # ni relu, ni revalidé lors des appels suivants de parse_all()
+        self._cache: Dict[Path, Tuple[int, int, List[VendorMetric]]] = {}
 
     # ---- Public API ----
 
@@ -66,25 +114,45 @@ class VendorParser:
 
         Fichiers invalides : warning et ignorés, mais on continue sur les autres.
         """
+        return list(self.iter_all())
+
+    def iter_all(self) -> Iterator[VendorMetric]:
+        """
+        Comme parse_all, mais produit les VendorMetric fichier par fichier.
+
+        Le consommateur peut traiter les métriques d'un fichier pendant que
+        les suivants ne sont pas encore lus ni validés.
+        """
         log_phase(
             logger,
             "vendors.parse",
             f"Analyse des fichiers vendor dans {self.vendors_dir}",
         )
 
-        metrics: List[VendorMetric] = []
+        total = 0
 
         for path in self._discover_vendor_files():
+            file_metrics: List[VendorMetric] = []
             try:
-                doc = self._load_yaml(path)
-                validated = validate_vendor_document(doc, source=str(path))
-                file_metrics = self._build_vendor_metrics(validated, path)
-                metrics.extend(file_metrics)
-                logger.info(
-                    "Fichier vendor '%s' chargé (%d métriques).",
-                    path,
-                    len(file_metrics),
-                )
+                st = os.stat(path)
+                cached = self._cache.get(path)
+                if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    file_metrics = cached[2]
+                else:
+                    if st.st_size > self.max_file_bytes:
+                        raise VendorSchemaError(
+                            f"Fichier vendor trop volumineux ({st.st_size} octets, "
+                            f"maximum {self.max_file_bytes}) : {path}"
+                        )
+                    doc = self._load_yaml(path)
+                    validated = validate_vendor_document(doc, source=str(path))
+                    file_metrics = self._build_vendor_metrics(validated, path)
+                    self._cache[path] = (st.st_mtime_ns, st.st_size, file_metrics)
+                    logger.info(
+                        "Fichier vendor '%s' chargé (%d métriques).",
+                        path,
+                        len(file_metrics),
+                    )
             except VendorSchemaError as exc:
                 logger.warning("Fichier vendor ignoré (schéma invalide): %s", exc)
             except Exception as exc:
@@ -94,8 +162,10 @@ class VendorParser:
                     exc,
                 )
 
-        logger.info("Nombre total de métriques vendor chargées: %d", len(metrics))
-        return metrics
+            total += len(file_metrics)
+            yield from file_metrics
+
+        logger.info("Nombre total de métriques vendor chargées: %d", total)
 
     # ---- Internal helpers ----
 
@@ -109,28 +179,35 @@ class VendorParser:
         """
         files: List[Path] = []
 
-        if not self.vendors_dir.exists():
+        if not os.path.exists(self.vendors_dir):
             logger.info(
                 "Dossier vendors inexistant (%s), aucun fichier à charger.",
                 self.vendors_dir,
             )
             return files
 
-        if not self.vendors_dir.is_dir():
+        if not os.path.isdir(self.vendors_dir):
             logger.warning(
                 "Chemin vendors n'est pas un dossier (%s), aucun fichier vendor chargé.",
                 self.vendors_dir,
             )
             return files
 
-        for entry in sorted(self.vendors_dir.iterdir()):
-            if not entry.is_file():
-                continue
-
-            if entry.name.endswith((".yaml", ".yml")) and not entry.name.endswith((".disabled", ".example")):
-                files.append(entry)
-
-        logger.debug("Fichiers vendor détectés: %s", [str(f) for f in files])
+        # os.scandir : le type d'entrée vient de readdir (pas de stat() par fichier,
+        # sauf pour les liens symboliques, toujours suivis comme avant)
+        with os.scandir(self.vendors_dir) as it:
+            entries = [
+                entry
+                for entry in it
+                if entry.name.endswith(_VENDOR_SUFFIXES)
+                and not entry.name.endswith(_SKIPPED_SUFFIXES)
+                and entry.is_file()
+            ]
+        entries.sort(key=lambda entry: entry.name)
+        files.extend(Path(entry.path) for entry in entries)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Fichiers vendor détectés: %s", [str(f) for f in files])
         return files
 
     def _load_yaml(self, path: Path) -> Dict[str, Any]:
@@ -140,14 +217,20 @@ class VendorParser:
         Lève VendorSchemaError si le contenu n'est pas un mapping.
         """
         try:
-            content = path.read_text(encoding="utf-8")
-        except Exception as exc:
+            fh = path.open("rb")
+        except OSError as exc:
             raise VendorSchemaError(f"Impossible de lire le fichier {path}: {exc}") from exc
 
-        try:
-            data = yaml.safe_load(content)
-        except Exception as exc:
-            raise VendorSchemaError(f"YAML invalide dans {path}: {exc}") from exc
+        # Flux binaire passé au parser : décodage (UTF-8 par défaut) et lecture
+        # par blocs côté PyYAML, sans copie str intermédiaire du fichier entier
+        with fh:
+            try:
+                if fh.peek(_JSON_SNIFF_BYTES).lstrip().startswith(b"{"):
+                    data = _load_json_shaped(fh.read())
+                else:
+                    data = yaml.load(fh, Loader=_YamlSafeLoader)
+            except (yaml.YAMLError, OSError) as exc:
+                raise VendorSchemaError(f"YAML invalide dans {path}: {exc}") from exc
 
         if not isinstance(data, dict):
             raise VendorSchemaError(
@@ -168,44 +251,35 @@ class VendorParser:
         metadata: Dict[str, Any] = raw.get("metadata", {})
         metrics_raw: List[Dict[str, Any]] = raw.get("metrics", [])  # type: ignore[assignment]
 
-        vendor_name: str = metadata.get("vendor", "")
-        global_lang: str = metadata.get("language", "python")
-
-        result: List[VendorMetric] = []
-
-        for metric in metrics_raw:
-            try:
-                name: str = metric["name"]
-                command: str = metric["command"]
-                m_type: str = metric["type"]
-                group_name: str = metric["group_name"]
-
+        # Champs à faible cardinalité internés : une seule chaîne partagée par toutes
+        # les métriques (name / command, quasi uniques, ne le sont pas)
+        intern = sys.intern
+        vendor_name: str = intern(metadata.get("vendor", ""))
+        global_lang: str = intern(metadata.get("language") or "python")
+
+        vendor_metric = VendorMetric
+        # Dict YAML brut conservé seulement pour le debug : sinon il est libéré avec le document
+        keep_raw = logger.isEnabledFor(logging.DEBUG)
+
+        # Schéma validé : champs requis présents et typés (is_critical est un booléen),
+        # indexation directe sans try/except par métrique.
+        # Arguments positionnels (moins coûteux que les kwargs), dans l'ordre des champs :
+        # vendor, group_name, name, command, language, type, description,
+        # is_critical, source_file, raw_metric.
+        # Aucune métrique n'est écartée : une compréhension construit la liste d'un bloc
+        return [
+            vendor_metric(
+                vendor_name,
+                intern(metric["group_name"]),
+                metric["name"],
+                metric["command"],
                 # Langage : spécifique à la métrique, sinon langage global, sinon python.
-                lang: str = metric.get("language") or global_lang or "python"
-
-                # Description et criticité viennent du vendor (obligatoires dans le schéma),
-                description: str = metric.get("description", "")
-                is_critical: bool = bool(metric.get("is_critical", False))
-
-                vm = VendorMetric(
-                    vendor=vendor_name,
-                    group_name=group_name,
-                    name=name,
-                    command=command,
-                    language=lang,
-                    type=m_type,
-                    description=description,
-                    is_critical=is_critical,
-                    source_file=path,
-                    raw_metric=metric,
-                )
-                result.append(vm)
-            except Exception as exc:
-                logger.warning(
-                    "Métrique ignorée dans '%s' (erreur de normalisation): %s / raw=%r",
-                    path,
-                    exc,
-                    metric,
-                )
-
-        return result
+                intern(metric["language"]) if metric.get("language") else global_lang,
+                intern(metric["type"]),
+                metric["description"],
+                metric["is_critical"],
+                path,
+                metric if keep_raw else None,
+            )
+            for metric in metrics_raw
+        ]
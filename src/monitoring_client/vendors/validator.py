@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-import re
+import functools
 from dataclasses import dataclass
-from typing import Any, Dict
-
-import jsonschema
+from typing import Any, Callable, Dict
 
 from monitoring_client.core.logger import get_logger
+from monitoring_client.core.utils import compile_schema_validator
 
 logger = get_logger(__name__)
 
@@ -104,6 +103,17 @@ _VENDOR_SCHEMA: Dict[str, Any] = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _get_vendor_validator() -> Callable[[Dict[str, Any]], None]:
+    """
+    Construit une seule fois la fonction de validation de _VENDOR_SCHEMA.
+
+    La fonction retournée lève VendorSchemaError avec le message de l'erreur
+    (le contexte "fichier" est ajouté par l'appelant).
+    """
+    return compile_schema_validator(_VENDOR_SCHEMA, VendorSchemaError)
+
+
 @dataclass
 class VendorDocument:
     """
@@ -165,9 +175,9 @@ def validate_vendor_document(raw: Dict[str, Any], source: str) -> VendorDocument
     raw = _normalize_metadata_aliases(raw)
 
     try:
-        jsonschema.validate(instance=raw, schema=_VENDOR_SCHEMA)
-    except jsonschema.ValidationError as exc:
-        raise VendorSchemaError(f"Fichier vendor invalide ({source}): {exc.message}") from exc
+        _get_vendor_validator()(raw)
+    except VendorSchemaError as exc:
+        raise VendorSchemaError(f"Fichier vendor invalide ({source}): {exc}") from exc
 
     # Normalisation légère post-validation
     metadata = raw.get("metadata", {})
@@ -181,17 +191,12 @@ def validate_vendor_document(raw: Dict[str, Any], source: str) -> VendorDocument
     if vendor_name == "builtin":
         raise VendorSchemaError(f"Fichier vendor invalide ({source}): 'vendor' ne doit pas être 'builtin'.")
 
-    # Normaliser language au niveau métrique + revalider name/group_name par sécurité
+    # Normaliser language au niveau métrique (name / group_name : pattern déjà
+    # imposé par le schéma, pas de seconde vérification par métrique)
     metrics = raw.get("metrics") or []
     for metric in metrics:
         m_lang = metric.get("language")
         if isinstance(m_lang, str):
             metric["language"] = _normalize_language(m_lang)
 
-        # Double sécurité : pattern name / group_name
-        for key in ("name", "group_name"):
-            val = metric.get(key)
-            if isinstance(val, str) and not re.match(_NAME_PATTERN, val):
-                raise VendorSchemaError(f"Champ '{key}' invalide dans {source}: '{val}' ne respecte pas le pattern.")
-
     return VendorDocument(data=raw, source=source)
@@ -8,3 +8,29 @@ def test_aggregator_override():
 
     merged = agg.aggregate(builtin, vendor)
     assert merged[0]["value"] == 2
+
+
+def test_aggregator_keeps_first_position_and_last_value():
+    agg = MetricsAggregator()
+    builtin = [
+        {"name": "a", "value": 1, "type": "numeric"},
+        {"name": "b", "value": 1, "type": "numeric"},
+        {"name": "a", "value": 2, "type": "numeric"},
+        {"name": "", "value": 0, "type": "numeric"},
+    ]
+    vendor = [{"name": "b", "value": 3, "type": "numeric"}, {"name": "c", "value": 4, "type": "numeric"}]
+
+    merged = agg.aggregate(builtin, vendor)
+    assert [(m["name"], m["value"]) for m in merged] == [("a", 2), ("b", 3), ("c", 4)]
+
+
+def test_aggregator_single_warning_for_vendor_overrides(caplog):
+    agg = MetricsAggregator()
+    builtin = [{"name": n, "value": 1, "type": "numeric"} for n in ("a", "b", "c")]
+    vendor = [{"name": n, "value": 2, "type": "numeric"} for n in ("c", "a", "d")]
+
+    merged = agg.aggregate(builtin, vendor)
+    assert [(m["name"], m["value"]) for m in merged] == [("a", 2), ("b", 1), ("c", 2), ("d", 2)]
+
+    warnings = [r.getMessage() for r in caplog.records if r.levelname == "WARNING"]
+    assert warnings == ["2 métrique(s) vendor écrasent des métriques builtin existantes : a, c"]
@@ -1,8 +1,11 @@
+import json
 from unittest.mock import MagicMock, patch
 
+import pytest
 import requests
 
-from monitoring_client.core.api_client import APIClient, APIClientConfig
+from monitoring_client.core import api_client as api_client_module
+from monitoring_client.core.api_client import APIClient, APIClientConfig, APIClientError
 
 
 def test_api_client_success():
@@ -18,3 +21,68 @@ def test_api_client_success():
     with patch.object(client._session, "post", return_value=mock_resp):
         resp = client.send_payload({"a": 1})
         assert resp.status_code == 200
+
+
+def test_api_client_session_carries_headers_and_pool():
+    cfg = APIClientConfig(
+        base_url="http://localhost", metrics_endpoint="/api", api_key_header="X-API", api_key="key"
+    )
+
+    client = APIClient(cfg)
+
+    assert client._session.headers["X-API"] == "key"
+    assert client._session.get_adapter("https://localhost")._pool_maxsize == 4
+
+    mock_resp = MagicMock()
+    mock_resp.status_code = 200
+
+    with patch.object(client._session, "post", return_value=mock_resp) as post:
+        client.send_payload({"a": 1})
+        assert "headers" not in post.call_args.kwargs
+
+
+def test_api_client_leaves_injected_session_headers_untouched():
+    cfg = APIClientConfig(
+        base_url="http://localhost", metrics_endpoint="/api", api_key_header="X-API", api_key="key"
+    )
+    session = requests.Session()
+    client = APIClient(cfg, session=session)
+
+    assert "X-API" not in session.headers
+
+    mock_resp = MagicMock()
+    mock_resp.status_code = 200
+
+    with patch.object(session, "post", return_value=mock_resp) as post:
+        client.send_payload({"a": 1})
+        assert post.call_args.kwargs["headers"]["X-API"] == "key"
+
+
+@pytest.mark.parametrize("payload", [{"name": "déjà", "v": 1.5, "ok": True}, {"n": 2**70}, {1: "clé non str"}])
+def test_payload_serialized_as_utf8_json(payload):
+    body = api_client_module._dumps_payload(payload)
+    assert json.loads(body) == json.loads(json.dumps(payload))
+
+
+@pytest.mark.parametrize("attempt, low, high", [(1, 0.5, 1.0), (3, 2.0, 4.0), (10, 15.0, 30.0), (500, 15.0, 30.0)])
+def test_backoff_capped_with_jitter(attempt, low, high):
+    for _ in range(20):
+        assert low <= APIClient._compute_backoff(attempt) <= high
+
+
+def test_api_client_error_body_truncated():
+    cfg = APIClientConfig(
+        base_url="http://localhost", metrics_endpoint="/api", api_key_header="X-API", api_key="key"
+    )
+
+    client = APIClient(cfg)
+
+    mock_resp = MagicMock()
+    mock_resp.status_code = 422
+    mock_resp.headers = {}
+    mock_resp.text = "x" * 10_000
+
+    with patch.object(client._session, "post", return_value=mock_resp):
+        with pytest.raises(APIClientError) as excinfo:
+            client.send_payload({"a": 1})
+    assert str(excinfo.value) == "Erreur client HTTP 422: " + "x" * 512
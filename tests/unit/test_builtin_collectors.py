@@ -0,0 +1,420 @@
+import json
+import os
+import re
+import socketserver
+import subprocess
+import sys
+import threading
+import types
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from monitoring_client.collectors import loader as loader_module
+from monitoring_client.collectors.base_collector import BaseCollector
+from monitoring_client.collectors.builtin import docker as docker_module
+from monitoring_client.collectors.builtin import network as network_module
+from monitoring_client.collectors.builtin import security as security_module
+from monitoring_client.collectors.builtin import services as services_module
+from monitoring_client.collectors.builtin import system as system_module
+from monitoring_client.collectors.builtin import updates as updates_module
+
+
+class _FakeDockerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    routes = {
+        "/_ping": b"OK",
+        "/containers/json?all=1": json.dumps([{"State": "running"}, {"State": "paused"}, {"State": "exited"}]).encode(),
+        "/images/json": json.dumps([{"Id": "a"}, {"Id": "b"}]).encode(),
+    }
+
+    def address_string(self):
+        return "unix"
+
+    def do_GET(self):
+        body = self.routes.get(self.path, b"")
+        self.send_response(200 if self.path in self.routes else 404)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_docker_snapshot_via_api(tmp_path, monkeypatch):
+    socket_path = str(tmp_path / "docker.sock")
+    server = socketserver.ThreadingUnixStreamServer(socket_path, _FakeDockerHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        monkeypatch.setattr(docker_module, "_DOCKER_SOCKET", socket_path)
+        running, counts = docker_module.DockerCollector._snapshot_via_api()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert running is True
+    assert counts == (3, 2, 1, 2)
+
+
+def test_docker_snapshot_via_api_without_socket(tmp_path, monkeypatch):
+    monkeypatch.setattr(docker_module, "_DOCKER_SOCKET", str(tmp_path / "absent.sock"))
+    assert docker_module.DockerCollector._snapshot_via_api() is None
+
+
+def test_trusted_collector_projection_matches_normalization():
+    class _Trusted(BaseCollector):
+        name = "trusted"
+        trusted = True
+
+        def _collect_metrics(self):
+            return [{"name": "x.count", "value": 3, "type": "numeric", "description": "ignorée"}]
+
+    collector = _Trusted()
+    raw = collector._collect_metrics()
+    assert collector.collect() == [collector._normalize_metric(raw[0])]
+
+
+def test_builtin_trusted_collectors_match_normalization(tmp_path, monkeypatch):
+    # Contrat de BaseCollector.trusted vérifié sur les vrais collecteurs builtin
+    socket_path = str(tmp_path / "docker.sock")
+    server = socketserver.ThreadingUnixStreamServer(socket_path, _FakeDockerHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    ns = types.SimpleNamespace
+    monkeypatch.setattr(docker_module, "_DOCKER_SOCKET", socket_path)
+    monkeypatch.setattr(docker_module, "_find_docker_binary", lambda: "/usr/bin/docker")
+    monkeypatch.setitem(docker_module._DAEMON_CACHE, "ts", 0.0)
+    monkeypatch.setattr(
+        network_module.psutil,
+        "net_if_stats",
+        lambda: {"eth0": ns(isup=True, speed=1000), "lo": ns(isup=True, speed=0), "veth1": ns(isup=False, speed=0)},
+    )
+    monkeypatch.setattr(
+        network_module, "_io_counters", lambda: {"eth0": dict.fromkeys(network_module._COUNTER_FIELDS, 7)}
+    )
+    monkeypatch.setattr(system_module.psutil, "cpu_percent", lambda interval=None: 12.5)
+    monkeypatch.setattr(
+        system_module.psutil, "virtual_memory", lambda: ns(percent=40.0, total=8 << 30, available=5 << 30)
+    )
+    monkeypatch.setattr(system_module.psutil, "swap_memory", lambda: ns(percent=1.5, total=2 << 30))
+    monkeypatch.setattr(
+        system_module.psutil, "sensors_temperatures", lambda: {"coretemp": [ns(current=48.0)]}, raising=False
+    )
+    monkeypatch.setattr(
+        system_module.SystemCollector, "_filter_and_deduplicate_partitions", staticmethod(lambda: [ns(mountpoint="/")])
+    )
+    monkeypatch.setattr(
+        system_module.SystemCollector, "_safe_disk_usage", staticmethod(lambda mountpoint: (25.0, 100 << 30, 75 << 30))
+    )
+
+    try:
+        for collector in (
+            docker_module.DockerCollector(),
+            network_module.NetworkCollector(),
+            system_module.SystemCollector(),
+        ):
+            assert collector.trusted
+            raw = list(collector._collect_metrics())
+            assert raw
+            expected = [collector._normalize_metric(metric) for metric in raw]
+            assert collector._project_trusted_metrics(raw) == expected
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_collector_metadata_strings_are_interned():
+    class _Dynamic(BaseCollector):
+        name = "".join(["dyn", "amic"])
+
+        def _collect_metrics(self):
+            return []
+
+    metric = _Dynamic()._normalize_metric({"name": "x", "value": 1, "type": "".join(["nume", "ric"])})
+    assert _Dynamic.name is sys.intern("dynamic")
+    assert metric["type"] is sys.intern("numeric")
+    assert _Dynamic()._normalize_metric({"name": "x", "value": 1, "type": ["numeric"]}) is None
+
+
+@pytest.mark.parametrize("trusted", [True, False])
+def test_collector_accepts_metric_generator(trusted):
+    class _Streaming(BaseCollector):
+        name = "streaming"
+
+        def _collect_metrics(self):
+            yield {"name": "a", "value": 1, "type": "numeric"}
+            yield {"name": "b", "value": True, "type": "boolean"}
+
+    _Streaming.trusted = trusted
+    collector = _Streaming()
+    assert collector.collect() == [collector._normalize_metric(m) for m in collector._collect_metrics()]
+
+
+def test_sshd_version_cached_until_binary_changes(tmp_path, monkeypatch):
+    sshd = tmp_path / "sshd"
+    sshd.write_text("v1")
+    calls = []
+    monkeypatch.setattr(security_module, "_SSHD_BIN", str(sshd))
+    monkeypatch.setattr(security_module, "_read_sshd_version", lambda: calls.append(1) or "OpenSSH_9.6")
+    security_module._sshd_version_cached.cache_clear()
+
+    assert security_module._get_sshd_version() == "OpenSSH_9.6"
+    assert security_module._get_sshd_version() == "OpenSSH_9.6"
+    assert len(calls) == 1
+
+    stat = sshd.stat()
+    os.utime(sshd, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    security_module._get_sshd_version()
+    assert len(calls) == 2
+    security_module._sshd_version_cached.cache_clear()
+
+
+_LIST_UNITS_OUTPUT = """\
+cron.service loaded active running Regular background program processing daemon
+getty@tty1.service loaded active running Getty on tty1
+getty@tty2.service loaded active running Getty on tty2
+● syslog.service not-found inactive dead syslog.service
+run-r0a1b2.service loaded active exited /usr/bin/true
+nginx.service loaded failed failed A high performance web server
+"""
+
+
+_EXPECTED_SERVICE_METRICS = {
+    "cron.service": True,
+    "getty_tty1.service": True,
+    "nginx.service": False,
+    "services.active_count": 2,
+    "services.failed_count": 1,
+}
+
+
+def _list_units_as_json():
+    units = []
+    for line in _LIST_UNITS_OUTPUT.splitlines():
+        unit, load, active, sub, description = line.lstrip("● ").split(None, 4)
+        units.append({"unit": unit, "load": load, "active": active, "sub": sub, "description": description})
+    return json.dumps(units)
+
+
+@pytest.mark.parametrize("output", [_LIST_UNITS_OUTPUT, _list_units_as_json()], ids=["text", "json"])
+def test_services_collector_filters_units(monkeypatch, output):
+    def fake_run(args, **kwargs):
+        return subprocess.CompletedProcess(args, 0, stdout=output, stderr="")
+
+    monkeypatch.setattr(services_module.ServicesCollector, "_list_units_dbus", staticmethod(lambda: None))
+    monkeypatch.setattr(services_module.subprocess, "run", fake_run)
+    metrics = {m["name"]: m["value"] for m in services_module.ServicesCollector().collect()}
+
+    assert metrics == _EXPECTED_SERVICE_METRICS
+
+
+def test_services_collector_prefers_dbus(monkeypatch):
+    units = []
+    for line in _LIST_UNITS_OUTPUT.splitlines():
+        unit, load, active, sub, description = line.lstrip("● ").split(None, 4)
+        units.append((unit, description, load, active, sub, "", "/unit", 0, "", "/"))
+    units.append(("ssh.socket", "", "loaded", "active", "listening", "", "/unit", 0, "", "/"))
+
+    class _Manager:
+        def ListUnits(self):
+            return units
+
+    fake_dbus = types.ModuleType("dbus")
+    fake_dbus.SystemBus = lambda: types.SimpleNamespace(get_object=lambda name, path: object())
+    fake_dbus.Interface = lambda obj, interface: _Manager()
+
+    def fail_run(args, **kwargs):
+        raise AssertionError("systemctl ne doit pas être appelé")
+
+    monkeypatch.setitem(sys.modules, "dbus", fake_dbus)
+    monkeypatch.setattr(services_module.subprocess, "run", fail_run)
+    metrics = {m["name"]: m["value"] for m in services_module.ServicesCollector().collect()}
+
+    assert metrics == _EXPECTED_SERVICE_METRICS
+
+
+@pytest.mark.parametrize(
+    "service_name",
+    [
+        "getty@tty1.service",
+        "systemd-fsck@dev-disk-by\\x2duuid.service",
+        "café:x y.service",
+        "a\u00a0b\U0001f600.service",
+    ],
+)
+def test_metric_name_table_matches_former_regex(service_name):
+    expected = re.sub(r"[^a-zA-Z0-9._-]", "_", service_name)
+    assert service_name.translate(services_module._METRIC_NAME_SAFE_TABLE) == expected
+
+
+def test_ssh_port_read_from_sshd_config(tmp_path, monkeypatch):
+    config = tmp_path / "sshd_config"
+    config.write_bytes(b"# Port 22\n\nPortx 1\nPort 70000\nport\t2222  \nPort 3333\n")
+
+    def fake_run(args, **kwargs):
+        raise FileNotFoundError(args[0])
+
+    monkeypatch.setattr(security_module.subprocess, "run", fake_run)
+    monkeypatch.setattr(security_module, "_SSHD_CONFIG", str(config))
+    assert security_module._read_ssh_port() == 2222
+
+    monkeypatch.setattr(security_module, "_SSHD_CONFIG", str(tmp_path / "absent"))
+    assert security_module._read_ssh_port(default=22) == 22
+
+
+def test_services_text_parser_without_regex():
+    rows = services_module.ServicesCollector._parse_units_text(
+        "●  a.service not-found inactive dead a.service\n"
+        "●b.service loaded active running B\n"
+        "c.service loaded\n"
+        "d.socket loaded active listening D\n"
+        "\n"
+    )
+    assert rows == [
+        ("a.service", "not-found", "inactive", "dead"),
+        ("b.service", "loaded", "active", "running"),
+    ]
+
+
+def test_cpu_usage_measured_from_fresh_collector_thread():
+    # Le loader exécute chaque collecteur dans un thread neuf : la mesure ne doit pas
+    # dépendre d'un appel précédent à cpu_percent() (sinon valeur constante 0.0)
+    stop = threading.Event()
+
+    def busy():
+        while not stop.is_set():
+            pass
+
+    spinner = threading.Thread(target=busy, daemon=True)
+    spinner.start()
+    values = []
+    try:
+        collector = threading.Thread(
+            target=lambda: values.extend(
+                m["value"] for m in system_module.SystemCollector().collect() if m["name"] == "cpu.usage_percent"
+            )
+        )
+        collector.start()
+        collector.join()
+    finally:
+        stop.set()
+        spinner.join()
+    assert len(values) == 1
+    assert values[0] > 0.0
+
+
+def test_partitions_deduplicated_by_st_dev(monkeypatch):
+    part = types.SimpleNamespace
+    partitions = [
+        part(device="/dev/sda1", mountpoint="/srv/data", fstype="ext4", opts="rw"),
+        part(device="/dev/sdb1", mountpoint="/home", fstype="btrfs", opts="rw"),
+        part(device="/dev/sda1", mountpoint="/data", fstype="ext4", opts="rw"),
+        part(device="/dev/sdb1", mountpoint="/snapshots", fstype="btrfs", opts="rw"),
+        part(device="/dev/mapper/home", mountpoint="/var/lib/home", fstype="btrfs", opts="rw"),
+        part(device="/dev/sdc1", mountpoint="/backup", fstype="xfs", opts="rw"),
+        part(device="/dev/sdd1", mountpoint="/mnt/stale", fstype="nfs", opts="rw"),
+        part(device="tmpfs", mountpoint="/tmp", fstype="tmpfs", opts="rw"),
+    ]
+    st_dev = {"/srv/data": 1, "/data": 1, "/home": 2, "/snapshots": 3, "/var/lib/home": 2, "/backup": 4}
+
+    real_stat = os.stat
+
+    def fake_stat(path, *args, **kwargs):
+        if path == "/mnt/stale":
+            raise OSError("stale file handle")
+        if path in st_dev:
+            return types.SimpleNamespace(st_dev=st_dev[path])
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(system_module.psutil, "disk_partitions", lambda all=False: partitions)
+    monkeypatch.setattr(system_module.os, "stat", fake_stat)
+    monkeypatch.setattr(system_module.SystemCollector, "_bind_mountpoints", staticmethod(frozenset))
+    system_module.SystemCollector._filter_and_deduplicate_partitions.cache_clear()
+    try:
+        result = system_module.SystemCollector._filter_and_deduplicate_partitions()
+    finally:
+        system_module.SystemCollector._filter_and_deduplicate_partitions.cache_clear()
+
+    # Doublon st_dev sous un autre nom de périphérique écarté, stat() en échec écarté,
+    # point de montage plus court retenu et placé en fin d'ordre
+    assert [p.mountpoint for p in result] == ["/home", "/data", "/snapshots", "/backup"]
+
+
+def test_collector_workers_capped_by_argument_then_env(monkeypatch):
+    monkeypatch.delenv(loader_module.MAX_WORKERS_ENV_VAR, raising=False)
+    assert loader_module._resolve_max_workers(None, 10) == 10
+    assert loader_module._resolve_max_workers(4, 10) == 4
+    assert loader_module._resolve_max_workers(0, 10) == 1
+
+    monkeypatch.setenv(loader_module.MAX_WORKERS_ENV_VAR, "3")
+    assert loader_module._resolve_max_workers(None, 10) == 3
+    assert loader_module._resolve_max_workers(50, 10) == 10
+
+    monkeypatch.setenv(loader_module.MAX_WORKERS_ENV_VAR, "beaucoup")
+    assert loader_module._resolve_max_workers(None, 10) == 10
+
+
+def test_package_manager_version_cached_until_binary_changes(monkeypatch):
+    calls = []
+    mtime = {"value": 1}
+
+    def fake_run(args, **kwargs):
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0, stdout="apt 2.6.1 (amd64)\nSupported modules:\n", stderr="")
+
+    updates_module._package_manager_version_cached.cache_clear()
+    monkeypatch.setattr(updates_module.subprocess, "run", fake_run)
+    monkeypatch.setattr(updates_module, "_mtime_ns", lambda path: mtime["value"])
+
+    assert updates_module._get_package_manager_version("apt") == "apt 2.6.1 (amd64)"
+    assert updates_module._get_package_manager_version("apt") == "apt 2.6.1 (amd64)"
+    assert len(calls) == 1
+
+    mtime["value"] = 2
+    updates_module._get_package_manager_version("apt")
+    assert len(calls) == 2
+
+
+_APT_UPGRADEABLE_OUTPUT = """Listing... Done
+libssl3/stable-security 3.0.11-1~deb12u2 amd64 [upgradable from: 3.0.11-1~deb12u1]
+curl/stable 7.88.1-10+deb12u5 amd64 [upgradable from: 7.88.1-10+deb12u4]
+openssh-server/stable-security 1:9.2p1-2+deb12u2 amd64 [upgradable from: 1:9.2p1-2+deb12u1]
+
+"""
+
+
+def test_apt_updates_counted_in_one_pass(monkeypatch):
+    def fake_lines(args):
+        assert args == ["apt", "list", "--upgradeable"]
+        return (line.strip() for line in _APT_UPGRADEABLE_OUTPUT.splitlines() if line.strip())
+
+    monkeypatch.setattr(updates_module, "iter_command_lines", fake_lines)
+    monkeypatch.setattr(updates_module, "_get_package_manager_version", lambda cmd: "apt 2.6.1")
+    metrics = []
+    updates_module.PackageUpdatesCollector()._collect_apt(metrics)
+
+    values = {m["name"]: m["value"] for m in metrics}
+    assert values == {"apt.updates_available": 3, "apt.security_updates": 2, "apt.version": "apt 2.6.1"}
+
+
+@pytest.mark.parametrize(
+    "available, expected",
+    [({"apt", "dnf"}, "apt"), ({"yum", "dnf"}, "dnf"), ({"yum"}, "yum"), (set(), None)],
+)
+def test_package_manager_detection_order(monkeypatch, available, expected):
+    updates_module._find_binary.cache_clear()
+    monkeypatch.setattr(updates_module.shutil, "which", lambda cmd: f"/bin/{cmd}" if cmd in available else None)
+    assert updates_module._detect_package_manager() == expected
+    updates_module._find_binary.cache_clear()
+
+
+def test_builtin_collector_instances_reused_across_calls():
+    first = loader_module.get_builtin_collectors()
+    second = loader_module.get_builtin_collectors()
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second))
+    assert [type(c).__name__ for c in first] == list(loader_module._BUILTIN_COLLECTOR_CLASSES)
@@ -53,3 +53,83 @@ def test_config_loader_missing_file():
         loader.load()
     except ConfigError:
         assert True
+
+
+def test_schema_validator_is_cached(tmp_path):
+    from monitoring_client.core.config_loader import _get_validator
+
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text('{"type": "object", "required": ["client"]}')
+    mtime_ns = schema_path.stat().st_mtime_ns
+
+    first = _get_validator(str(schema_path), mtime_ns)
+    assert _get_validator(str(schema_path), mtime_ns) is first
+
+
+def test_config_loader_skip_validation(tmp_path, monkeypatch):
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text('{"type": "object", "required": ["absent"]}')
+    loader = ConfigLoader(schema_path=schema_path, base_dir=tmp_path)
+
+    try:
+        loader._validate_against_schema({})
+    except ConfigError:
+        pass
+    else:
+        raise AssertionError("ConfigError attendue")
+
+    monkeypatch.setenv("MONITORING_SKIP_VALIDATION", "1")
+    loader._validate_against_schema({})
+
+
+def test_read_config_file_returns_independent_copies(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("api:\n  base_url: http://localhost\n")
+    loader = ConfigLoader(config_path=config_path, base_dir=tmp_path)
+
+    first = loader._read_config_file(config_path)
+    first["api"]["base_url"] = "http://modified"
+
+    second = loader._read_config_file(config_path)
+    assert second["api"]["base_url"] == "http://localhost"
+
+
+def test_read_config_file_json_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("MONITORING_CONFIG_JSON_CACHE", "1")
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("client:\n  name: cached\n")
+    loader = ConfigLoader(config_path=config_path, base_dir=tmp_path)
+
+    assert loader._read_config_file(config_path)["client"]["name"] == "cached"
+
+    cache_path = tmp_path / "config.yaml.cache.json"
+    assert cache_path.is_file()
+    assert "cached" in cache_path.read_text()
+
+
+def test_apply_env_overrides_converts_types(monkeypatch):
+    monkeypatch.setenv("MONITORING_API_TIMEOUT", "2.5")
+    monkeypatch.setenv("MONITORING_API_MAX_RETRIES", "not-an-int")
+    monkeypatch.setenv("MONITORING_DATA_DIR", "/tmp/data")
+
+    config = ConfigLoader()._apply_env_overrides({"api": {"max_retries": 3}, "paths": {}})
+
+    assert config["api"]["timeout_seconds"] == 2.5
+    assert config["api"]["max_retries"] == 3
+    assert config["paths"]["data_dir"] == "/tmp/data"
+
+
+def test_skip_validation_does_not_read_schema(tmp_path, monkeypatch):
+    monkeypatch.setenv("MONITORING_SKIP_VALIDATION", "1")
+    loader = ConfigLoader(schema_path=tmp_path / "absent.schema.json", base_dir=tmp_path)
+    loader._validate_against_schema({})
+
+
+def test_json_cache_ignored_when_size_differs(tmp_path):
+    from monitoring_client.core.config_loader import _read_json_cache, _write_json_cache
+
+    cache_path = str(tmp_path / "config.yaml.cache.json")
+    _write_json_cache(cache_path, 123, 10, {"client": {}})
+
+    assert _read_json_cache(cache_path, 123, 10) == {"client": {}}
+    assert _read_json_cache(cache_path, 123, 11) is None
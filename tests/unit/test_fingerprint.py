@@ -6,3 +6,37 @@ def test_fingerprint_deterministic(tmp_path):
     fp2 = generate_fingerprint(cache_path=tmp_path / "fp")
     assert fp1 == fp2
     assert len(fp1) == 64  # SHA256 hex
+
+
+def test_fingerprint_components_memoized_copy():
+    from monitoring_client.core.fingerprint import collect_fingerprint_components
+
+    first = collect_fingerprint_components()
+    first["hostname"] = "modified"
+    assert collect_fingerprint_components()["hostname"] != "modified"
+
+
+def test_fingerprint_force_recompute(tmp_path):
+    fp1 = generate_fingerprint(cache_path=tmp_path / "fp")
+    fp2 = generate_fingerprint(cache_path=tmp_path / "fp", force_recompute=True)
+    assert fp1 == fp2
+
+
+def test_normalize_mac():
+    from monitoring_client.core.fingerprint import _normalize_mac
+
+    assert _normalize_mac("4c:1f:cc:aa:bb:cc\n") == "4C:1F:CC:AA:BB:CC"
+    assert _normalize_mac("4c1fccaabbcc") == "4C:1F:CC:AA:BB:CC"
+    assert _normalize_mac("00:00:00:00:00:00") is None
+    assert _normalize_mac("zz:1f:cc:aa:bb:cc") is None
+    assert _normalize_mac("") is None
+
+
+def test_hash_components_stable_format():
+    import hashlib
+
+    from monitoring_client.core.fingerprint import _hash_components
+
+    components = {"hostname": "h", "macs": "AA:BB:CC:DD:EE:FF", "cpu_id": "c", "dmidecode_uuid": "u"}
+    source = "hostname=h|macs=AA:BB:CC:DD:EE:FF|cpu_id=c|dmidecode_uuid=u|salt=s"
+    assert _hash_components(components, salt="s") == hashlib.sha256(source.encode()).hexdigest()
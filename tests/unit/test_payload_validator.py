@@ -1,4 +1,6 @@
-from monitoring_client.pipeline.validator import PayloadValidator
+import pytest
+
+from monitoring_client.pipeline.validator import PayloadValidator, ValidationError
 
 
 def test_validator_ok():
@@ -23,3 +25,58 @@ def test_validator_bad_name():
     valid, errors = v.validate_payload(payload)
     assert not valid
     assert len(errors) == 1
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("disk[/var/lib].free_gb", True),
+        ("getty_tty1.service", True),
+        ("cpu.load\n", False),
+        ("café", False),
+        ("", False),
+        (3, False),
+    ],
+)
+def test_validate_metric_name(name, expected):
+    assert PayloadValidator().validate_metric_name(name) is expected
+
+
+@pytest.mark.parametrize(
+    "metric",
+    [
+        {"name": "cpu.load", "value": True, "type": "numeric"},
+        {"name": "cpu.load", "value": 1, "type": "gauge"},
+        {"name": "cpu.load", "type": "numeric"},
+        {"name": 42, "value": 1, "type": "numeric"},
+        "cpu.load",
+    ],
+)
+def test_validator_fast_path_falls_back_to_detailed_errors(metric):
+    v = PayloadValidator()
+    ok = {"name": "sys.flag", "value": True, "type": "boolean"}
+    valid, errors = v.validate_payload({"metadata": {}, "machine": {}, "metrics": [ok, metric]})
+    assert not valid
+    assert len(errors) == 1
+    assert errors[0]["path"].startswith("$.metrics[1]")
+
+
+def test_validator_accepts_non_canonical_type():
+    payload = {"metadata": {}, "machine": {}, "metrics": [{"name": "cpu.load", "value": 1, "type": " Numeric "}]}
+    assert PayloadValidator().validate_payload(payload) == (True, [])
+
+
+@pytest.mark.parametrize(
+    "names",
+    [["cpu.load", "disk[/].free_gb"], ["cpu.load", "bad name"], ["a\x00b"], ["a", "", 3], []],
+)
+def test_validate_names_batch_matches_per_name(names):
+    v = PayloadValidator()
+    assert v.validate_names_batch(names) == [v.validate_metric_name(n) for n in names]
+
+
+def test_validation_error_is_a_lightweight_record():
+    err = ValidationError(path="$.metrics[0].name", message="invalide")
+    path, message = err
+    assert (path, message) == ("$.metrics[0].name", "invalide")
+    assert err.to_dict() == dict(err._asdict()) == {"path": path, "message": message}
@@ -8,3 +8,13 @@ def test_transformer_basic():
     )
     assert payload["metadata"]["generator"] == "monitoring-client"
     assert payload["machine"]["hostname"] == "test"
+
+
+def test_transformer_metadata_template_is_not_shared():
+    t = PayloadTransformer(PayloadTransformerConfig(timestamp_field="collection_time"))
+    first = t.build_payload([], "h", "linux", "abc", "2025-01-01T00:00:00Z")["metadata"]
+    second = t.build_payload([], "h", "linux", "abc", "2025-01-01T00:01:00Z")["metadata"]
+    assert first["collection_time"] == "2025-01-01T00:00:00Z"
+    assert second["collection_time"] == "2025-01-01T00:01:00Z"
+    assert first is not second
+    assert "timestamp" not in first
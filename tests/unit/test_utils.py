@@ -0,0 +1,33 @@
+import sys
+from unittest.mock import patch
+
+from monitoring_client.core.utils import iter_command_lines, ttl_cached
+
+
+def test_ttl_cached_reuses_value_until_expiry():
+    calls = []
+
+    @ttl_cached(10)
+    def compute(x):
+        calls.append(x)
+        return x * 2
+
+    with patch("monitoring_client.core.utils.time.monotonic", return_value=100.0):
+        assert compute(2) == 4
+        assert compute(2) == 4
+    assert calls == [2]
+
+    # Après expiration du TTL, la fonction est réévaluée
+    with patch("monitoring_client.core.utils.time.monotonic", return_value=111.0):
+        assert compute(2) == 4
+    assert calls == [2, 2]
+
+    compute.cache_clear()
+    with patch("monitoring_client.core.utils.time.monotonic", return_value=111.0):
+        compute(2)
+    assert calls == [2, 2, 2]
+
+
+def test_iter_command_lines_streams_stripped_non_empty_lines():
+    script = "print('  a/1  '); print(); print('b'); import sys; sys.stderr.write('ignored')"
+    assert list(iter_command_lines([sys.executable, "-c", script])) == ["a/1", "b"]
@@ -1,5 +1,8 @@
 from pathlib import Path
 
+import pytest
+
+from monitoring_client.vendors import executor as executor_module
 from monitoring_client.vendors.executor import CommandExecutor
 from monitoring_client.vendors.parser import VendorMetric
 
@@ -29,3 +32,119 @@ def test_executor_basic():
 
     # La valeur doit être bien parsée en int/float, pas en string
     assert value == 42 or value == 42.0
+
+
+def test_language_detection_cached_per_path(tmp_path, monkeypatch):
+    """La détection des binaires n'est refaite que si PATH change."""
+    calls = []
+
+    def fake_which(cmd, path=None):
+        calls.append(cmd)
+        return f"{path}/{cmd}" if cmd == "bash" else None
+
+    executor_module._detect_language_binaries.cache_clear()
+    monkeypatch.setattr(executor_module.shutil, "which", fake_which)
+    monkeypatch.setenv("PATH", str(tmp_path))
+    try:
+        first = CommandExecutor()
+        probes = len(calls)
+        second = CommandExecutor()
+        assert len(calls) == probes
+        assert first._language_binaries == second._language_binaries
+        assert second._language_binaries["bash"] == f"{tmp_path}/bash"
+
+        monkeypatch.setenv("PATH", str(tmp_path / "bin"))
+        CommandExecutor()
+        assert len(calls) == 2 * probes
+    finally:
+        executor_module._detect_language_binaries.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "lang, command, expected",
+    [
+        ("python", "print(1)", ["/bin/python", "-c", "print(1)"]),
+        ("node", "1", ["/bin/node", "-e", "1"]),
+        ("powershell", "1", ["/bin/powershell", "-Command", "1"]),
+        ("batch", "dir", ["/bin/batch", "/c", "dir"]),
+        ("java", " app.jar ", ["/bin/java", "-jar", "app.jar"]),
+    ],
+)
+def test_build_process_args(lang, command, expected):
+    executor = CommandExecutor()
+    executor._language_binaries = {name: f"/bin/{name}" for name in executor_module._LANGUAGE_CANDIDATES}
+    assert executor._build_process_args(lang, command) == expected
+
+
+@pytest.mark.parametrize("expected_type", ["numeric", " Numeric ", "NUMERIC"])
+def test_parse_output_accepts_canonical_and_raw_types(expected_type):
+    assert CommandExecutor._parse_output("42", expected_type) == 42
+
+
+@pytest.mark.parametrize(
+    "stdout, expected",
+    [
+        ("42", 42),
+        ("-3", -3),
+        ("1.5", 1.5),
+        ("-.5", -0.5),
+        ("1e3", 1000.0),
+        ("1_000", 1000),
+        ("N/A", None),
+        ("12abc", None),
+    ],
+)
+def test_parse_output_numeric(stdout, expected):
+    parsed = CommandExecutor._parse_output(stdout, "numeric")
+    assert parsed == expected
+    assert type(parsed) is type(expected)
+
+
+@pytest.mark.parametrize("stdout, expected", [("yes", True), ("ON", True), ("n", False), ("0", False), ("maybe", None)])
+def test_parse_output_boolean(stdout, expected):
+    assert CommandExecutor._parse_output(stdout, "boolean") is expected
+
+
+def test_execute_discards_stderr_when_warnings_are_filtered(monkeypatch):
+    seen = []
+
+    def fake_run(args, **kwargs):
+        seen.append(kwargs["stderr"])
+        return executor_module.subprocess.CompletedProcess(args, 0, stdout="1\n", stderr=None)
+
+    monkeypatch.setattr(executor_module.subprocess, "run", fake_run)
+    exec = CommandExecutor()
+    exec._language_binaries["bash"] = "/bin/bash"
+
+    assert exec.execute("echo 1", "bash", timeout=1, expected_type="numeric") == 1
+    monkeypatch.setattr(executor_module.logger, "disabled", True)
+    assert exec.execute("echo 1", "bash", timeout=1, expected_type="numeric") == 1
+    assert seen == [executor_module.subprocess.PIPE, executor_module.subprocess.DEVNULL]
+
+
+def test_execute_many_preserves_order():
+    exec = CommandExecutor()
+    metrics = [
+        VendorMetric(
+            vendor="acme",
+            group_name="test",
+            name=f"test.metric_{i}",
+            command=f"sleep 0.0{3 - i}; echo {i}",
+            language="bash",
+            type="numeric",
+            description="Test",
+            is_critical=False,
+            source_file=Path("dummy.yaml"),
+            raw_metric={},
+        )
+        for i in range(3)
+    ]
+    assert exec.execute_many(metrics, timeout=2.0) == [0, 1, 2]
+    assert exec.execute_many([], timeout=2.0) == []
+
+
+@pytest.mark.parametrize("lang, expected", [("bash", True), (" Bash ", True), ("ruby", False), ("cobol", False)])
+def test_check_language_available(lang, expected):
+    executor = CommandExecutor()
+    executor._language_binaries = {"bash": "/bin/bash", "ruby": None}
+    assert executor.check_language_available(lang) is expected
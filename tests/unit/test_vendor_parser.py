@@ -1,8 +1,26 @@
+import sys
 from pathlib import Path
 
+import pytest
+
+from monitoring_client.vendors import validator as validator_module
 from monitoring_client.vendors.parser import VendorMetric, VendorParser
 
 
+def _vendor_yaml(vendor="acme", names=("acme.x",), description="x", language=None):
+    """Contenu YAML d'un fichier vendor valide (une métrique numérique par nom)."""
+    header = f"metadata:\n  vendor: {vendor}\n" + (f"  language: {language}\n" if language else "")
+    return (
+        header
+        + "metrics:\n"
+        + "".join(
+            f"  - name: {name}\n    command: echo 1\n    type: numeric\n    group_name: {vendor}\n"
+            f"    description: {description}\n    is_critical: false\n"
+            for name in names
+        )
+    )
+
+
 def test_parse_valid_vendor(tmp_path):
     """
     Cas nominal : un fichier vendor valide doit produire exactement 1 VendorMetric
@@ -74,3 +92,143 @@ metrics:
 
     # Optionnel : vérifier qu'un warning a été loggé
     assert any("Fichier vendor ignoré" in msg for msg in caplog.text.splitlines())
+
+
+@pytest.mark.parametrize("backend", ["fastjsonschema", "jsonschema"])
+def test_vendor_schema_validator_backends(monkeypatch, backend):
+    """Le validateur compilé (ou son repli jsonschema) accepte / rejette les mêmes documents."""
+    if backend == "jsonschema":
+        monkeypatch.setitem(sys.modules, "fastjsonschema", None)
+    else:
+        pytest.importorskip("fastjsonschema")
+    validator_module._get_vendor_validator.cache_clear()
+
+    metric = {
+        "name": "nginx.requests",
+        "command": "echo 1",
+        "type": "numeric",
+        "group_name": "nginx",
+        "description": "d",
+        "is_critical": False,
+    }
+    try:
+        doc = validator_module.validate_vendor_document(
+            {"metadata": {"vendor": "acme", "language": "nodejs"}, "metrics": [dict(metric)]}, "ok.yaml"
+        )
+        assert doc.data["metadata"]["language"] == "node"
+
+        with pytest.raises(validator_module.VendorSchemaError, match="bad.yaml"):
+            validator_module.validate_vendor_document(
+                {"metadata": {"vendor": "acme"}, "metrics": [dict(metric, name="nom invalide")]}, "bad.yaml"
+            )
+    finally:
+        validator_module._get_vendor_validator.cache_clear()
+
+
+def test_vendor_yaml_loader_refuses_python_tags(tmp_path):
+    (tmp_path / "evil.yaml").write_text('metadata: !!python/object/apply:os.getcwd []\nmetrics: []\n')
+    assert VendorParser(tmp_path).parse_all() == []
+
+
+def test_vendor_yaml_read_as_utf8_bytes(tmp_path):
+    (tmp_path / "acme.yaml").write_bytes(_vendor_yaml(description="Température").encode("utf-8"))
+    (tmp_path / "broken.yaml").write_bytes(b"metadata: [\n")
+    res = VendorParser(tmp_path).parse_all()
+    assert [m.description for m in res] == ["Température"]
+
+
+def test_discover_vendor_files_sorted_and_filtered(tmp_path):
+    for name in ("b.yml", "a.yaml", "c.yaml.disabled", "notes.txt"):
+        (tmp_path / name).write_text("")
+    (tmp_path / "dir.yaml").mkdir()
+    (tmp_path / "link.yaml").symlink_to(tmp_path / "a.yaml")
+    files = VendorParser(tmp_path)._discover_vendor_files()
+    assert [f.name for f in files] == ["a.yaml", "b.yml", "link.yaml"]
+    assert all(isinstance(f, Path) for f in files)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="slots=True requiert Python 3.10")
+def test_vendor_metric_has_no_instance_dict():
+    assert not hasattr(VendorMetric("v", "g", "n", "c", "bash", "numeric", "", False, Path("x"), {}), "__dict__")
+
+
+def test_parse_all_reuses_unchanged_files(tmp_path, monkeypatch):
+    vendor_file = tmp_path / "acme.yaml"
+    vendor_file.write_text(_vendor_yaml())
+    parser = VendorParser(tmp_path)
+    loads = []
+    original = parser._load_yaml
+    monkeypatch.setattr(parser, "_load_yaml", lambda path: loads.append(path) or original(path))
+
+    first = parser.parse_all()
+    assert parser.parse_all() == first
+    assert len(loads) == 1
+
+    vendor_file.write_text(vendor_file.read_text().replace("acme.x", "acme.renamed"))
+    assert [m.name for m in parser.parse_all()] == ["acme.renamed"]
+    assert len(loads) == 2
+
+
+def test_raw_metric_kept_only_at_debug_level(tmp_path, caplog):
+    (tmp_path / "acme.yaml").write_text(_vendor_yaml())
+    caplog.set_level("INFO", logger="monitoring_client.vendors.parser")
+    assert VendorParser(tmp_path).parse_all()[0].raw_metric is None
+
+    caplog.set_level("DEBUG", logger="monitoring_client.vendors.parser")
+    assert VendorParser(tmp_path).parse_all()[0].raw_metric["name"] == "acme.x"
+
+
+def test_iter_all_yields_file_by_file(tmp_path, monkeypatch):
+    for vendor in ("a", "b"):
+        (tmp_path / f"{vendor}.yaml").write_text(_vendor_yaml(vendor, names=(f"{vendor}.x",)))
+    parser = VendorParser(tmp_path)
+    loaded = []
+    original = parser._load_yaml
+    monkeypatch.setattr(parser, "_load_yaml", lambda path: loaded.append(path.name) or original(path))
+
+    it = parser.iter_all()
+    assert next(it).vendor == "a"
+    assert loaded == ["a.yaml"]
+    assert [m.vendor for m in it] == ["b"]
+
+
+def test_low_cardinality_fields_are_shared(tmp_path):
+    (tmp_path / "acme.yaml").write_text(_vendor_yaml(names=("acme.m0", "acme.m1", "acme.m2"), language="bash"))
+    first, *others = VendorParser(tmp_path).parse_all()
+    for m in others:
+        assert m.group_name is first.group_name
+        assert m.type is first.type
+        assert m.language is first.language
+
+
+@pytest.mark.parametrize("content", [b"metadata: [\n", b"a: \xff\xfe\n"])
+def test_load_yaml_wraps_parse_errors(tmp_path, content):
+    path = tmp_path / "broken.yaml"
+    path.write_bytes(content)
+    with pytest.raises(validator_module.VendorSchemaError, match="YAML invalide"):
+        VendorParser(tmp_path)._load_yaml(path)
+    with pytest.raises(validator_module.VendorSchemaError, match="Impossible de lire"):
+        VendorParser(tmp_path)._load_yaml(tmp_path / "missing.yaml")
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        '{"metadata": {"vendor": "acme"}, "metrics": [{"name": "acme.x", "command": "echo 1", "type": "numeric",'
+        ' "group_name": "g", "description": "é", "is_critical": false}]}',
+        "{metadata: {vendor: acme}, metrics: [{name: acme.x, command: echo 1, type: numeric,"
+        " group_name: g, description: é, is_critical: false}]}",
+    ],
+)
+def test_json_shaped_vendor_file(tmp_path, content):
+    (tmp_path / "generated.yaml").write_text("\n  " + content, encoding="utf-8")
+    res = VendorParser(tmp_path).parse_all()
+    assert [(m.name, m.description, m.is_critical) for m in res] == [("acme.x", "é", False)]
+
+
+def test_oversized_vendor_file_is_skipped_before_parsing(tmp_path, caplog, monkeypatch):
+    (tmp_path / "huge.yaml").write_text("metadata: {}\n" + "#" * 200)
+    parser = VendorParser(tmp_path, max_file_bytes=100)
+    monkeypatch.setattr(parser, "_load_yaml", lambda path: pytest.fail("fichier parsé"))
+    assert parser.parse_all() == []
+    assert "trop volumineux" in caplog.text